@@ -10,6 +10,7 @@ from .prompt.anthropic_prompt_driver import AnthropicPromptDriver
 from .prompt.amazon_sagemaker_prompt_driver import AmazonSageMakerPromptDriver
 from .prompt.amazon_bedrock_prompt_driver import AmazonBedrockPromptDriver
 from .prompt.base_multi_model_prompt_driver import BaseMultiModelPromptDriver
+from .prompt.composite_prompt_driver import CompositePromptDriver
 
 from .memory.conversation.base_conversation_memory_driver import BaseConversationMemoryDriver
 from .memory.conversation.local_conversation_memory_driver import LocalConversationMemoryDriver
@@ -44,6 +45,23 @@ from .prompt_model.bedrock_titan_prompt_model_driver import BedrockTitanPromptMo
 from .prompt_model.bedrock_claude_prompt_model_driver import BedrockClaudePromptModelDriver
 from .prompt_model.bedrock_jurassic_prompt_model_driver import BedrockJurassicPromptModelDriver
 
+from .checkpoint.base_checkpoint_driver import BaseCheckpointDriver
+from .checkpoint.local_checkpoint_driver import LocalCheckpointDriver
+from .checkpoint.sqlite_checkpoint_driver import SqliteCheckpointDriver
+from .checkpoint.dynamodb_checkpoint_driver import DynamoDbCheckpointDriver
+
+from .task_cache.base_task_cache_driver import BaseTaskCacheDriver
+from .task_cache.local_task_cache_driver import LocalTaskCacheDriver
+
+from .task_execution.base_task_execution_driver import BaseTaskExecutionDriver
+from .task_execution.local_task_execution_driver import LocalTaskExecutionDriver
+from .task_execution.base_remote_task_execution_driver import BaseRemoteTaskExecutionDriver
+from .task_execution.process_pool_task_execution_driver import ProcessPoolTaskExecutionDriver
+
+from .sandbox.base_sandbox_driver import BaseSandboxDriver
+from .sandbox.local_sandbox_driver import LocalSandboxDriver
+from .sandbox.docker_sandbox_driver import DockerSandboxDriver
+
 
 __all__ = [
     "BasePromptDriver",
@@ -58,6 +76,7 @@ __all__ = [
     "AmazonSageMakerPromptDriver",
     "AmazonBedrockPromptDriver",
     "BaseMultiModelPromptDriver",
+    "CompositePromptDriver",
 
     "BaseConversationMemoryDriver",
     "LocalConversationMemoryDriver",
@@ -92,4 +111,21 @@ __all__ = [
     "BedrockTitanPromptModelDriver",
     "BedrockClaudePromptModelDriver",
     "BedrockJurassicPromptModelDriver",
+
+    "BaseCheckpointDriver",
+    "LocalCheckpointDriver",
+    "SqliteCheckpointDriver",
+    "DynamoDbCheckpointDriver",
+
+    "BaseTaskCacheDriver",
+    "LocalTaskCacheDriver",
+
+    "BaseTaskExecutionDriver",
+    "LocalTaskExecutionDriver",
+    "BaseRemoteTaskExecutionDriver",
+    "ProcessPoolTaskExecutionDriver",
+
+    "BaseSandboxDriver",
+    "LocalSandboxDriver",
+    "DockerSandboxDriver",
 ]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+from attr import define
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+
+
+@define
+class BaseCheckpointDriver(ABC):
+    @abstractmethod
+    def store(self, checkpoint_id: str, task_id: str, output: BaseArtifact) -> None:
+        ...
+
+    @abstractmethod
+    def load(self, checkpoint_id: str) -> dict[str, BaseArtifact]:
+        """Loads the task outputs stored in a checkpoint.
+
+        Args:
+            checkpoint_id: Checkpoint ID.
+
+        Returns:
+            Task outputs by task ID. Empty if the checkpoint doesn't exist.
+        """
+        ...
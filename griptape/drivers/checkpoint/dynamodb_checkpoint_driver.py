@@ -0,0 +1,63 @@
+from __future__ import annotations
+import boto3
+from boto3.dynamodb.conditions import Key
+from attr import define, field, Factory
+from griptape.artifacts import BaseArtifact
+from griptape.drivers import BaseCheckpointDriver
+
+
+@define
+class DynamoDbCheckpointDriver(BaseCheckpointDriver):
+    """Stores checkpoints in a DynamoDB table with one item per task output.
+
+    Attributes:
+        session: Boto3 session.
+        table_name: Name of the table. It has to have a string partition key and a string sort key.
+        partition_key: Name of the partition key attribute, which holds checkpoint IDs.
+        sort_key: Name of the sort key attribute, which holds task IDs.
+        value_attribute_key: Name of the attribute task outputs are stored in.
+    """
+
+    session: boto3.Session = field(default=Factory(lambda: boto3.Session()), kw_only=True)
+    table_name: str = field(kw_only=True)
+    partition_key: str = field(kw_only=True)
+    sort_key: str = field(kw_only=True)
+    value_attribute_key: str = field(kw_only=True)
+
+    table: any = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        dynamodb = self.session.resource(
+            "dynamodb",
+        )
+
+        self.table = dynamodb.Table(self.table_name)
+
+    def store(self, checkpoint_id: str, task_id: str, output: BaseArtifact) -> None:
+        self.table.put_item(
+            Item={
+                self.partition_key: checkpoint_id,
+                self.sort_key: task_id,
+                self.value_attribute_key: output.to_json()
+            }
+        )
+
+    def load(self, checkpoint_id: str) -> dict[str, BaseArtifact]:
+        query_params = {
+            "KeyConditionExpression": Key(self.partition_key).eq(checkpoint_id)
+        }
+        items = []
+
+        while True:
+            response = self.table.query(**query_params)
+
+            items.extend(response["Items"])
+
+            if "LastEvaluatedKey" in response:
+                query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            else:
+                break
+
+        return {
+            item[self.sort_key]: BaseArtifact.from_json(item[self.value_attribute_key]) for item in items
+        }
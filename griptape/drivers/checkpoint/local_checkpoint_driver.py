@@ -0,0 +1,39 @@
+from __future__ import annotations
+import json
+import os
+import threading
+from attr import define, field
+from griptape.artifacts import BaseArtifact
+from griptape.drivers import BaseCheckpointDriver
+
+
+@define
+class LocalCheckpointDriver(BaseCheckpointDriver):
+    """Stores checkpoints as JSON Lines files, one per checkpoint, so that storing a task output is a single append.
+
+    Attributes:
+        dir_path: Directory checkpoint files are stored in.
+    """
+
+    dir_path: str = field(default="griptape_checkpoints", kw_only=True)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def store(self, checkpoint_id: str, task_id: str, output: BaseArtifact) -> None:
+        os.makedirs(self.dir_path, exist_ok=True)
+
+        with self._lock, open(self.__file_path(checkpoint_id), "a") as file:
+            file.write(json.dumps({"task_id": task_id, "output": output.to_dict()}) + "\n")
+
+    def load(self, checkpoint_id: str) -> dict[str, BaseArtifact]:
+        file_path = self.__file_path(checkpoint_id)
+
+        if not os.path.exists(file_path):
+            return {}
+
+        with open(file_path, "r") as file:
+            entries = [json.loads(line) for line in file if line.strip()]
+
+        return {entry["task_id"]: BaseArtifact.from_dict(entry["output"]) for entry in entries}
+
+    def __file_path(self, checkpoint_id: str) -> str:
+        return os.path.join(self.dir_path, f"{checkpoint_id}.jsonl")
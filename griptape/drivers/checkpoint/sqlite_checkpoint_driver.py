@@ -0,0 +1,46 @@
+from __future__ import annotations
+import sqlite3
+from contextlib import closing
+from attr import define, field
+from griptape.artifacts import BaseArtifact
+from griptape.drivers import BaseCheckpointDriver
+
+
+@define
+class SqliteCheckpointDriver(BaseCheckpointDriver):
+    """Stores checkpoints in a SQLite database.
+
+    Each call opens its own connection, so the driver can be used from multiple threads. For the same reason,
+    `database` has to be a file rather than `:memory:`.
+
+    Attributes:
+        database: Path of the database file.
+        table_name: Name of the table checkpoints are stored in. Created if it doesn't exist.
+    """
+
+    database: str = field(default="griptape_checkpoints.db", kw_only=True)
+    table_name: str = field(default="checkpoints", kw_only=True)
+
+    def __attrs_post_init__(self) -> None:
+        with closing(sqlite3.connect(self.database)) as connection, connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                f"(checkpoint_id TEXT NOT NULL, task_id TEXT NOT NULL, output TEXT NOT NULL, "
+                f"PRIMARY KEY (checkpoint_id, task_id))"
+            )
+
+    def store(self, checkpoint_id: str, task_id: str, output: BaseArtifact) -> None:
+        with closing(sqlite3.connect(self.database)) as connection, connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (checkpoint_id, task_id, output) VALUES (?, ?, ?)",
+                (checkpoint_id, task_id, output.to_json())
+            )
+
+    def load(self, checkpoint_id: str) -> dict[str, BaseArtifact]:
+        with closing(sqlite3.connect(self.database)) as connection:
+            rows = connection.execute(
+                f"SELECT task_id, output FROM {self.table_name} WHERE checkpoint_id = ?",
+                (checkpoint_id,)
+            ).fetchall()
+
+        return {task_id: BaseArtifact.from_json(output) for task_id, output in rows}
@@ -21,6 +21,7 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         organization: OpenAI organization.
         tokenizer: Custom `OpenAiTokenizer`.
         user: OpenAI user. 	
+        request_timeout: Timeout in seconds for each API request.
     """
     DEFAULT_MODEL = "text-embedding-ada-002"
     DEFAULT_DIMENSIONS = 1536
@@ -36,13 +37,7 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
         kw_only=True
     )
-
-    def __attrs_post_init__(self) -> None:
-        openai.api_type = self.api_type
-        openai.api_version = self.api_version
-        openai.api_base = self.api_base
-        openai.api_key = self.api_key
-        openai.organization = self.organization
+    request_timeout: float = field(default=600, kw_only=True)
 
     def try_embed_string(self, string: str) -> list[float]:
         # Address a performance issue in older ada models
@@ -84,5 +79,6 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
             "organization": self.organization,
             "api_version": self.api_version,
             "api_base": self.api_base,
-            "api_type": self.api_type
+            "api_type": self.api_type,
+            "request_timeout": self.request_timeout
         }
@@ -3,7 +3,9 @@ import json
 from typing import TYPE_CHECKING, Any
 import boto3
 from attr import define, field, Factory
+from botocore.config import Config
 from griptape.artifacts import TextArtifact
+from griptape.events import CompletionChunkEvent
 from .base_multi_model_prompt_driver import BaseMultiModelPromptDriver
 
 if TYPE_CHECKING:
@@ -12,14 +14,30 @@ if TYPE_CHECKING:
 
 @define
 class AmazonBedrockPromptDriver(BaseMultiModelPromptDriver):
+    """
+    Attributes:
+        session: Custom `boto3.Session`.
+        max_pool_connections: Maximum number of pooled connections of the default Bedrock client.
+        bedrock_client: Custom Bedrock client. Clients are thread-safe, so the same client is reused by all runs.
+        stream: Stream the model response. Each chunk is published as a `CompletionChunkEvent` as it arrives.
+    """
     session: boto3.Session = field(default=Factory(lambda: boto3.Session()), kw_only=True)
+    max_pool_connections: int = field(default=50, kw_only=True)
     bedrock_client: Any = field(
         default=Factory(
-            lambda self: self.session.client("bedrock"),
+            lambda self: self.session.client(
+                "bedrock",
+                config=Config(max_pool_connections=self.max_pool_connections, tcp_keepalive=True)
+            ),
             takes_self=True,
         ),
         kw_only=True,
     )
+    stream: bool = field(default=False, kw_only=True)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.stream
 
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
         model_input = self.prompt_model_driver.prompt_stack_to_model_input(prompt_stack)
@@ -29,6 +47,9 @@ class AmazonBedrockPromptDriver(BaseMultiModelPromptDriver):
         if isinstance(model_input, dict):
             payload.update(model_input)
 
+        if self.stream:
+            return self._run_with_response_stream(payload)
+
         response = self.bedrock_client.invoke_model(
             modelId=self.model,
             contentType='application/json',
@@ -42,3 +63,29 @@ class AmazonBedrockPromptDriver(BaseMultiModelPromptDriver):
             return self.prompt_model_driver.process_output(response_body)
         else:
             raise Exception("model response is empty")
+
+    def _run_with_response_stream(self, payload: dict) -> TextArtifact:
+        response = self.bedrock_client.invoke_model_with_response_stream(
+            modelId=self.model,
+            contentType='application/json',
+            accept='application/json',
+            body=json.dumps(payload),
+        )
+
+        tokens = []
+
+        for event in response["body"]:
+            chunk = event.get("chunk")
+
+            if chunk:
+                token = self.prompt_model_driver.process_output_chunk(chunk["bytes"]).value
+
+                tokens.append(token)
+
+                if self.structure:
+                    self.structure.publish_event(CompletionChunkEvent(token=token))
+
+        if tokens:
+            return TextArtifact("".join(tokens))
+        else:
+            raise Exception("model response is empty")
@@ -3,6 +3,7 @@ import json
 from typing import TYPE_CHECKING
 import boto3
 from attr import define, field, Factory
+from botocore.config import Config
 from griptape.artifacts import TextArtifact
 from .base_multi_model_prompt_driver import BaseMultiModelPromptDriver
 
@@ -12,10 +13,22 @@ if TYPE_CHECKING:
 
 @define
 class AmazonSageMakerPromptDriver(BaseMultiModelPromptDriver):
+    """
+    Attributes:
+        session: Custom `boto3.Session`.
+        max_pool_connections: Maximum number of pooled connections of the default SageMaker Runtime client.
+        sagemaker_client: Custom SageMaker Runtime client. Clients are thread-safe, so the same client is reused by
+            all runs.
+        custom_attributes: Custom attributes passed to the endpoint.
+    """
     session: boto3.Session = field(default=Factory(lambda: boto3.Session()), kw_only=True)
+    max_pool_connections: int = field(default=50, kw_only=True)
     sagemaker_client: boto3.client = field(
         default=Factory(
-            lambda self: self.session.client("sagemaker-runtime"),
+            lambda self: self.session.client(
+                "sagemaker-runtime",
+                config=Config(max_pool_connections=self.max_pool_connections, tcp_keepalive=True)
+            ),
             takes_self=True,
         ),
         kw_only=True,
@@ -25,11 +38,27 @@ class AmazonSageMakerPromptDriver(BaseMultiModelPromptDriver):
         kw_only=True
     )
 
+    @property
+    def supports_batching(self) -> bool:
+        return self.prompt_model_driver.supports_batching
+
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
         payload = {
             "inputs": self.prompt_model_driver.prompt_stack_to_model_input(prompt_stack),
             "parameters": self.prompt_model_driver.prompt_stack_to_model_params(prompt_stack)
         }
+
+        return self.prompt_model_driver.process_output(self._invoke_endpoint(payload))
+
+    def try_run_many(self, prompt_stacks: list[PromptStack]) -> list[TextArtifact]:
+        payload = {
+            "inputs": self.prompt_model_driver.prompt_stacks_to_model_input(prompt_stacks),
+            "parameters": self.prompt_model_driver.prompt_stacks_to_model_params(prompt_stacks)
+        }
+
+        return self.prompt_model_driver.process_outputs(self._invoke_endpoint(payload))
+
+    def _invoke_endpoint(self, payload: dict) -> list[dict]:
         response = self.sagemaker_client.invoke_endpoint(
             EndpointName=self.model,
             ContentType="application/json",
@@ -40,6 +69,6 @@ class AmazonSageMakerPromptDriver(BaseMultiModelPromptDriver):
         decoded_body = json.loads(response["Body"].read().decode("utf8"))
 
         if decoded_body:
-            return self.prompt_model_driver.process_output(decoded_body)
+            return decoded_body
         else:
             raise Exception("model response is empty")
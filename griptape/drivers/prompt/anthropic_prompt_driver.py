@@ -1,4 +1,5 @@
 import anthropic
+import httpx
 from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.utils import PromptStack
@@ -13,6 +14,9 @@ class AnthropicPromptDriver(BasePromptDriver):
         api_key: Anthropic API key.
         model: Anthropic model name. Defaults to `claude-2`.
         tokenizer: Custom `AnthropicTokenizer`.
+        request_timeout: Timeout in seconds for each API request.
+        max_connections: Maximum number of pooled HTTP connections, shared by all threads using this driver.
+        client: Custom `anthropic.Anthropic`. Its connections are kept alive and reused between runs.
     """
     api_key: str = field(kw_only=True)
     model: str = field(default=AnthropicTokenizer.DEFAULT_MODEL, kw_only=True)
@@ -22,10 +26,26 @@ class AnthropicPromptDriver(BasePromptDriver):
         ),
         kw_only=True,
     )
+    request_timeout: float = field(default=600, kw_only=True)
+    max_connections: int = field(default=100, kw_only=True)
+    client: anthropic.Anthropic = field(
+        default=Factory(
+            lambda self: anthropic.Anthropic(
+                api_key=self.api_key,
+                timeout=self.request_timeout,
+                connection_pool_limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            ),
+            takes_self=True
+        ),
+        kw_only=True
+    )
 
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
         prompt = self.prompt_stack_to_string(prompt_stack)
-        response = anthropic.Anthropic(api_key=self.api_key).completions.create(
+        response = self.client.completions.create(
             prompt=prompt,
             stop_sequences=self.tokenizer.stop_sequences,
             model=self.model,
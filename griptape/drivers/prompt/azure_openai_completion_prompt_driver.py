@@ -1,5 +1,5 @@
+from __future__ import annotations
 from attr import define, field, Factory
-from griptape.utils import PromptStack
 from griptape.drivers import OpenAiCompletionPromptDriver
 from griptape.tokenizers import OpenAiTokenizer
 
@@ -16,7 +16,7 @@ class AzureOpenAiCompletionPromptDriver(OpenAiCompletionPromptDriver):
         kw_only=True
     )
 
-    def _base_params(self, prompt_stack: PromptStack) -> dict:
-        return super()._base_params(prompt_stack) | {
+    def _params(self, prompt: str | list[str], max_tokens: int) -> dict:
+        return super()._params(prompt, max_tokens) | {
             "deployment_id": self.deployment_id
         }
@@ -1,9 +1,13 @@
 from __future__ import annotations
+import logging
 from abc import ABC, abstractmethod
+from concurrent import futures
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Callable
 from attr import define, field, Factory
+from griptape.artifacts import ErrorArtifact
 from griptape.events import StartPromptEvent, FinishPromptEvent
-from griptape.utils import PromptStack
+from griptape.utils import PromptStack, fields_to_cache_params
 from griptape.mixins import ExponentialBackoffMixin
 from griptape.tokenizers import BaseTokenizer
 
@@ -12,6 +16,11 @@ if TYPE_CHECKING:
     from griptape.structures import Structure
 
 
+@lru_cache(maxsize=None)
+def _default_futures_executor() -> futures.Executor:
+    return futures.ThreadPoolExecutor()
+
+
 @define
 class BasePromptDriver(ExponentialBackoffMixin, ABC):
     temperature: float = field(default=0.1, kw_only=True)
@@ -24,6 +33,8 @@ class BasePromptDriver(ExponentialBackoffMixin, ABC):
         ),
         kw_only=True
     )
+    # Drivers share one default thread pool for `run_many`, so creating drivers doesn't leave idle threads behind.
+    futures_executor: futures.Executor = field(default=Factory(_default_futures_executor), kw_only=True)
 
     model: str
     tokenizer: BaseTokenizer
@@ -64,6 +75,45 @@ class BasePromptDriver(ExponentialBackoffMixin, ABC):
 
                 return result
 
+    def run_many(self, prompt_stacks: list[PromptStack]) -> list[TextArtifact | ErrorArtifact]:
+        """Runs many independent prompt stacks and returns their results in the same order.
+
+        Drivers that support batching send all prompt stacks to the model in a single attempt. If that fails, or
+        the driver doesn't support batching, each prompt stack is run and retried on its own on `futures_executor`,
+        which bounds the concurrency. Failed runs are returned as `ErrorArtifact`s.
+        """
+        if self.supports_batching and len(prompt_stacks) > 1:
+            try:
+                return self.__run_batch(prompt_stacks)
+            except Exception as e:
+                logging.warning(f"Batched prompt run failed; running prompts individually: {e}")
+
+        return [
+            self.__future_to_artifact(f)
+            for f in [self.futures_executor.submit(self.run, prompt_stack) for prompt_stack in prompt_stacks]
+        ]
+
+    @property
+    def supports_batching(self) -> bool:
+        return False
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether runs publish the output in `CompletionChunkEvent`s as it's generated."""
+        return False
+
+    def cache_params(self) -> dict:
+        """Returns the driver configuration that outputs depend on, for cache keys of tasks that use the driver.
+
+        Includes the driver class and all fields with JSON values, like the model, sampling parameters, and
+        endpoints, so drivers that differ in any of them don't share cached outputs.
+        """
+        return fields_to_cache_params(self, exclude={"structure"})
+
+    def try_run_many(self, prompt_stacks: list[PromptStack]) -> list[TextArtifact]:
+        """Runs many prompt stacks in a single attempt. Drivers that support batching send them in one request."""
+        return [self.try_run(prompt_stack) for prompt_stack in prompt_stacks]
+
     def default_prompt_stack_to_string_converter(self, prompt_stack: PromptStack) -> str:
         prompt_lines = []
 
@@ -82,3 +132,35 @@ class BasePromptDriver(ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
         ...
+
+    def __run_batch(self, prompt_stacks: list[PromptStack]) -> list[TextArtifact]:
+        if self.structure:
+            for prompt_stack in prompt_stacks:
+                self.structure.publish_event(
+                    StartPromptEvent(
+                        token_count=self.token_count(prompt_stack)
+                    )
+                )
+
+        results = self.try_run_many(prompt_stacks)
+
+        if len(results) != len(prompt_stacks):
+            raise Exception(f"Expected {len(prompt_stacks)} results, got {len(results)}")
+
+        for result in results:
+            if self.structure:
+                self.structure.publish_event(
+                    FinishPromptEvent(
+                        token_count=result.token_count(self.tokenizer)
+                    )
+                )
+
+            result.value = result.value.strip()
+
+        return results
+
+    def __future_to_artifact(self, future: futures.Future[TextArtifact]) -> TextArtifact | ErrorArtifact:
+        try:
+            return future.result()
+        except Exception as e:
+            return ErrorArtifact(str(e))
@@ -12,13 +12,16 @@ class CoherePromptDriver(BasePromptDriver):
     Attributes: 
         api_key: Cohere API key.
         model: 	Cohere model name. Defaults to `xlarge`.
+        request_timeout: Timeout in seconds for each API request.
         client: Custom `cohere.Client`.
         tokenizer: Custom `CohereTokenizer`.
     """
     api_key: str = field(kw_only=True)
     model: str = field(default=CohereTokenizer.DEFAULT_MODEL, kw_only=True)
+    request_timeout: int = field(default=300, kw_only=True)
     client: cohere.Client = field(
-        default=Factory(lambda self: cohere.Client(self.api_key), takes_self=True), kw_only=True
+        default=Factory(lambda self: cohere.Client(self.api_key, timeout=self.request_timeout), takes_self=True),
+        kw_only=True
     )
     tokenizer: CohereTokenizer = field(
         default=Factory(lambda self: CohereTokenizer(model=self.model, client=self.client), takes_self=True),
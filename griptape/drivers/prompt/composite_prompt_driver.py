@@ -0,0 +1,200 @@
+from __future__ import annotations
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from enum import Enum
+from typing import TYPE_CHECKING, Optional
+from attr import define, field, Factory
+from griptape.drivers import BasePromptDriver
+from griptape.tokenizers import BaseTokenizer
+
+if TYPE_CHECKING:
+    from griptape.artifacts import TextArtifact
+    from griptape.utils import PromptStack
+
+
+@define
+class CompositePromptDriver(BasePromptDriver):
+    """Prompt Driver that routes each prompt to one of several Prompt Drivers, for example the same model
+    deployed with different providers or regions.
+
+    Each Prompt Driver's latency is tracked over a moving window of its most recent successful runs. Prompts are
+    routed according to `strategy`:
+
+    - `FAILOVER`: tries Prompt Drivers in order until one succeeds.
+    - `LEAST_LATENCY`: same as `FAILOVER`, but Prompt Drivers are ordered by their mean latency. Prompt Drivers
+        without latency samples are tried first, so that they get measured.
+    - `HEDGED`: runs the fastest Prompt Driver and, if it doesn't finish within its `hedge_percentile` latency,
+        starts the next one. A failed run immediately starts the next one. The first successful result wins and
+        the other runs are cancelled or, if they have already started, ignored. Up to `max_hedged_requests` runs
+        are started, going through the Prompt Drivers again from the fastest once each has a run, so even a single
+        Prompt Driver can be hedged with a duplicate request.
+
+    Prompt Drivers are run with their `run` method, so they retry and publish events as configured. The composite
+    itself doesn't retry by default.
+
+    Attributes:
+        prompt_drivers: Prompt Drivers to route prompts to.
+        strategy: Routing strategy.
+        latency_window: Number of latency samples kept per Prompt Driver.
+        hedge_percentile: Latency percentile after which a hedged request is started.
+        default_hedge_delay: Hedge delay in seconds used until a Prompt Driver has latency samples.
+        hedge_executor: Executor for hedged requests.
+        max_hedged_requests: Maximum number of runs of a hedged prompt, including the first one. Defaults to the
+            number of Prompt Drivers.
+        model: Model name. Defaults to the model of the first Prompt Driver.
+        tokenizer: Tokenizer. Defaults to the tokenizer of the first Prompt Driver.
+    """
+
+    class Strategy(Enum):
+        FAILOVER = 1
+        LEAST_LATENCY = 2
+        HEDGED = 3
+
+    prompt_drivers: list[BasePromptDriver] = field(kw_only=True)
+    strategy: Strategy = field(default=Strategy.FAILOVER, kw_only=True)
+    latency_window: int = field(default=100, kw_only=True)
+    hedge_percentile: float = field(default=0.95, kw_only=True)
+    default_hedge_delay: float = field(default=1, kw_only=True)
+    hedge_executor: futures.Executor = field(
+        default=Factory(lambda: futures.ThreadPoolExecutor()),
+        kw_only=True
+    )
+    max_hedged_requests: int = field(
+        default=Factory(lambda self: len(self.prompt_drivers), takes_self=True),
+        kw_only=True
+    )
+    max_attempts: int = field(default=1, kw_only=True)
+    model: str = field(default=Factory(lambda self: self.primary_prompt_driver.model, takes_self=True), kw_only=True)
+    tokenizer: BaseTokenizer = field(
+        default=Factory(lambda self: self.primary_prompt_driver.tokenizer, takes_self=True),
+        kw_only=True
+    )
+    _latencies: dict[int, deque[float]] = field(factory=dict, init=False)
+    _latencies_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @prompt_drivers.validator
+    def validate_prompt_drivers(self, _, prompt_drivers: list[BasePromptDriver]) -> None:
+        if not prompt_drivers:
+            raise ValueError("at least one prompt driver is required")
+
+    @hedge_percentile.validator
+    def validate_hedge_percentile(self, _, hedge_percentile: float) -> None:
+        if not 0 < hedge_percentile <= 1:
+            raise ValueError("hedge percentile has to be greater than 0 and less than or equal to 1")
+
+    @max_hedged_requests.validator
+    def validate_max_hedged_requests(self, _, max_hedged_requests: int) -> None:
+        if max_hedged_requests < 1:
+            raise ValueError("max hedged requests has to be at least 1")
+
+    @property
+    def primary_prompt_driver(self) -> BasePromptDriver:
+        if self.prompt_drivers:
+            return self.prompt_drivers[0]
+        else:
+            raise ValueError("at least one prompt driver is required")
+
+    def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
+        if self.strategy == CompositePromptDriver.Strategy.HEDGED:
+            return self.__run_hedged(prompt_stack)
+        elif self.strategy == CompositePromptDriver.Strategy.LEAST_LATENCY:
+            return self.__run_failover(self.ordered_prompt_drivers(), prompt_stack)
+        else:
+            return self.__run_failover(self.prompt_drivers, prompt_stack)
+
+    def ordered_prompt_drivers(self) -> list[BasePromptDriver]:
+        return sorted(
+            self.prompt_drivers,
+            key=lambda driver: self.mean_latency(driver) or 0
+        )
+
+    def mean_latency(self, prompt_driver: BasePromptDriver) -> Optional[float]:
+        latencies = self.__latency_samples(prompt_driver)
+
+        return sum(latencies) / len(latencies) if latencies else None
+
+    def percentile_latency(self, prompt_driver: BasePromptDriver, percentile: float) -> Optional[float]:
+        latencies = sorted(self.__latency_samples(prompt_driver))
+
+        return latencies[max(math.ceil(percentile * len(latencies)) - 1, 0)] if latencies else None
+
+    def hedge_delay(self, prompt_driver: BasePromptDriver) -> float:
+        latency = self.percentile_latency(prompt_driver, self.hedge_percentile)
+
+        return self.default_hedge_delay if latency is None else latency
+
+    def __run_failover(self, prompt_drivers: list[BasePromptDriver], prompt_stack: PromptStack) -> TextArtifact:
+        error: Exception = ValueError("at least one prompt driver is required")
+
+        for prompt_driver in prompt_drivers:
+            try:
+                return self.__timed_run(prompt_driver, prompt_stack)
+            except Exception as e:
+                error = e
+
+        raise error
+
+    def __run_hedged(self, prompt_stack: PromptStack) -> TextArtifact:
+        prompt_drivers = itertools.islice(itertools.cycle(self.ordered_prompt_drivers()), self.max_hedged_requests)
+        running: set[futures.Future[TextArtifact]] = set()
+        error: Exception = ValueError("at least one prompt driver is required")
+
+        def start_next() -> Optional[BasePromptDriver]:
+            prompt_driver = next(prompt_drivers, None)
+
+            if prompt_driver is not None:
+                running.add(self.hedge_executor.submit(self.__timed_run, prompt_driver, prompt_stack))
+
+            return prompt_driver
+
+        latest_driver = start_next()
+        has_more_drivers = True
+
+        try:
+            while running:
+                done, _ = futures.wait(
+                    running,
+                    timeout=self.hedge_delay(latest_driver) if has_more_drivers else None,
+                    return_when=futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    running.remove(future)
+
+                    try:
+                        return future.result()
+                    except Exception as e:
+                        error = e
+
+                # Either the latest run is slower than usual or a run failed, so start the next Prompt Driver.
+                if has_more_drivers:
+                    next_driver = start_next()
+
+                    if next_driver is not None:
+                        latest_driver = next_driver
+                    else:
+                        has_more_drivers = False
+        finally:
+            for future in running:
+                future.cancel()
+
+        raise error
+
+    def __timed_run(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> TextArtifact:
+        start_time = time.perf_counter()
+        result = prompt_driver.run(prompt_stack)
+
+        with self._latencies_lock:
+            self._latencies.setdefault(
+                id(prompt_driver), deque(maxlen=self.latency_window)
+            ).append(time.perf_counter() - start_time)
+
+        return result
+
+    def __latency_samples(self, prompt_driver: BasePromptDriver) -> list[float]:
+        with self._latencies_lock:
+            return list(self._latencies.get(id(prompt_driver), []))
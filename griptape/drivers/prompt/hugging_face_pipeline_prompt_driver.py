@@ -1,11 +1,13 @@
+import copy
 from os import environ
+from typing import Optional
 
 from griptape.utils import PromptStack
 
 environ["TRANSFORMERS_VERBOSITY"] = "error"
 
 from attr import define, field, Factory
-from transformers import pipeline, AutoTokenizer
+from transformers import pipeline, AutoTokenizer, Pipeline
 from griptape.artifacts import TextArtifact
 from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import HuggingFaceTokenizer
@@ -18,6 +20,7 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
         params: Custom model run parameters. 
         model: Hugging Face Hub model name. Defaults to `repo_id`.
         tokenizer: Custom `HuggingFaceTokenizer`.
+        batch_size: Number of prompts sent through the model in one forward pass by `try_run_many`.
         
     """
     SUPPORTED_TASKS = ["text2text-generation", "text-generation"]
@@ -36,31 +39,81 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
         ),
         kw_only=True
     )
+    batch_size: int = field(default=8, kw_only=True)
+    _generator: Optional[Pipeline] = field(default=None, kw_only=True)
+
+    @property
+    def generator(self) -> Pipeline:
+        """Returns the Hugging Face pipeline for this driver.
+
+        Building a pipeline loads the model weights, so it is done once, on first use, and reused
+        across all subsequent runs of this driver.
+
+        Returns:
+            Pipeline: The text generation pipeline for this driver.
+        """
+        if self._generator is None:
+            tokenizer = self.tokenizer.tokenizer
+
+            # Batched generation pads the inputs, which requires a padding token. It's set on a copy, since
+            # tokenizers can be shared, for example by `HuggingFaceTokenizer.from_pretrained`.
+            if self.batch_size > 1 and tokenizer.pad_token_id is None:
+                tokenizer = copy.deepcopy(tokenizer)
+                tokenizer.pad_token_id = tokenizer.eos_token_id
+
+            generator = pipeline(
+                tokenizer=tokenizer,
+                model=self.model
+            )
+
+            if generator.task not in self.SUPPORTED_TASKS:
+                raise Exception(f"Only models with the following tasks are supported: {self.SUPPORTED_TASKS}")
+
+            self._generator = generator
+
+        return self._generator
+
+    @property
+    def supports_batching(self) -> bool:
+        return True
 
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
         prompt = self.prompt_stack_to_string(prompt_stack)
 
-        generator = pipeline(
-            tokenizer=self.tokenizer.tokenizer,
-            model=self.model,
-            max_new_tokens=self.tokenizer.tokens_left(prompt)
+        response = self.generator(
+            prompt,
+            **self._generation_params(self.max_output_tokens(prompt))
         )
 
-        if generator.task in self.SUPPORTED_TASKS:
-            extra_params = {
-                "pad_token_id": self.tokenizer.tokenizer.eos_token_id
-            }
+        return self._process_response(response)
 
-            response = generator(
-                prompt,
-                **(self.DEFAULT_PARAMS | extra_params | self.params)
-            )
+    def try_run_many(self, prompt_stacks: list[PromptStack]) -> list[TextArtifact]:
+        if not prompt_stacks:
+            return []
+
+        prompts = [self.prompt_stack_to_string(prompt_stack) for prompt_stack in prompt_stacks]
+
+        # Prompts in a batch share one output length, so it's capped by the longest prompt.
+        responses = self.generator(
+            prompts,
+            batch_size=self.batch_size,
+            **self._generation_params(min(self.max_output_tokens(prompt) for prompt in prompts))
+        )
 
-            if len(response) == 1:
-                return TextArtifact(
-                    value=response[0]["generated_text"].strip()
-                )
-            else:
-                raise Exception("Completion with more than one choice is not supported yet.")
+        return [self._process_response(response) for response in responses]
+
+    def _generation_params(self, max_new_tokens: int) -> dict:
+        extra_params = {
+            "pad_token_id": self.tokenizer.tokenizer.eos_token_id,
+            "max_new_tokens": max_new_tokens
+        }
+
+        return self.DEFAULT_PARAMS | extra_params | self.params
+
+    def _process_response(self, response: list[dict]) -> TextArtifact:
+        if len(response) == 1:
+            return TextArtifact(
+                value=response[0]["generated_text"].strip()
+            )
         else:
-            raise Exception(f"Only models with the following tasks are supported: {self.SUPPORTED_TASKS}")
+            raise Exception("Completion with more than one choice is not supported yet.")
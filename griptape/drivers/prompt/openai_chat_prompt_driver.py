@@ -3,6 +3,7 @@ from typing import Optional
 import openai
 from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
+from griptape.events import CompletionChunkEvent
 from griptape.utils import PromptStack
 from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import OpenAiTokenizer
@@ -22,6 +23,8 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         organization: OpenAI organization.
         tokenizer: Custom `OpenAiTokenizer`.
         user: OpenAI user. 	
+        request_timeout: Timeout in seconds for each API request.
+        stream: Stream the completion. Each chunk is published as a `CompletionChunkEvent` as it arrives.
     """
     api_type: str = field(default=openai.api_type, kw_only=True)
     api_version: Optional[str] = field(default=openai.api_version, kw_only=True)
@@ -34,9 +37,18 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         kw_only=True
     )
     user: str = field(default="", kw_only=True)
+    request_timeout: float = field(default=600, kw_only=True)
     ignored_exception_types: Tuple[Type[Exception], ...] = field(default=Factory(lambda: (openai.InvalidRequestError)), kw_only=True)
+    stream: bool = field(default=False, kw_only=True)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.stream
 
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
+        if self.stream:
+            return self._run_with_stream(prompt_stack)
+
         result = openai.ChatCompletion.create(**self._base_params(prompt_stack))
 
         if len(result.choices) == 1:
@@ -46,6 +58,23 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         else:
             raise Exception("Completion with more than one choice is not supported yet.")
 
+    def _run_with_stream(self, prompt_stack: PromptStack) -> TextArtifact:
+        tokens = []
+
+        for chunk in openai.ChatCompletion.create(**self._base_params(prompt_stack), stream=True):
+            if len(chunk.choices) != 1:
+                raise Exception("Completion with more than one choice is not supported yet.")
+
+            token = chunk.choices[0]["delta"].get("content")
+
+            if token:
+                tokens.append(token)
+
+                if self.structure:
+                    self.structure.publish_event(CompletionChunkEvent(token=token))
+
+        return TextArtifact(value="".join(tokens).strip())
+
     def token_count(self, prompt_stack: PromptStack) -> int:
         return self.tokenizer.token_count(
             self._prompt_stack_to_messages(prompt_stack)
@@ -73,6 +102,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             "api_version": self.api_version,
             "api_base": self.api_base,
             "api_type": self.api_type,
+            "request_timeout": self.request_timeout,
             "messages": messages
         }
 
@@ -1,3 +1,4 @@
+from __future__ import annotations
 import os
 from typing import Optional
 import openai
@@ -22,6 +23,7 @@ class OpenAiCompletionPromptDriver(BasePromptDriver):
         organization: OpenAI organization.
         tokenizer: Custom `OpenAiTokenizer`.
         user: OpenAI user. 	
+        request_timeout: Timeout in seconds for each API request.
     """
     api_type: str = field(default=openai.api_type, kw_only=True)
     api_version: Optional[str] = field(default=openai.api_version, kw_only=True)
@@ -34,6 +36,7 @@ class OpenAiCompletionPromptDriver(BasePromptDriver):
         kw_only=True
     )
     user: str = field(default="", kw_only=True)
+    request_timeout: float = field(default=600, kw_only=True)
     ignored_exception_types: Tuple[Type[Exception], ...] = field(default=Factory(lambda: (openai.InvalidRequestError)), kw_only=True)
 
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
@@ -46,12 +49,37 @@ class OpenAiCompletionPromptDriver(BasePromptDriver):
         else:
             raise Exception("Completion with more than one choice is not supported yet.")
 
+    @property
+    def supports_batching(self) -> bool:
+        return True
+
+    def try_run_many(self, prompt_stacks: list[PromptStack]) -> list[TextArtifact]:
+        prompts = [self.prompt_stack_to_string(prompt_stack) for prompt_stack in prompt_stacks]
+        result = openai.Completion.create(
+            **self._params(
+                prompts,
+                min([self.max_output_tokens(prompt) for prompt in prompts], default=0)
+            )
+        )
+
+        if len(result.choices) == len(prompts):
+            # Choices for a list of prompts aren't guaranteed to be ordered, but each one carries its prompt index.
+            return [
+                TextArtifact(value=choice.text.strip())
+                for choice in sorted(result.choices, key=lambda c: c.index)
+            ]
+        else:
+            raise Exception("Completion with more than one choice per prompt is not supported yet.")
+
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         prompt = self.prompt_stack_to_string(prompt_stack)
 
+        return self._params(prompt, self.max_output_tokens(prompt))
+
+    def _params(self, prompt: str | list[str], max_tokens: int) -> dict:
         return {
             "model": self.model,
-            "max_tokens": self.max_output_tokens(prompt),
+            "max_tokens": max_tokens,
             "temperature": self.temperature,
             "stop": self.tokenizer.stop_sequences,
             "user": self.user,
@@ -60,5 +88,6 @@ class OpenAiCompletionPromptDriver(BasePromptDriver):
             "api_version": self.api_version,
             "api_base": self.api_base,
             "api_type": self.api_type,
+            "request_timeout": self.request_timeout,
             "prompt": prompt
         }
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from attr import define, field
 from griptape.artifacts import TextArtifact
-from griptape.utils import PromptStack
+from griptape.utils import PromptStack, fields_to_cache_params
 from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import BaseTokenizer
 
@@ -29,3 +29,44 @@ class BasePromptModelDriver(ABC):
     @abstractmethod
     def process_output(self, output: list[dict] | str | bytes) -> TextArtifact:
         ...
+
+    def process_output_chunk(self, chunk: bytes) -> TextArtifact:
+        return self.process_output(chunk)
+
+    @property
+    def supports_batching(self) -> bool:
+        return False
+
+    def cache_params(self) -> dict:
+        return fields_to_cache_params(self, exclude={"prompt_driver"})
+
+    def prompt_stacks_to_model_input(self, prompt_stacks: list[PromptStack]) -> list:
+        return [self.prompt_stack_to_model_input(prompt_stack) for prompt_stack in prompt_stacks]
+
+    def prompt_stacks_to_model_params(self, prompt_stacks: list[PromptStack]) -> dict:
+        """Returns the parameters of a batch of prompt stacks.
+
+        Prompt stacks in a batch share parameters, so numeric parameters that differ, like the maximum number of new
+        tokens, are capped by the smallest value.
+
+        Raises:
+            ValueError: If other parameters differ between prompt stacks.
+        """
+        params = {}
+
+        for prompt_stack_params in [self.prompt_stack_to_model_params(prompt_stack) for prompt_stack in prompt_stacks]:
+            for key, value in prompt_stack_params.items():
+                if key not in params or params[key] == value:
+                    params[key] = value
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    params[key] = min(params[key], value)
+                else:
+                    raise ValueError(f"prompt stacks in a batch have different values of {key}")
+
+        return params
+
+    def process_outputs(self, output: list) -> list[TextArtifact]:
+        """Processes the output of a batch, which has one element per prompt stack. Each element is processed like the
+        output of a single prompt stack, which is a list with one element.
+        """
+        return [self.process_output([o]) for o in output]
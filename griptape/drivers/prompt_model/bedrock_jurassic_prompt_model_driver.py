@@ -33,7 +33,11 @@ class BedrockJurassicPromptModelDriver(BasePromptModelDriver):
             return self._tokenizer
         else:
             if isinstance(self.prompt_driver, AmazonBedrockPromptDriver):
-                self._tokenizer = BedrockJurassicTokenizer(model=self.model, session=self.prompt_driver.session)
+                self._tokenizer = BedrockJurassicTokenizer(
+                    model=self.model,
+                    session=self.prompt_driver.session,
+                    bedrock_client=self.prompt_driver.bedrock_client
+                )
                 return self._tokenizer
             else:
                 raise ValueError("prompt_driver must be of instance AmazonBedrockPromptDriver")
@@ -33,7 +33,11 @@ class BedrockTitanPromptModelDriver(BasePromptModelDriver):
             return self._tokenizer
         else:
             if isinstance(self.prompt_driver, AmazonBedrockPromptDriver):
-                self._tokenizer = BedrockTitanTokenizer(model=self.model, session=self.prompt_driver.session)
+                self._tokenizer = BedrockTitanTokenizer(
+                    model=self.model,
+                    session=self.prompt_driver.session,
+                    bedrock_client=self.prompt_driver.bedrock_client
+                )
                 return self._tokenizer
             else:
                 raise ValueError("prompt_driver must be of instance AmazonBedrockPromptDriver")
@@ -70,3 +74,8 @@ class BedrockTitanPromptModelDriver(BasePromptModelDriver):
         body = json.loads(response_body)
 
         return TextArtifact(body["results"][0]["outputText"])
+
+    def process_output_chunk(self, chunk: bytes) -> TextArtifact:
+        body = json.loads(chunk)
+
+        return TextArtifact(body["outputText"])
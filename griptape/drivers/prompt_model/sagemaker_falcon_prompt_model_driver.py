@@ -10,8 +10,8 @@ from griptape.tokenizers import BaseTokenizer, HuggingFaceTokenizer
 class SageMakerFalconPromptModelDriver(BasePromptModelDriver):
     tokenizer: BaseTokenizer = field(
         default=Factory(
-            lambda self: HuggingFaceTokenizer(
-                tokenizer=AutoTokenizer.from_pretrained("tiiuae/falcon-40b", model_max_length=self.max_tokens)
+            lambda self: HuggingFaceTokenizer.from_pretrained(
+                AutoTokenizer, "tiiuae/falcon-40b", model_max_length=self.max_tokens
             ),
             takes_self=True
         ),
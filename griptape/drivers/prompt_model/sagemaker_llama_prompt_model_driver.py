@@ -10,10 +10,8 @@ from griptape.tokenizers import BaseTokenizer, HuggingFaceTokenizer
 class SageMakerLlamaPromptModelDriver(BasePromptModelDriver):
     tokenizer: BaseTokenizer = field(
         default=Factory(
-            lambda self: HuggingFaceTokenizer(
-                tokenizer=LlamaTokenizerFast.from_pretrained(
-                    "hf-internal-testing/llama-tokenizer", model_max_length=self.max_tokens
-                )
+            lambda self: HuggingFaceTokenizer.from_pretrained(
+                LlamaTokenizerFast, "hf-internal-testing/llama-tokenizer", model_max_length=self.max_tokens
             ),
             takes_self=True
         ),
@@ -38,3 +36,14 @@ class SageMakerLlamaPromptModelDriver(BasePromptModelDriver):
         return TextArtifact(
             output[0]["generation"]["content"].strip()
         )
+
+    @property
+    def supports_batching(self) -> bool:
+        return True
+
+    def prompt_stacks_to_model_input(self, prompt_stacks: list[PromptStack]) -> list:
+        return [
+            dialog
+            for prompt_stack in prompt_stacks
+            for dialog in self.prompt_stack_to_model_input(prompt_stack)
+        ]
@@ -0,0 +1,268 @@
+from __future__ import annotations
+import json
+import os
+import queue
+import shlex
+import shutil
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+from attr import define, field
+from griptape.artifacts import BaseArtifact, ErrorArtifact, TextArtifact
+
+
+@define
+class BaseSandboxDriver(ABC):
+    """Runs shell commands and Python code in sandboxes for the `Computer` tool.
+
+    Sandboxes are started once, on first use or with `start`, and kept in a pool of `pool_size` sandboxes that are
+    reused across executions. Call `stop` to stop them.
+
+    Attributes:
+        local_workdir: Local directory that is the working directory of the sandboxes. `Computer` sets it to its own
+            working directory.
+        env_vars: Environment variables of sandbox processes.
+        pool_size: Number of sandboxes in the pool, which is the maximum number of concurrent executions.
+        reset_workdir: Whether each sandbox gets its own temporary working directory that is emptied after every
+            use, instead of sharing `local_workdir`.
+        repl_timeout: Seconds after which a REPL session execution is stopped by closing the session. `Computer`
+            starts a new session on the next execution. `None` means no timeout.
+    """
+
+    @define
+    class Sandbox:
+        """A sandbox of the pool.
+
+        Attributes:
+            local_workdir: Local directory that is the working directory of the sandbox.
+            handle: Driver-specific reference to the sandbox, like a container.
+        """
+
+        local_workdir: str = field(kw_only=True)
+        handle: Any = field(default=None, kw_only=True)
+
+    @define
+    class ReplSession:
+        """Long-lived Python process that runs code in a namespace that is kept across executions, so that imports
+        and variables don't have to be set up again.
+
+        Attributes:
+            write: Writes bytes to the stdin of the process.
+            readline: Reads a line from the stdout of the process. Returns an empty bytes object at the end of the
+                stream.
+            close_callback: Stops the process.
+            timeout: Seconds after which an execution is stopped by closing the session. `None` means no timeout.
+        """
+
+        write: Callable[[bytes], None] = field(kw_only=True)
+        readline: Callable[[], bytes] = field(kw_only=True)
+        close_callback: Callable[[], None] = field(kw_only=True)
+        timeout: Optional[float] = field(default=None, kw_only=True)
+        closed: bool = field(default=False, init=False)
+        _lock: threading.Lock = field(factory=threading.Lock, init=False)
+        _lines: Optional[queue.Queue[bytes]] = field(default=None, init=False)
+
+        def execute(self, code: str) -> BaseArtifact:
+            with self._lock:
+                if self.closed:
+                    return ErrorArtifact("REPL session is closed")
+
+                if self._lines is None:
+                    # Lines are read in a separate thread, so that executions can time out while a read blocks.
+                    self._lines = queue.Queue()
+
+                    threading.Thread(target=self.__read_lines, args=(self._lines,), daemon=True).start()
+
+                self.write(json.dumps({"code": code}).encode() + b"\n")
+
+                try:
+                    line = self._lines.get(timeout=self.timeout)
+                except queue.Empty:
+                    self.__close()
+
+                    return ErrorArtifact(f"REPL session execution timed out after {self.timeout} seconds")
+
+            if not line:
+                return ErrorArtifact("REPL session ended unexpectedly")
+
+            response = json.loads(line)
+
+            if response["stderr"]:
+                return ErrorArtifact(response["stderr"].strip())
+            else:
+                return TextArtifact(response["stdout"].strip())
+
+        def close(self) -> None:
+            with self._lock:
+                self.__close()
+
+        def __close(self) -> None:
+            if not self.closed:
+                self.closed = True
+
+                self.close_callback()
+
+        def __read_lines(self, lines: queue.Queue[bytes]) -> None:
+            try:
+                while line := self.readline():
+                    lines.put(line)
+            except Exception:
+                pass
+
+            lines.put(b"")
+
+    local_workdir: Optional[str] = field(default=None, kw_only=True)
+    env_vars: dict = field(factory=dict, kw_only=True)
+    pool_size: int = field(default=1, kw_only=True)
+    reset_workdir: bool = field(default=False, kw_only=True)
+    repl_timeout: Optional[float] = field(default=300, kw_only=True)
+    _pool: queue.Queue[Sandbox] = field(factory=queue.Queue, init=False)
+    _sandboxes: list[Sandbox] = field(factory=list, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @pool_size.validator
+    def validate_pool_size(self, _, pool_size: int) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size has to be at least 1")
+
+    @property
+    @abstractmethod
+    def python_command(self) -> str:
+        """Returns the shell command that runs the Python interpreter of the sandboxes."""
+        ...
+
+    def start(self) -> None:
+        """Starts the pool of sandboxes, unless it's already started."""
+        with self._lock:
+            if self._sandboxes:
+                return
+
+            if self.local_workdir is None:
+                raise ValueError("local_workdir has to be set before starting sandboxes")
+
+            for _ in range(self.pool_size):
+                local_workdir = tempfile.mkdtemp() if self.reset_workdir else self.local_workdir
+                sandbox = BaseSandboxDriver.Sandbox(local_workdir=local_workdir)
+
+                self.try_start_sandbox(sandbox)
+
+                self._sandboxes.append(sandbox)
+                self._pool.put(sandbox)
+
+    def stop(self) -> None:
+        """Stops the sandboxes of the pool. The pool is started again on the next use."""
+        with self._lock:
+            for sandbox in self._sandboxes:
+                self.try_stop_sandbox(sandbox)
+
+                if self.reset_workdir:
+                    shutil.rmtree(sandbox.local_workdir, ignore_errors=True)
+
+            self._sandboxes = []
+            self._pool = queue.Queue()
+
+    @contextmanager
+    def sandbox(self) -> Iterator[Sandbox]:
+        """Takes a sandbox from the pool, waiting for one to be available, and gives it back after use."""
+        self.start()
+
+        sandbox = self._pool.get()
+
+        try:
+            yield sandbox
+        finally:
+            if self.reset_workdir:
+                self.__clear_dir(sandbox.local_workdir)
+
+            self._pool.put(sandbox)
+
+    def execute_command(self, command: str, sandbox: Optional[Sandbox] = None) -> BaseArtifact:
+        """Runs a shell command in the working directory of a sandbox.
+
+        Args:
+            command: Shell command.
+            sandbox: Sandbox to run the command in. Defaults to a sandbox from the pool.
+
+        Returns:
+            An `ErrorArtifact` with stderr if the command wrote to it, otherwise a `TextArtifact` with stdout.
+        """
+        if sandbox is None:
+            with self.sandbox() as sandbox:
+                return self.execute_command(command, sandbox)
+
+        stdout, stderr = self.try_execute_command(sandbox, command)
+
+        if stderr.strip():
+            return ErrorArtifact(stderr.strip())
+        else:
+            return TextArtifact(stdout.strip())
+
+    def execute_code(self, filename: str, code: str, sandbox: Optional[Sandbox] = None) -> BaseArtifact:
+        """Writes Python code to a file in the working directory of a sandbox and runs it.
+
+        Args:
+            filename: Path of the file relative to the working directory.
+            code: Python code.
+            sandbox: Sandbox to run the code in. Defaults to a sandbox from the pool.
+
+        Raises:
+            ValueError: If the file isn't inside the working directory.
+        """
+        if sandbox is None:
+            with self.sandbox() as sandbox:
+                return self.execute_code(filename, code, sandbox)
+
+        with open(self.workdir_file_path(sandbox.local_workdir, filename), "w") as file:
+            file.write(code)
+
+        return self.execute_command(f"{self.python_command} {shlex.quote(filename)}", sandbox)
+
+    @staticmethod
+    def workdir_file_path(workdir: str, filename: str) -> str:
+        """Returns the path of a file in a working directory.
+
+        Raises:
+            ValueError: If the file isn't inside the working directory, for example because the filename is absolute
+                or has `..` components.
+        """
+        workdir = os.path.realpath(workdir)
+        path = os.path.realpath(os.path.join(workdir, filename))
+
+        if os.path.commonpath([workdir, path]) != workdir or path == workdir:
+            raise ValueError(f"{filename} isn't a file in the working directory")
+
+        return path
+
+    @abstractmethod
+    def try_start_sandbox(self, sandbox: Sandbox) -> None:
+        """Starts a sandbox whose working directory is `sandbox.local_workdir` and sets its handle."""
+        ...
+
+    @abstractmethod
+    def try_stop_sandbox(self, sandbox: Sandbox) -> None:
+        ...
+
+    @abstractmethod
+    def try_execute_command(self, sandbox: Sandbox, command: str) -> tuple[str, str]:
+        """Runs a shell command in the working directory of a sandbox and returns its stdout and stderr."""
+        ...
+
+    @abstractmethod
+    def start_repl_session(self) -> ReplSession:
+        """Starts a REPL session whose working directory is `local_workdir`. Close the session to stop it."""
+        ...
+
+    def repl_server_source(self) -> str:
+        from griptape.drivers.sandbox import repl_server
+
+        with open(repl_server.__file__, "r") as file:
+            return file.read()
+
+    def __clear_dir(self, path: str) -> None:
+        for entry in os.scandir(path):
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
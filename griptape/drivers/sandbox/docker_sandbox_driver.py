@@ -0,0 +1,116 @@
+from __future__ import annotations
+import uuid
+import docker
+from attr import define, field
+from docker.models.containers import Container
+from docker.utils.socket import frames_iter, STDOUT
+from griptape.drivers import BaseSandboxDriver
+
+
+@define
+class DockerSandboxDriver(BaseSandboxDriver):
+    """Runs commands and code in Docker containers.
+
+    Pool containers are started from `image_name` with `local_workdir` mounted at `workdir` and keep running, so
+    that executions only have to exec into a running container instead of creating a new one. Containers are
+    labeled with `container_name_prefix`, so that containers left over by other processes can be removed with
+    `remove_containers`.
+
+    Attributes:
+        docker_client: Docker client.
+        image_name: Name of the image to start containers from. It needs a Python interpreter and `sleep`.
+        container_name_prefix: Prefix of container names, which are followed by a random suffix.
+        workdir: Working directory in the containers.
+    """
+
+    CONTAINER_LABEL = "griptape.sandbox"
+
+    docker_client: docker.DockerClient = field(kw_only=True)
+    image_name: str = field(kw_only=True)
+    container_name_prefix: str = field(default="griptape_sandbox", kw_only=True)
+    workdir: str = field(default="/griptape", kw_only=True)
+
+    @property
+    def python_command(self) -> str:
+        return "python"
+
+    def remove_containers(self) -> None:
+        """Stops the sandboxes and removes all other containers with `container_name_prefix`."""
+        self.stop()
+
+        for container in self.docker_client.containers.list(
+            all=True, filters={"label": f"{self.CONTAINER_LABEL}={self.container_name_prefix}"}
+        ):
+            container.remove(force=True)
+
+    def try_start_sandbox(self, sandbox: BaseSandboxDriver.Sandbox) -> None:
+        sandbox.handle = self.__run_container(sandbox.local_workdir, ["sleep", "infinity"])
+
+    def try_stop_sandbox(self, sandbox: BaseSandboxDriver.Sandbox) -> None:
+        sandbox.handle.remove(force=True)
+
+    def try_execute_command(self, sandbox: BaseSandboxDriver.Sandbox, command: str) -> tuple[str, str]:
+        _, (stdout, stderr) = sandbox.handle.exec_run(
+            ["sh", "-c", command], environment=self.env_vars, workdir=self.workdir, demux=True
+        )
+
+        return (stdout or b"").decode(), (stderr or b"").decode()
+
+    def start_repl_session(self) -> BaseSandboxDriver.ReplSession:
+        # Sessions get their own container, so that they don't hold up a pool container while idle.
+        container = self.__run_container(
+            self.local_workdir, ["python", "-u", "-c", self.repl_server_source()], stdin_open=True
+        )
+        socket = container.attach_socket(params={"stdin": 1, "stdout": 1, "stream": 1})
+        frames = frames_iter(socket, tty=False)
+        buffer = bytearray()
+
+        def readline() -> bytes:
+            while b"\n" not in buffer:
+                stream, data = next(frames, (None, None))
+
+                if data is None:
+                    line = bytes(buffer)
+
+                    buffer.clear()
+
+                    return line
+                elif stream == STDOUT:
+                    buffer.extend(data)
+
+            line, _, rest = bytes(buffer).partition(b"\n")
+
+            buffer[:] = rest
+
+            return line + b"\n"
+
+        def write(data: bytes) -> None:
+            # The socket is a socket.SocketIO for local daemons and a socket or channel for TLS and SSH connections.
+            if hasattr(socket, "sendall"):
+                socket.sendall(data)
+            else:
+                view = memoryview(data)
+
+                while view:
+                    view = view[socket.write(view):]
+
+        def close() -> None:
+            socket.close()
+            container.remove(force=True)
+
+        return BaseSandboxDriver.ReplSession(
+            write=write, readline=readline, close_callback=close, timeout=self.repl_timeout
+        )
+
+    def __run_container(self, local_workdir: str, command: list[str], **kwargs) -> Container:
+        return self.docker_client.containers.run(
+            self.image_name,
+            command=command,
+            name=f"{self.container_name_prefix}_{uuid.uuid4().hex[:8]}",
+            labels={self.CONTAINER_LABEL: self.container_name_prefix},
+            environment=self.env_vars,
+            volumes={local_workdir: {"bind": self.workdir, "mode": "rw"}},
+            working_dir=self.workdir,
+            detach=True,
+            **kwargs
+        )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+import os
+import shlex
+import subprocess
+import sys
+from typing import Optional
+from attr import define, field
+from griptape.drivers import BaseSandboxDriver
+
+
+@define
+class LocalSandboxDriver(BaseSandboxDriver):
+    """Runs commands and code in local subprocesses with the Python interpreter of the current process.
+
+    Subprocesses aren't isolated from the host, so this driver is meant for tests and trusted code.
+
+    Attributes:
+        timeout: Seconds after which commands are killed. Defaults to no timeout.
+    """
+
+    timeout: Optional[float] = field(default=None, kw_only=True)
+
+    @property
+    def python_command(self) -> str:
+        return shlex.quote(sys.executable)
+
+    def try_start_sandbox(self, sandbox: BaseSandboxDriver.Sandbox) -> None:
+        os.makedirs(sandbox.local_workdir, exist_ok=True)
+
+    def try_stop_sandbox(self, sandbox: BaseSandboxDriver.Sandbox) -> None:
+        pass
+
+    def try_execute_command(self, sandbox: BaseSandboxDriver.Sandbox, command: str) -> tuple[str, str]:
+        result = subprocess.run(
+            command,
+            shell=True,
+            cwd=sandbox.local_workdir,
+            env=self.__env(),
+            capture_output=True,
+            text=True,
+            timeout=self.timeout
+        )
+
+        return result.stdout, result.stderr
+
+    def start_repl_session(self) -> BaseSandboxDriver.ReplSession:
+        from griptape.drivers.sandbox import repl_server
+
+        process = subprocess.Popen(
+            [sys.executable, "-u", repl_server.__file__],
+            cwd=self.local_workdir,
+            env=self.__env(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+        def write(data: bytes) -> None:
+            process.stdin.write(data)
+            process.stdin.flush()
+
+        def close() -> None:
+            process.stdin.close()
+
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+            process.stdout.close()
+
+        return BaseSandboxDriver.ReplSession(
+            write=write, readline=process.stdout.readline, close_callback=close, timeout=self.repl_timeout
+        )
+
+    def __env(self) -> dict[str, str]:
+        return {**os.environ, **{key: str(value) for key, value in self.env_vars.items()}}
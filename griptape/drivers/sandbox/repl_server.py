@@ -0,0 +1,36 @@
+"""Python REPL that sandbox drivers run for REPL sessions.
+
+Reads one JSON request per line from stdin, executes its code in a namespace that is kept across requests, and
+writes one JSON response per line with the captured stdout and stderr. It only uses the standard library, so that
+it can run with any Python interpreter in the sandbox.
+"""
+import contextlib
+import io
+import json
+import sys
+import traceback
+
+
+def main() -> None:
+    namespace = {"__name__": "__main__"}
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        code = json.loads(line)["code"]
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                exec(compile(code, "<session>", "exec"), namespace)
+            except BaseException:
+                traceback.print_exc()
+
+        sys.__stdout__.write(json.dumps({"stdout": stdout.getvalue(), "stderr": stderr.getvalue()}) + "\n")
+        sys.__stdout__.flush()
+
+
+if __name__ == "__main__":
+    main()
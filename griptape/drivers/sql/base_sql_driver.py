@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
 from attr import define
 
 
@@ -14,6 +14,16 @@ class BaseSqlDriver(ABC):
     def execute_query(self, query: str) -> Optional[list[RowResult]]:
         ...
 
+    def execute_query_pages(self, query: str, page_size: int) -> Iterator[list[RowResult]]:
+        """Yields the rows of a query in pages of up to `page_size` rows.
+
+        Drivers that can fetch rows incrementally override this, so that rows that aren't consumed aren't loaded.
+        """
+        rows = self.execute_query(query) or []
+
+        for i in range(0, len(rows), page_size):
+            yield rows[i:i + page_size]
+
     @abstractmethod
     def execute_query_raw(self, query: str) -> Optional[list[dict[str, any]]]:
         ...
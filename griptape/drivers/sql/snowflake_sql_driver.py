@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 from griptape.drivers import BaseSqlDriver
 from attr import Factory, define, field
 from sqlalchemy import create_engine, text, MetaData, Table
@@ -47,6 +47,17 @@ class SnowflakeSqlDriver(BaseSqlDriver):
         else:
             return None
 
+    def execute_query_pages(self, query: str, page_size: int) -> Iterator[list[BaseSqlDriver.RowResult]]:
+        with self.engine.connect() as con:
+            results = con.execute(text(query))
+
+            if results.returns_rows:
+                while rows := results.fetchmany(page_size):
+                    yield [
+                        BaseSqlDriver.RowResult({column: value for column, value in row.items()})
+                        for row in rows
+                    ]
+
     def execute_query_raw(self, query: str) -> Optional[list[dict[str, any]]]:
         with self.engine.connect() as con:
             results = con.execute(text(query))
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterator, Optional
 import sqlalchemy
 from sqlalchemy.engine import Engine
 from griptape.drivers import BaseSqlDriver
@@ -23,6 +23,15 @@ class SqlDriver(BaseSqlDriver):
         else:
             return None
 
+    def execute_query_pages(self, query: str, page_size: int) -> Iterator[list[BaseSqlDriver.RowResult]]:
+        with self.engine.begin() as con:
+            # Streaming uses server-side cursors on databases that support them.
+            results = con.execution_options(stream_results=True).execute(text(query))
+
+            if results.returns_rows:
+                while rows := results.fetchmany(page_size):
+                    yield [BaseSqlDriver.RowResult({column: value for column, value in row.items()}) for row in rows]
+
     def execute_query_raw(self, query: str) -> Optional[list[dict[str, any]]]:
         with self.engine.begin() as con:
             results = con.execute(text(query))
@@ -0,0 +1,18 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+from attr import define
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+
+
+@define
+class BaseTaskCacheDriver(ABC):
+    @abstractmethod
+    def store(self, key: str, output: BaseArtifact) -> None:
+        ...
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[BaseArtifact]:
+        ...
@@ -0,0 +1,42 @@
+from __future__ import annotations
+import os
+from typing import Optional
+from attr import define, field
+from griptape.artifacts import BaseArtifact
+from griptape.drivers import BaseTaskCacheDriver
+
+
+@define
+class LocalTaskCacheDriver(BaseTaskCacheDriver):
+    """Caches task outputs in memory and, if `dir_path` is set, in files that persist across processes.
+
+    Attributes:
+        entries: Serialized task outputs by cache key.
+        dir_path: Optional directory task outputs are stored in, one file per cache key.
+    """
+
+    entries: dict[str, str] = field(factory=dict, kw_only=True)
+    dir_path: Optional[str] = field(default=None, kw_only=True)
+
+    def store(self, key: str, output: BaseArtifact) -> None:
+        value = output.to_json()
+
+        self.entries[key] = value
+
+        if self.dir_path is not None:
+            os.makedirs(self.dir_path, exist_ok=True)
+
+            with open(self.__file_path(key), "w") as file:
+                file.write(value)
+
+    def load(self, key: str) -> Optional[BaseArtifact]:
+        value = self.entries.get(key)
+
+        if value is None and self.dir_path is not None and os.path.exists(self.__file_path(key)):
+            with open(self.__file_path(key), "r") as file:
+                value = self.entries[key] = file.read()
+
+        return None if value is None else BaseArtifact.from_json(value)
+
+    def __file_path(self, key: str) -> str:
+        return os.path.join(self.dir_path, f"{key}.json")
@@ -0,0 +1,144 @@
+from __future__ import annotations
+import copy
+import io
+import pickle
+import threading
+from abc import ABC, abstractmethod
+from concurrent import futures
+from typing import TYPE_CHECKING
+from attr import define, fields
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.drivers import BaseTaskExecutionDriver
+from griptape.events import StartTaskEvent, FinishTaskEvent
+
+if TYPE_CHECKING:
+    from griptape.structures import Structure
+    from griptape.tasks import BaseTask
+
+
+@define
+class BaseRemoteTaskExecutionDriver(BaseTaskExecutionDriver, ABC):
+    """Base class for drivers that execute tasks in workers that don't share memory with the structure.
+
+    A task is sent to a worker as a payload: the task ID and a pickled copy of its structure with the structure
+    configuration, like drivers, rules, and memory, but only the task, its parents, and its children, so that payloads
+    don't grow with the structure. The worker executes the task with `execute_payload` and sends back the task output
+    serialized with the artifact schemas, which is then set on the task in the original structure. Tasks in the worker
+    can't look up tasks further away than their parents and children.
+
+    Executors and locks in the structure are replaced with new ones in the worker, but all other drivers and tools
+    of the structure have to be picklable. Event listeners aren't sent to the worker: task start and finish events
+    are published by the original structure and all other events are dropped. Changes a task makes to its
+    structure in the worker, for example to conversation or tool memory, aren't merged back.
+    """
+
+    def submit(self, task: BaseTask) -> futures.Future[BaseArtifact]:
+        from griptape.tasks import BaseTask
+
+        future = futures.Future()
+
+        future.set_running_or_notify_cancel()
+
+        task.state = BaseTask.State.EXECUTING
+        task.structure.publish_event(StartTaskEvent(task=task))
+
+        try:
+            remote_future = self.submit_payload(self.task_to_payload(task))
+        except Exception as e:
+            remote_future = futures.Future()
+
+            remote_future.set_exception(e)
+
+        remote_future.add_done_callback(lambda f: self.__finish_task(task, future, f))
+
+        return future
+
+    def task_to_payload(self, task: BaseTask) -> bytes:
+        with io.BytesIO() as file:
+            _TaskPayloadPickler(file).dump((self.__payload_structure(task), task.id))
+
+            return file.getvalue()
+
+    @staticmethod
+    def execute_payload(payload: bytes) -> dict:
+        """Executes a task payload in a worker.
+
+        Args:
+            payload: Payload created by `task_to_payload`.
+
+        Returns:
+            The task output serialized with the artifact schemas.
+        """
+        structure, task_id = pickle.loads(payload)
+
+        return structure.find_task(task_id).execute().to_dict()
+
+    @abstractmethod
+    def submit_payload(self, payload: bytes) -> futures.Future[dict]:
+        """Sends a task payload to a worker.
+
+        Args:
+            payload: Payload created by `task_to_payload`.
+
+        Returns:
+            A future that resolves to the result of `execute_payload` in the worker.
+        """
+        ...
+
+    def __payload_structure(self, task: BaseTask) -> Structure:
+        structure = copy.copy(task.structure)
+
+        structure.tasks = []
+        structure._tasks_by_id = {}
+
+        for payload_task in [task, *task.parents, *task.children]:
+            payload_task = copy.copy(payload_task)
+            payload_task.structure = structure
+
+            structure.tasks.append(payload_task)
+
+        return structure
+
+    def __finish_task(self, task: BaseTask, future: futures.Future, remote_future: futures.Future) -> None:
+        from griptape.tasks import BaseTask
+
+        try:
+            task.output = BaseArtifact.from_dict(remote_future.result())
+        except Exception as e:
+            task.structure.logger.error(f"{task.__class__.__name__} {task.id}\n{e}", exc_info=True)
+
+            task.output = ErrorArtifact(str(e))
+        finally:
+            task.state = BaseTask.State.FINISHED
+            task.structure.publish_event(FinishTaskEvent(task=task))
+
+            future.set_result(task.output)
+
+
+class _TaskPayloadPickler(pickle.Pickler):
+    LOCK_FACTORIES = {type(threading.Lock()): threading.Lock, type(threading.RLock()): threading.RLock}
+
+    def reducer_override(self, obj):
+        from griptape.structures import Structure
+
+        if isinstance(obj, futures.Executor):
+            return futures.ThreadPoolExecutor, ()
+        elif type(obj) in self.LOCK_FACTORIES:
+            # Lock types can't be looked up by name, so locks are recreated with their factory functions.
+            return self.LOCK_FACTORIES[type(obj)], ()
+        elif isinstance(obj, Structure):
+            state = {f.name: getattr(obj, f.name) for f in fields(type(obj))}
+            state["event_listeners"] = type(obj.event_listeners)()
+            state["checkpoint_driver"] = None
+            state["_logger"] = None
+
+            # Structures and their tasks reference each other, so the structure has to be created before its state
+            # is pickled.
+            return object.__new__, (type(obj),), state, None, None, _set_attributes
+        else:
+            return NotImplemented
+
+
+def _set_attributes(obj: object, state: dict) -> None:
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from concurrent import futures
+from typing import TYPE_CHECKING
+from attr import define
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+    from griptape.tasks import BaseTask
+
+
+@define
+class BaseTaskExecutionDriver(ABC):
+    @abstractmethod
+    def submit(self, task: BaseTask) -> futures.Future[BaseArtifact]:
+        """Starts executing a task of a structure.
+
+        Args:
+            task: Task to execute. Its parents have to be finished.
+
+        Returns:
+            A future that resolves to the task output once the task is finished and its state and output are set.
+        """
+        ...
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from concurrent import futures
+from typing import TYPE_CHECKING
+from attr import define, field, Factory
+from griptape.drivers import BaseTaskExecutionDriver
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+    from griptape.tasks import BaseTask
+
+
+@define
+class LocalTaskExecutionDriver(BaseTaskExecutionDriver):
+    """Executes tasks on an executor in the same process, sharing memory with their structure.
+
+    Attributes:
+        futures_executor: Executor tasks are executed on.
+    """
+
+    futures_executor: futures.Executor = field(
+        default=Factory(lambda: futures.ThreadPoolExecutor()),
+        kw_only=True
+    )
+
+    def submit(self, task: BaseTask) -> futures.Future[BaseArtifact]:
+        return self.futures_executor.submit(task.execute)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from concurrent import futures
+from attr import define, field, Factory
+from griptape.drivers import BaseRemoteTaskExecutionDriver
+
+
+@define
+class ProcessPoolTaskExecutionDriver(BaseRemoteTaskExecutionDriver):
+    """Executes tasks in a pool of local worker processes, so that CPU-bound tasks can use multiple cores.
+
+    Also serves as a local stand-in for remote workers, since tasks are sent to the worker processes the same way.
+
+    Attributes:
+        futures_executor: Process pool tasks are executed on.
+    """
+
+    futures_executor: futures.Executor = field(
+        default=Factory(lambda: futures.ProcessPoolExecutor()),
+        kw_only=True
+    )
+
+    def submit_payload(self, payload: bytes) -> futures.Future[dict]:
+        return self.futures_executor.submit(self.execute_payload, payload)
@@ -1,3 +1,4 @@
+import threading
 from typing import Optional, Callable
 from numpy import dot
 from numpy.linalg import norm
@@ -6,13 +7,16 @@ from griptape.drivers import BaseVectorStoreDriver
 from attr import define, field
 
 
+def cosine_similarity(x: list[float], y: list[float]) -> float:
+    return dot(x, y) / (norm(x) * norm(y))
+
+
 @define
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
     entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict, kw_only=True)
-    relatedness_fn: Callable = field(
-        default=lambda x, y: dot(x, y) / (norm(x) * norm(y)),
-        kw_only=True
-    )
+    relatedness_fn: Callable = field(default=cosine_similarity, kw_only=True)
+    # Concurrent tool actions can write to the same store while others read it.
+    _entries_lock: threading.Lock = field(factory=threading.Lock, init=False)
 
     def upsert_vector(
             self,
@@ -24,20 +28,23 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         vector_id = vector_id if vector_id else utils.str_to_hash(str(vector))
 
-        self.entries[self._namespaced_vector_id(vector_id, namespace)] = self.Entry(
+        entry = self.Entry(
             id=vector_id,
             vector=vector,
             meta=meta,
             namespace=namespace
         )
 
+        with self._entries_lock:
+            self.entries[self._namespaced_vector_id(vector_id, namespace)] = entry
+
         return vector_id
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         return self.entries.get(self._namespaced_vector_id(vector_id, namespace), None)
 
     def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        return [entry for key, entry in self.__entries() if namespace is None or entry.namespace == namespace]
 
     def query(
             self,
@@ -50,9 +57,9 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         query_embedding = self.embedding_driver.embed_string(query)
 
         if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
+            entries = {k: v for (k, v) in self.__entries() if k.startswith(f"{namespace}-")}
         else:
-            entries = self.entries
+            entries = dict(self.__entries())
 
         entries_and_relatednesses = [
             (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in entries.values()
@@ -76,3 +83,7 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
 
     def _namespaced_vector_id(self, vector_id: str, namespace: Optional[str]):
         return vector_id if namespace is None else f"{namespace}-{vector_id}"
+
+    def __entries(self) -> list[tuple[str, BaseVectorStoreDriver.Entry]]:
+        with self._entries_lock:
+            return list(self.entries.items())
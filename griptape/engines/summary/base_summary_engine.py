@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 from attr import define
 from griptape.artifacts import TextArtifact, ListArtifact
 
@@ -12,6 +13,9 @@ class BaseSummaryEngine(ABC):
             )
         ).value
 
+    def summarize_text_stream(self, chunks: Iterable[str]) -> str:
+        return self.summarize_text("".join(chunks))
+
     @abstractmethod
     def summarize_artifacts(self, artifacts: ListArtifact) -> TextArtifact:
         ...
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Iterable
 from attr import define, Factory, field
 from griptape.artifacts import TextArtifact, BaseArtifact, ListArtifact
 from griptape.chunkers import BaseChunker, TextChunker
@@ -53,6 +53,32 @@ class PromptSummaryEngine(BaseSummaryEngine):
             self.max_token_multiplier
         )
 
+    def summarize_text_stream(self, chunks: Iterable[str]) -> str:
+        """Summarizes text while it's being generated.
+
+        Whenever the text that hasn't been summarized yet exceeds the chunker limit, all of its chunks but the last
+        are summarized, so that most of the summarizing happens before the text is complete.
+        """
+        tokenizer = self.prompt_driver.tokenizer
+        text = ""
+        text_tokens = 0
+        summary = None
+
+        for chunk in chunks:
+            text += chunk
+            text_tokens += tokenizer.token_count(chunk)
+
+            if text_tokens > self.max_chunker_tokens:
+                text_chunks = self.chunker.chunk(text)
+
+                for text_chunk in text_chunks[:-1]:
+                    summary = self.summarize_chunk(text_chunk.value, summary)
+
+                text = text_chunks[-1].value
+                text_tokens = tokenizer.token_count(text)
+
+        return self.summarize_artifacts_rec([TextArtifact(text)], summary).value
+
     def summarize_artifacts(self, artifacts: ListArtifact) -> TextArtifact:
         return self.summarize_artifacts_rec(artifacts.value, None)
 
@@ -73,16 +99,19 @@ class PromptSummaryEngine(BaseSummaryEngine):
         else:
             chunks = self.chunker.chunk(artifacts_text)
 
-            partial_text = self.template_generator.render(
-                summary=summary,
-                text=chunks[0].value
-            )
-
             return self.summarize_artifacts_rec(
                 chunks[1:],
-                self.prompt_driver.run(
-                    PromptStack(
-                        inputs=[PromptStack.Input(partial_text, role=PromptStack.USER_ROLE)]
-                    )
-                ).value
+                self.summarize_chunk(chunks[0].value, summary)
+            )
+
+    def summarize_chunk(self, text: str, summary: Optional[str]) -> str:
+        partial_text = self.template_generator.render(
+            summary=summary,
+            text=text
+        )
+
+        return self.prompt_driver.run(
+            PromptStack(
+                inputs=[PromptStack.Input(partial_text, role=PromptStack.USER_ROLE)]
             )
+        ).value
@@ -5,6 +5,7 @@ from .start_subtask_event import StartSubtaskEvent
 from .finish_subtask_event import FinishSubtaskEvent
 from .start_prompt_event import StartPromptEvent
 from .finish_prompt_event import FinishPromptEvent
+from .completion_chunk_event import CompletionChunkEvent
 
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "FinishSubtaskEvent",
     "StartPromptEvent",
     "FinishPromptEvent",
+    "CompletionChunkEvent",
 ]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterator, Optional
 from attr import define, field
 from griptape import utils
 from griptape.artifacts import CsvRowArtifact
@@ -20,8 +20,16 @@ class SqlLoader(BaseLoader):
             for query in select_queries
         })
 
+    def iter_pages(self, select_query: str, page_size: int) -> Iterator[list[CsvRowArtifact]]:
+        """Yields the rows of a query in pages of up to `page_size` rows, so that large results can be consumed
+        without loading all rows."""
+        for rows in self.sql_driver.execute_query_pages(select_query, page_size):
+            yield self._rows_to_artifacts(rows)
+
     def _load_query(self, query: str) -> list[CsvRowArtifact]:
-        rows = self.sql_driver.execute_query(query)
+        return self._rows_to_artifacts(self.sql_driver.execute_query(query))
+
+    def _rows_to_artifacts(self, rows: Optional[list[BaseSqlDriver.RowResult]]) -> list[CsvRowArtifact]:
         artifacts = []
 
         if rows:
@@ -1,46 +1,343 @@
+from __future__ import annotations
+import asyncio
+import email.utils
 import json
 import logging
-from attr import define
+import queue
+import threading
+from concurrent import futures
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import AsyncIterator, Iterable, Iterator, Mapping, Optional
+import aiohttp
+import requests
+from attr import define, field, Factory
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception_type, stop_after_attempt, wait_exponential
 from griptape import utils
 from griptape.artifacts import TextArtifact
+from griptape.utils import HttpResponseCache
 from griptape.loaders import TextLoader
 import trafilatura
 
 
+@lru_cache(maxsize=None)
+def _trafilatura_config():
+    config = trafilatura.settings.use_config()
+
+    # This disables signal, so that trafilatura can work on any thread:
+    # More info: https://trafilatura.readthedocs.io/usage-python.html#disabling-signal
+    config.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+
+    # Disable error logging in trafilatura as it sometimes logs errors from lxml, even though
+    # the end result of page parsing is successful.
+    logging.getLogger("trafilatura").setLevel(logging.FATAL)
+
+    return config
+
+
+def _extract_page(content: bytes, include_links: bool) -> dict:
+    # Module-level, so that it can run in a process pool.
+    return json.loads(
+        trafilatura.extract(
+            content,
+            include_links=include_links,
+            output_format="json",
+            config=_trafilatura_config()
+        )
+    )
+
+
 @define
 class WebLoader(TextLoader):
+    """Loads the text of web pages.
+
+    Pages are downloaded with a pooled HTTP session and kept in a cache by URL. Cached pages are used without a
+    request for `page_cache_ttl` seconds and revalidated afterwards with a conditional request that uses the `ETag`
+    and `Last-Modified` headers of the cached response, so unchanged pages aren't downloaded and extracted again.
+
+    Collections of pages are downloaded with an asyncio fetcher and extracted in `extraction_executor`, see
+    `aiter_collection`.
+
+    Attributes:
+        session: HTTP session that pools connections across requests.
+        timeout: Request timeout in seconds.
+        page_cache_ttl: Seconds that cached pages are used without revalidation.
+        max_cached_pages: Maximum number of cached pages. The least recently used pages are evicted first. Set to 0
+            to disable the cache.
+        extraction_executor: Executor that extracts text from the pages of collections. Defaults to
+            `futures_executor`. Extraction is CPU-bound, so a `ProcessPoolExecutor` that is shared across loaders can
+            speed it up. Since collections are loaded on a background thread, the process pool should use the "spawn"
+            or "forkserver" start method instead of forking.
+        max_concurrency: Maximum number of pages of a collection that are loaded at the same time.
+        max_connections_per_host: Maximum number of connections to the same host when loading collections.
+        max_fetch_attempts: Maximum number of download attempts for pages of collections. Connection errors,
+            timeouts, and 429 and 5xx responses are retried with exponential backoff, or after the delay in the
+            `Retry-After` header of the response if it's longer.
+        min_retry_delay: Minimum delay in seconds between download attempts.
+        max_retry_delay: Maximum delay in seconds between download attempts.
+    """
+
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    session: requests.Session = field(
+        default=Factory(lambda self: self.default_session(), takes_self=True),
+        kw_only=True
+    )
+    timeout: float = field(default=30, kw_only=True)
+    page_cache_ttl: float = field(default=300, kw_only=True)
+    max_cached_pages: int = field(default=128, kw_only=True)
+    extraction_executor: futures.Executor = field(
+        default=Factory(lambda self: self.futures_executor, takes_self=True),
+        kw_only=True
+    )
+    max_concurrency: int = field(default=32, kw_only=True)
+    max_connections_per_host: int = field(default=4, kw_only=True)
+    max_fetch_attempts: int = field(default=3, kw_only=True)
+    min_retry_delay: float = field(default=1, kw_only=True)
+    max_retry_delay: float = field(default=10, kw_only=True)
+    _page_cache: HttpResponseCache = field(
+        default=Factory(
+            lambda self: HttpResponseCache(ttl=self.page_cache_ttl, max_size=self.max_cached_pages), takes_self=True
+        ),
+        init=False
+    )
+    _extracted_pages_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
     def load(self, url: str, include_links: bool = True) -> list[TextArtifact]:
         return self._load_page_to_artifacts(url, include_links)
 
     def load_collection(self, urls: list[str], include_links: bool = True) -> dict[str, list[TextArtifact]]:
-        return utils.execute_futures_dict({
-            utils.str_to_hash(u): self.futures_executor.submit(self._load_page_to_artifacts, u, include_links)
-            for u in urls
-        })
+        artifacts = dict(self.iter_collection(urls, include_links))
+
+        return {utils.str_to_hash(u): artifacts[u] for u in urls}
+
+    def iter_collection(
+            self,
+            urls: Iterable[str],
+            include_links: bool = True,
+            ignore_errors: bool = False
+    ) -> Iterator[tuple[str, list[TextArtifact]]]:
+        """Loads pages with `aiter_collection` on a background event loop and yields them as they are loaded.
+
+        Stopping the iteration early cancels the remaining downloads.
+        """
+        results = queue.Queue()
+        started = threading.Event()
+        context = {}
+
+        async def produce() -> None:
+            context["loop"] = asyncio.get_running_loop()
+            context["task"] = asyncio.current_task()
+
+            started.set()
+
+            try:
+                async for url, artifacts in self.aiter_collection(urls, include_links, ignore_errors):
+                    results.put((url, artifacts, None))
+            except Exception as e:
+                results.put((None, None, e))
+            finally:
+                results.put(None)
+
+        thread = threading.Thread(target=asyncio.run, args=(produce(),), daemon=True)
+
+        thread.start()
+        started.wait()
+
+        try:
+            while (result := results.get()) is not None:
+                url, artifacts, error = result
+
+                if error is not None:
+                    raise error
+
+                yield url, artifacts
+        finally:
+            if thread.is_alive():
+                try:
+                    context["loop"].call_soon_threadsafe(context["task"].cancel)
+                except RuntimeError:
+                    # The loop closed in the meantime.
+                    pass
+
+            thread.join()
+
+    async def aiter_collection(
+            self,
+            urls: Iterable[str],
+            include_links: bool = True,
+            ignore_errors: bool = False
+    ) -> AsyncIterator[tuple[str, list[TextArtifact]]]:
+        """Loads pages concurrently and yields URLs and artifacts in the order pages finish loading.
+
+        URLs are read lazily, so `urls` can be a generator. Pages are downloaded by `max_concurrency` workers,
+        extracted in `extraction_executor`, and chunked in `futures_executor`, so results can be processed further,
+        for example embedded, while other pages are still loading.
+
+        Args:
+            urls: URLs of the pages.
+            include_links: Whether to include links in the page text.
+            ignore_errors: Whether to log and skip pages that fail to load instead of raising the error.
+        """
+        loop = asyncio.get_running_loop()
+        url_iterator = iter(urls)
+        results = asyncio.Queue(maxsize=self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.max_connections_per_host)
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=trafilatura.downloads.DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as session:
+            async def worker() -> None:
+                for url in url_iterator:
+                    try:
+                        page = await self.__aextract_page(session, url, include_links)
+                        artifacts = await loop.run_in_executor(
+                            self.futures_executor, self.text_to_artifacts, page.get("text")
+                        )
+
+                        await results.put((url, artifacts, None))
+                    except Exception as e:
+                        await results.put((url, None, e))
+
+                await results.put(None)
+
+            workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+            finished_worker_count = 0
+
+            try:
+                while finished_worker_count < len(workers):
+                    result = await results.get()
+
+                    if result is None:
+                        finished_worker_count += 1
+
+                        continue
+
+                    url, artifacts, error = result
+
+                    if error is None:
+                        yield url, artifacts
+                    elif ignore_errors:
+                        logging.warning(f"Can't load {url}: {error}")
+                    else:
+                        raise error
+            finally:
+                for worker_task in workers:
+                    worker_task.cancel()
+
+                await asyncio.gather(*workers, return_exceptions=True)
 
     def _load_page_to_artifacts(self, url: str, include_links: bool = True) -> list[TextArtifact]:
         return self.text_to_artifacts(self.extract_page(url, include_links).get('text'))
 
     def extract_page(self, url: str, include_links: bool = True) -> dict:
-        config = trafilatura.settings.use_config()
-        page = trafilatura.fetch_url(url, no_ssl=True)
+        cached_page = self.__fetch_page(url)
+        page = self.__get_extracted_page(cached_page, include_links)
 
-        # This disables signal, so that trafilatura can work on any thread:
-        # More info: https://trafilatura.readthedocs.io/usage-python.html#disabling-signal
-        config.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+        if page is None:
+            page = _extract_page(cached_page.content, include_links)
 
-        # Disable error logging in trafilatura as it sometimes logs errors from lxml, even though
-        # the end result of page parsing is successful.
-        logging.getLogger("trafilatura").setLevel(logging.FATAL)
+            self.__set_extracted_page(cached_page, include_links, page)
 
-        if page is None:
-            raise Exception("can't access URL")
+        return page
+
+    def clear_page_cache(self) -> None:
+        self._page_cache.clear()
+
+    def default_session(self) -> requests.Session:
+        session = requests.Session()
+
+        session.headers.update(trafilatura.downloads.DEFAULT_HEADERS)
+
+        return session
+
+    def __fetch_page(self, url: str) -> HttpResponseCache.Entry:
+        cached_page = self._page_cache.get(url)
+
+        if cached_page is not None and self._page_cache.is_fresh(cached_page):
+            return cached_page
+
+        response = self.session.get(
+            url, headers=self._page_cache.conditional_headers(cached_page), timeout=self.timeout
+        )
+
+        return self.__cache_response(url, cached_page, response.status_code, response.content, response.headers)
+
+    async def __afetch_page(self, session: aiohttp.ClientSession, url: str) -> HttpResponseCache.Entry:
+        cached_page = self._page_cache.get(url)
+
+        if cached_page is not None and self._page_cache.is_fresh(cached_page):
+            return cached_page
+
+        async for attempt in AsyncRetrying(
+            wait=self.__retry_wait,
+            retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+            stop=stop_after_attempt(self.max_fetch_attempts),
+            reraise=True
+        ):
+            with attempt:
+                async with session.get(url, headers=self._page_cache.conditional_headers(cached_page)) as response:
+                    if response.status in self.RETRY_STATUS_CODES:
+                        response.raise_for_status()
+
+                    content = await response.read()
+
+                    return self.__cache_response(url, cached_page, response.status, content, response.headers)
+
+    def __retry_wait(self, retry_state: RetryCallState) -> float:
+        delay = wait_exponential(min=self.min_retry_delay, max=self.max_retry_delay)(retry_state)
+        error = retry_state.outcome.exception()
+        retry_after = error.headers.get("Retry-After") if getattr(error, "headers", None) else None
+
+        if retry_after is None:
+            return delay
+        elif retry_after.isdigit():
+            return max(delay, float(retry_after))
         else:
-            return json.loads(
-                trafilatura.extract(
-                    page,
-                    include_links=include_links,
-                    output_format="json",
-                    config=config
-                )
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return delay
+
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+            return max(delay, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    async def __aextract_page(self, session: aiohttp.ClientSession, url: str, include_links: bool) -> dict:
+        cached_page = await self.__afetch_page(session, url)
+        page = self.__get_extracted_page(cached_page, include_links)
+
+        if page is None:
+            page = await asyncio.get_running_loop().run_in_executor(
+                self.extraction_executor, _extract_page, cached_page.content, include_links
             )
+
+            self.__set_extracted_page(cached_page, include_links, page)
+
+        return page
+
+    def __cache_response(
+            self,
+            url: str,
+            cached_page: Optional[HttpResponseCache.Entry],
+            status_code: int,
+            content: bytes,
+            headers: Mapping[str, str]
+    ) -> HttpResponseCache.Entry:
+        cached_page = self._page_cache.put(url, cached_page, status_code, content, headers)
+
+        if cached_page is None:
+            raise Exception("can't access URL")
+
+        return cached_page
+
+    def __get_extracted_page(self, cached_page: HttpResponseCache.Entry, include_links: bool) -> Optional[dict]:
+        with self._extracted_pages_lock:
+            return cached_page.derived_values.get(include_links)
+
+    def __set_extracted_page(self, cached_page: HttpResponseCache.Entry, include_links: bool, page: dict) -> None:
+        with self._extracted_pages_lock:
+            cached_page.derived_values[include_links] = page
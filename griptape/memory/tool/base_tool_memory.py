@@ -1,4 +1,5 @@
 from __future__ import annotations
+import threading
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 from attr import define, field, Factory
@@ -16,6 +17,8 @@ class BaseToolMemory(ActivityMixin, ABC):
         kw_only=True,
     )
     namespace_metadata: dict[str, str] = field(factory=dict, kw_only=True)
+    # Concurrent actions of a ToolkitTask step can process their outputs with the same memory.
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
 
     def process_output(
         self,
@@ -31,22 +31,18 @@ class BlobToolMemory(BaseToolMemory):
 
         if isinstance(output_artifact, BlobArtifact):
             namespace = output_artifact.name
-
-            self.driver.save(namespace, output_artifact)
+            artifacts = [output_artifact]
         elif isinstance(output_artifact, ListArtifact) and output_artifact.is_type(BlobArtifact):
+            namespace = uuid.uuid4().hex if output_artifact.value else None
             artifacts = [v for v in output_artifact.value]
-
-            if artifacts:
-                namespace = uuid.uuid4().hex
-
-                [self.driver.save(namespace, a) for a in artifacts]
-            else:
-                namespace = None
         else:
             namespace = None
 
         if namespace:
-            self.namespace_metadata[namespace] = subtask.action_to_json()
+            with self._lock:
+                [self.driver.save(namespace, a) for a in artifacts]
+
+                self.namespace_metadata[namespace] = subtask.action_to_json()
 
             output = J2("memory/tool.j2").render(
                 memory_name=self.name,
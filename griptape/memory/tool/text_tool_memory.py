@@ -43,26 +43,21 @@ class TextToolMemory(BaseToolMemory, TextMemoryActivitiesMixin):
 
         if isinstance(output_artifact, TextArtifact):
             namespace = output_artifact.name
-
-            self.query_engine.upsert_text_artifact(
-                output_artifact,
-                namespace=namespace
-            )
-        elif isinstance(output_artifact, ListArtifact):
-            if output_artifact.has_items():
-                namespace = uuid.uuid4().hex
-
-                self.query_engine.upsert_text_artifact(
-                    TextArtifact(output_artifact.to_text()),
-                    namespace
-                )
-            else:
-                namespace = None
+            text_artifact = output_artifact
+        elif isinstance(output_artifact, ListArtifact) and output_artifact.has_items():
+            namespace = uuid.uuid4().hex
+            text_artifact = TextArtifact(output_artifact.to_text())
         else:
             namespace = None
 
         if namespace:
-            self.namespace_metadata[namespace] = subtask.action_to_json()
+            with self._lock:
+                self.query_engine.upsert_text_artifact(
+                    text_artifact,
+                    namespace=namespace
+                )
+
+                self.namespace_metadata[namespace] = subtask.action_to_json()
 
             output = J2("memory/tool.j2").render(
                 memory_name=self.name,
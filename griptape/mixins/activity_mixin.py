@@ -1,7 +1,10 @@
-import inspect
+import re
+from functools import lru_cache
 from typing import Optional
-from attr import define, field
+from attr import define, field, fields, has
 from jinja2 import Template
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from schema import Schema
 
 
@@ -9,6 +12,7 @@ from schema import Schema
 class ActivityMixin:
     allowlist: Optional[list[str]] = field(default=None, kw_only=True)
     denylist: Optional[list[str]] = field(default=None, kw_only=True)
+    _activity_descriptions: dict[str, tuple[str, str]] = field(factory=dict, init=False, repr=False, eq=False)
 
     @allowlist.validator
     def validate_allowlist(self, _, allowlist: Optional[list[str]]) -> None:
@@ -40,19 +44,12 @@ class ActivityMixin:
         self.allowlist = []
         self.denylist = None
 
-    # This method has to remain a method and can't be decorated with @property because
-    # of the max depth recursion issue in `inspect.getmembers`.
     def activities(self) -> list[callable]:
-        methods = []
-
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            allowlist_condition = self.allowlist is None or name in self.allowlist
-            denylist_condition = self.denylist is None or name not in self.denylist
-
-            if getattr(method, "is_activity", False) and allowlist_condition and denylist_condition:
-                methods.append(method)
-
-        return methods
+        return [
+            getattr(self, name) for name in _activity_names(self.__class__)
+            if (self.allowlist is None or name in self.allowlist)
+            and (self.denylist is None or name not in self.denylist)
+        ]
 
     def find_activity(self, name: str) -> Optional[callable]:
         for method in self.activities():
@@ -68,12 +65,31 @@ class ActivityMixin:
             return activity.name
 
     def activity_description(self, activity: callable) -> str:
+        """Renders the activity description.
+
+        Description templates are compiled once. Rendered descriptions are cached until one of the attrs fields they
+        reference as `_self.<field>` changes. Descriptions that use `_self` in other ways, for example to read
+        properties or call methods, are rendered every time, since checking those would cost as much as rendering.
+        """
         if activity is None or not getattr(activity, "is_activity", False):
             raise Exception("This method is not an activity.")
-        else:
-            return Template(activity.config["description"]).render({
-                "_self": self
-            })
+
+        template, attribute_names = _activity_description_template(activity.config["description"])
+
+        if attribute_names is None or not set(attribute_names).issubset(_field_names(self.__class__)):
+            return template.render({"_self": self})
+
+        values = repr(tuple(getattr(self, name) for name in attribute_names))
+        cached_description = self._activity_descriptions.get(activity.name)
+
+        if cached_description is not None and cached_description[0] == values:
+            return cached_description[1]
+
+        description = template.render({"_self": self})
+
+        self._activity_descriptions[activity.name] = (values, description)
+
+        return description
 
     def activity_uses_default_memory(self, activity: callable) -> bool:
         if activity is None or not getattr(activity, "is_activity", False):
@@ -82,16 +98,18 @@ class ActivityMixin:
             return activity.config["uses_default_memory"]
 
     def activity_schema(self, activity: callable) -> Optional[dict]:
+        """Returns the JSON schema of the activity input. Schemas are cached, so they must not be modified."""
         if activity is None or not getattr(activity, "is_activity", False):
             raise Exception("This method is not an activity.")
-        elif activity.config["schema"]:
-            full_schema = {
-                "values": activity.config["schema"].schema if activity.config["schema"] else {}
-            }
+        else:
+            return _activity_json_schema(getattr(activity, "__func__", activity))
 
-            return Schema(full_schema).json_schema("InputSchema")
+    def activity_validator(self, activity: callable) -> Optional[Validator]:
+        """Returns a cached JSON schema validator of the activity input."""
+        if activity is None or not getattr(activity, "is_activity", False):
+            raise Exception("This method is not an activity.")
         else:
-            return None
+            return _activity_validator(getattr(activity, "__func__", activity))
 
     def _validate_tool_activity(self, activity_name):
         tool = self.__class__
@@ -102,3 +120,52 @@ class ActivityMixin:
             raise ValueError(
                 f"activity {activity_name} is not a valid activity for {tool}"
             )
+
+
+@lru_cache(maxsize=None)
+def _activity_names(cls: type) -> tuple[str, ...]:
+    # Looking activities up on the class avoids evaluating instance properties.
+    return tuple(
+        name for name in sorted(dir(cls)) if getattr(getattr(cls, name, None), "is_activity", False)
+    )
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in fields(cls)) if has(cls) else frozenset()
+
+
+@lru_cache(maxsize=None)
+def _activity_description_template(description: str) -> tuple[Template, Optional[tuple[str, ...]]]:
+    # Returns the compiled template and the attributes it references, or `None` if it uses `_self` other than for
+    # reading attributes.
+    references = re.findall(r"\b_self\b(\.(\w+)(\s*\()?)?", description)
+
+    if any(not attribute or call for _, attribute, call in references):
+        attribute_names = None
+    else:
+        attribute_names = tuple(sorted({attribute for _, attribute, _ in references}))
+
+    return Template(description), attribute_names
+
+
+@lru_cache(maxsize=None)
+def _activity_json_schema(activity: callable) -> Optional[dict]:
+    if activity.config["schema"]:
+        return Schema({"values": activity.config["schema"].schema}).json_schema("InputSchema")
+    else:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _activity_validator(activity: callable) -> Optional[Validator]:
+    json_schema = _activity_json_schema(activity)
+
+    if json_schema is None:
+        return None
+
+    validator_class = validator_for(json_schema)
+
+    validator_class.check_schema(json_schema)
+
+    return validator_class(json_schema)
@@ -10,10 +10,7 @@ class ExponentialBackoffMixin(ABC):
     min_retry_delay: float = field(default=2, kw_only=True)
     max_retry_delay: float = field(default=10, kw_only=True)
     max_attempts: int = field(default=10, kw_only=True)
-    after_hook: callable = field(
-        default=lambda s: logging.warning(s),
-        kw_only=True
-    )
+    after_hook: callable = field(default=logging.warning, kw_only=True)
     ignored_exception_types: Tuple[Type[Exception], ...] = field(factory=tuple, kw_only=True)
 
     def retrying(self) -> Retrying:
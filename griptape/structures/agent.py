@@ -44,7 +44,7 @@ class Agent(Structure):
 
         task.preprocess(self)
 
-        self.tasks.append(task)
+        self.register_task(task)
 
         return task
 
@@ -1,16 +1,38 @@
 from __future__ import annotations
+import threading
+from concurrent import futures
 from typing import TYPE_CHECKING, Optional
-from attr import define
+from attr import define, field, Factory
 from griptape.artifacts import ErrorArtifact
+from griptape.events import BaseEvent, CompletionChunkEvent
 from griptape.memory.structure import Run
 from griptape.structures import Structure
+from griptape.utils import TextStream
 
 if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
     from griptape.tasks import BaseTask
 
 
 @define
 class Pipeline(Structure):
+    """
+    Attributes:
+        stream: Stream task outputs to child tasks that support it, for example `TextSummaryTask`. Those tasks start
+            as soon as their parent starts and read its output as it's generated. `PromptTask` outputs are streamed
+            in chunks, so their prompt drivers have to support streaming, like `OpenAiChatPromptDriver` and
+            `AmazonBedrockPromptDriver` with `stream=True`. Outputs of other tasks, like `ToolkitTask` final answers,
+            are streamed as a whole once they're finished.
+        futures_executor: Executor tasks are run on when streaming.
+    """
+
+    stream: bool = field(default=False, kw_only=True)
+    futures_executor: futures.Executor = field(
+        default=Factory(lambda: futures.ThreadPoolExecutor()),
+        kw_only=True
+    )
+    _output_streams: threading.local = field(factory=threading.local, init=False)
+
     def first_task(self) -> Optional[BaseTask]:
         return self.tasks[0] if self.tasks else None
 
@@ -31,18 +53,24 @@ class Pipeline(Structure):
         else:
             task.structure = self
 
-            self.tasks.append(task)
+            self.register_task(task)
 
         return task
 
-    def run(self, *args) -> BaseTask:
+    def run(self, *args, resume_from: Optional[str] = None) -> BaseTask:
+        if self.stream:
+            self.__validate_streaming()
+
         self._execution_args = args
 
         [task.reset() for task in self.tasks]
 
+        self.init_checkpoint(resume_from)
+
         self.__run_from_task(self.first_task())
 
-        if self.memory:
+        # Failed runs stop before the last task, which then has no output.
+        if self.memory and self.last_task().output is not None:
             run = Run(
                 input=self.first_task().input.to_text(),
                 output=self.last_task().output.to_text()
@@ -67,11 +95,93 @@ class Pipeline(Structure):
 
         return context
 
+    def publish_event(self, event: BaseEvent) -> None:
+        if isinstance(event, CompletionChunkEvent):
+            output_stream = getattr(self._output_streams, "output_stream", None)
+
+            if output_stream is not None:
+                output_stream.write(event.token)
+
+        super().publish_event(event)
+
+    def __validate_streaming(self) -> None:
+        from griptape.tasks import PromptTask
+
+        for task in self.tasks:
+            child = next(iter(task.children), None)
+
+            if child is not None and child.supports_input_stream and isinstance(task, PromptTask):
+                if not task.active_driver().supports_streaming:
+                    raise ValueError(
+                        f"{task.__class__.__name__} {task.id} can't stream its output to {child.__class__.__name__} "
+                        f"{child.id}: {task.active_driver().__class__.__name__} doesn't support streaming"
+                    )
+
     def __run_from_task(self, task: Optional[BaseTask]) -> None:
-        if task is None:
-            return
+        if self.stream:
+            self.__run_from_task_with_streaming(task)
         else:
-            if isinstance(task.execute(), ErrorArtifact):
-                return
+            while task is not None:
+                if not task.is_finished():
+                    if isinstance(task.execute(), ErrorArtifact):
+                        return
+                    else:
+                        self.store_checkpoint(task)
+
+                task = next(iter(task.children), None)
+
+    def __run_from_task_with_streaming(self, task: Optional[BaseTask]) -> None:
+        running_tasks = {}
+        input_stream = None
+
+        while task is not None:
+            if task.is_finished():
+                input_stream = None
             else:
-                self.__run_from_task(next(iter(task.children), None))
+                if input_stream is not None and task.supports_input_stream:
+                    task.input_stream = input_stream
+                elif not self.__wait_for_tasks(running_tasks):
+                    return
+
+                output_stream = TextStream()
+                future = self.futures_executor.submit(self.__execute_with_output_stream, task, output_stream)
+                running_tasks[future] = task
+                input_stream = output_stream
+
+            task = next(iter(task.children), None)
+
+        self.__wait_for_tasks(running_tasks)
+
+    def __wait_for_tasks(self, running_tasks: dict[futures.Future, BaseTask]) -> bool:
+        futures.wait(running_tasks)
+
+        try:
+            for future, task in running_tasks.items():
+                if isinstance(future.result(), ErrorArtifact):
+                    return False
+                else:
+                    self.store_checkpoint(task)
+
+            return True
+        finally:
+            running_tasks.clear()
+
+    def __execute_with_output_stream(self, task: BaseTask, output_stream: TextStream) -> BaseArtifact:
+        # Prompt drivers publish chunks from the thread that runs the task, so they can be routed to its stream.
+        if task.supports_output_stream:
+            self._output_streams.output_stream = output_stream
+
+        try:
+            output = task.execute()
+        finally:
+            self._output_streams.output_stream = None
+
+        if isinstance(output, ErrorArtifact):
+            output_stream.close(Exception(f"parent task failed: {output.value}"))
+        else:
+            if not output_stream.has_chunks:
+                output_stream.write(output.to_text())
+
+            output_stream.close()
+
+        return output
@@ -1,10 +1,12 @@
 from __future__ import annotations
+import copy
 import logging
+import types
 import uuid
 from abc import ABC, abstractmethod
 from logging import Logger
-from typing import Optional, TYPE_CHECKING, Callable, Type
-from attr import define, field, Factory
+from typing import Optional, TYPE_CHECKING, Any, Callable, Iterable, Type
+from attr import define, field, Factory, fields
 from rich.logging import RichHandler
 from griptape.drivers import BasePromptDriver, OpenAiChatPromptDriver
 from griptape.drivers.embedding.openai_embedding_driver import OpenAiEmbeddingDriver, BaseEmbeddingDriver
@@ -14,12 +16,46 @@ from griptape.rules import Ruleset, Rule
 from griptape.events import BaseEvent
 from griptape.tokenizers import OpenAiTokenizer
 from griptape.engines import VectorQueryEngine, PromptSummaryEngine
-from griptape.drivers import LocalVectorStoreDriver
+from griptape.utils import BatchRun
+from griptape.drivers import LocalVectorStoreDriver, BaseCheckpointDriver, BaseTaskCacheDriver
 
 if TYPE_CHECKING:
     from griptape.tasks import BaseTask
 
 
+def _counts_changes(method_name: str):
+    method = getattr(list, method_name)
+
+    def counting_method(self: _TaskList, *args, **kwargs):
+        self.version += 1
+
+        return method(self, *args, **kwargs)
+
+    return counting_method
+
+
+class _TaskList(list):
+    # List that counts its changes, so that structures know when their task index is out of date.
+    version = 0
+
+    __setitem__ = _counts_changes("__setitem__")
+    __delitem__ = _counts_changes("__delitem__")
+    __iadd__ = _counts_changes("__iadd__")
+    __imul__ = _counts_changes("__imul__")
+    append = _counts_changes("append")
+    extend = _counts_changes("extend")
+    insert = _counts_changes("insert")
+    pop = _counts_changes("pop")
+    remove = _counts_changes("remove")
+    clear = _counts_changes("clear")
+    sort = _counts_changes("sort")
+    reverse = _counts_changes("reverse")
+
+
+def _to_task_list(tasks: list[BaseTask]) -> _TaskList:
+    return tasks if isinstance(tasks, _TaskList) else _TaskList(tasks)
+
+
 @define
 class Structure(ABC):
     LOGGER_NAME = "griptape"
@@ -37,7 +73,7 @@ class Structure(ABC):
     )
     rulesets: list[Ruleset] = field(factory=list, kw_only=True)
     rules: list[Rule] = field(factory=list, kw_only=True)
-    tasks: list[BaseTask] = field(factory=list, kw_only=True)
+    tasks: list[BaseTask] = field(factory=list, kw_only=True, converter=_to_task_list)
     custom_logger: Optional[Logger] = field(default=None, kw_only=True)
     logger_level: int = field(default=logging.INFO, kw_only=True)
     event_listeners: list[Callable] | dict[Type[BaseEvent], list[Callable]] = field(factory=list, kw_only=True)
@@ -53,8 +89,13 @@ class Structure(ABC):
         ), takes_self=True),
         kw_only=True
     )
+    checkpoint_driver: Optional[BaseCheckpointDriver] = field(default=None, kw_only=True)
+    checkpoint_id: Optional[str] = field(default=None, init=False)
+    task_cache_driver: Optional[BaseTaskCacheDriver] = field(default=None, kw_only=True)
     _execution_args: tuple = ()
     _logger: Optional[Logger] = None
+    _tasks_by_id: dict[str, BaseTask] = field(factory=dict, init=False)
+    _indexed_tasks: Optional[tuple[list[BaseTask], int]] = field(default=None, init=False)
 
     @tasks.validator
     def validate_tasks(self, _, tasks: list[BaseTask]) -> None:
@@ -115,7 +156,148 @@ class Structure(ABC):
         return any(s for s in self.tasks if s.is_executing())
 
     def find_task(self, task_id: str) -> Optional[BaseTask]:
-        return next((task for task in self.tasks if task.id == task_id), None)
+        return self.__task_index().get(task_id)
+
+    def register_task(self, task: BaseTask) -> BaseTask:
+        """Adds a task to the structure, unless it's already added.
+
+        Raises:
+            ValueError: If the structure has a different task with the same ID.
+        """
+        task_index = self.__task_index()
+        registered_task = task_index.get(task.id)
+
+        if registered_task is None:
+            self.tasks.append(task)
+
+            task_index[task.id] = task
+            self._indexed_tasks = (self.tasks, self.tasks.version)
+        elif registered_task is not task:
+            raise ValueError(f"structure already has a task with ID {task.id}")
+
+        return task
+
+    def init_checkpoint(self, resume_from: Optional[str] = None) -> None:
+        """Starts a new checkpoint for a run or, if `resume_from` is set, resumes an existing one.
+
+        Resuming resets all tasks and restores the ones with a stored output as finished tasks. Checkpoints are
+        matched by task ID, so resuming in a different process requires tasks with explicit IDs.
+
+        Args:
+            resume_from: ID of the checkpoint to resume.
+        """
+        if self.checkpoint_driver is None:
+            if resume_from is not None:
+                raise ValueError("can't resume from a checkpoint without a checkpoint driver")
+
+            return
+
+        if resume_from is None:
+            self.checkpoint_id = uuid.uuid4().hex
+        else:
+            outputs = self.checkpoint_driver.load(resume_from)
+
+            for task in self.tasks:
+                task.reset()
+
+                if task.id in outputs:
+                    task.output = outputs[task.id]
+                    task.state = task.State.FINISHED
+
+            self.checkpoint_id = resume_from
+
+    def copy_for_run(self, memory: Optional[ConversationMemory] = None) -> Structure:
+        """Returns a copy of the structure for a single run.
+
+        The copy shares drivers, tools, executors, and other configuration with the structure, but has its own id,
+        execution args, task states and outputs, checkpoint, and conversation memory, so runs of different copies
+        don't interfere with each other. Tools that keep state per task, like REPL sessions, key it by structure id.
+        Prompt drivers that publish events to the structure are shallow copies that publish to the structure copy
+        instead.
+
+        Args:
+            memory: Conversation memory of the run. Defaults to a view of the structure memory that holds a copy of
+                its runs and isn't stored with the memory driver.
+
+        Returns:
+            The structure copy.
+        """
+        structure = copy.copy(self)
+
+        structure.id = uuid.uuid4().hex
+        structure.prompt_driver = self.__copy_prompt_driver(self.prompt_driver, structure)
+        structure.tasks = []
+        structure._tasks_by_id = {}
+        structure._execution_args = ()
+        structure.checkpoint_id = None
+
+        if memory is None and self.memory is not None:
+            memory = copy.copy(self.memory)
+
+            memory.runs = list(self.memory.runs)
+            memory.driver = None
+
+        structure.memory = memory
+
+        if memory is not None:
+            memory.structure = structure
+
+        for task in self.tasks:
+            task_copy = copy.copy(task).reset()
+
+            self.__rebind_methods(task, task_copy)
+
+            if getattr(task, "prompt_driver", None) is not None:
+                task_copy.prompt_driver = self.__copy_prompt_driver(task.prompt_driver, structure)
+
+            task_copy.parent_ids = list(task.parent_ids)
+            task_copy.child_ids = list(task.child_ids)
+            task_copy.structure = structure
+
+            structure.register_task(task_copy)
+
+        return structure
+
+    def run_isolated(self, *args, memory: Optional[ConversationMemory] = None, **kwargs) -> Structure:
+        """Runs a copy of the structure returned by `copy_for_run`.
+
+        The structure itself isn't modified, so it can serve many concurrent runs, for example from threads or with
+        `asyncio.to_thread`.
+
+        Args:
+            *args: Execution args of the run.
+            memory: Conversation memory of the run.
+            **kwargs: Keyword arguments of `run`.
+
+        Returns:
+            The structure copy, which holds the task outputs of the run.
+        """
+        structure = self.copy_for_run(memory=memory)
+
+        structure.run(*args, **kwargs)
+
+        return structure
+
+    def run_batch(self, inputs: Iterable[Any], concurrency: Optional[int] = None) -> BatchRun:
+        """Returns a batch run that runs the structure once for each input when iterated.
+
+        Results are yielded as runs finish. Runs that fail have an `ErrorArtifact` output and don't stop the batch.
+
+        Args:
+            inputs: Inputs to run the structure with. Each input is passed to `run` as its only execution arg.
+            concurrency: Maximum number of concurrent runs. Defaults to `BatchRun.DEFAULT_CONCURRENCY`.
+
+        Returns:
+            The batch run, which also reports progress and throughput.
+        """
+        if concurrency is None:
+            return BatchRun(structure=self, inputs=inputs)
+        else:
+            return BatchRun(structure=self, inputs=inputs, concurrency=concurrency)
+
+    def store_checkpoint(self, task: BaseTask) -> None:
+        if self.checkpoint_driver is not None and self.checkpoint_id is not None:
+            self.checkpoint_driver.store(self.checkpoint_id, task.id, task.output)
 
     def add_tasks(self, *tasks: BaseTask) -> list[BaseTask]:
         return [self.add_task(s) for s in tasks]
@@ -135,6 +317,36 @@ class Structure(ABC):
             "structure": self,
         }
 
+    def __copy_prompt_driver(self, prompt_driver: BasePromptDriver, structure: Structure) -> BasePromptDriver:
+        if prompt_driver.structure is not self:
+            return prompt_driver
+
+        prompt_driver_copy = copy.copy(prompt_driver)
+
+        self.__rebind_methods(prompt_driver, prompt_driver_copy)
+
+        prompt_driver_copy.structure = structure
+
+        return prompt_driver_copy
+
+    def __rebind_methods(self, original: Any, original_copy: Any) -> None:
+        # Attributes that default to bound methods, like template generators, would still call the original.
+        for attribute in fields(type(original)):
+            value = getattr(original_copy, attribute.name)
+
+            if isinstance(value, types.MethodType) and value.__self__ is original:
+                setattr(original_copy, attribute.name, types.MethodType(value.__func__, original_copy))
+
+    def __task_index(self) -> dict[str, BaseTask]:
+        # Rebuild the index if the task list was replaced or changed directly since it was built.
+        indexed_tasks, indexed_version = self._indexed_tasks or (None, None)
+
+        if indexed_tasks is not self.tasks or indexed_version != self.tasks.version:
+            self._tasks_by_id = {task.id: task for task in self.tasks}
+            self._indexed_tasks = (self.tasks, self.tasks.version)
+
+        return self._tasks_by_id
+
     @abstractmethod
     def add_task(self, task: BaseTask) -> BaseTask:
         ...
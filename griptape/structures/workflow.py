@@ -1,8 +1,14 @@
 from __future__ import annotations
 import concurrent.futures as futures
+import heapq
+import itertools
+import math
+from collections import Counter, defaultdict
 from graphlib import TopologicalSorter
+from typing import Optional
 from attr import define, field, Factory
 from griptape.artifacts import ErrorArtifact
+from griptape.drivers import BaseTaskExecutionDriver, LocalTaskExecutionDriver
 from griptape.structures import Structure
 from griptape.tasks import BaseTask
 
@@ -13,6 +19,22 @@ class Workflow(Structure):
         default=Factory(lambda: futures.ThreadPoolExecutor()),
         kw_only=True
     )
+    task_execution_driver: BaseTaskExecutionDriver = field(
+        default=Factory(lambda self: LocalTaskExecutionDriver(futures_executor=self.futures_executor), takes_self=True),
+        kw_only=True
+    )
+    concurrency_limits: dict[str, int] = field(factory=dict, kw_only=True)
+    max_concurrent_tasks: Optional[int] = field(default=None, kw_only=True)
+
+    @concurrency_limits.validator
+    def validate_concurrency_limits(self, _, concurrency_limits: dict[str, int]) -> None:
+        if any(limit < 1 for limit in concurrency_limits.values()):
+            raise ValueError("concurrency limits have to be at least 1")
+
+    @max_concurrent_tasks.validator
+    def validate_max_concurrent_tasks(self, _, max_concurrent_tasks: Optional[int]) -> None:
+        if max_concurrent_tasks is not None and max_concurrent_tasks < 1:
+            raise ValueError("max concurrent tasks has to be at least 1")
 
     def __add__(self, other: BaseTask | list[BaseTask]) -> BaseTask:
         return [self.add_task(o) for o in other] if isinstance(other, list) else self + [other]
@@ -20,29 +42,87 @@ class Workflow(Structure):
     def add_task(self, task: BaseTask) -> BaseTask:
         task.preprocess(self)
 
-        self.tasks.append(task)
+        self.register_task(task)
 
         return task
 
-    def run(self, *args) -> list[BaseTask]:
+    def run(self, *args, resume_from: Optional[str] = None) -> list[BaseTask]:
         self._execution_args = args
-        ordered_tasks = self.order_tasks()
-        exit_loop = False
 
-        while not self.is_finished() and not exit_loop:
-            futures_list = {}
+        self.init_checkpoint(resume_from)
 
-            for task in ordered_tasks:
-                if task.can_execute():
-                    future = self.futures_executor.submit(task.execute)
+        sorter = TopologicalSorter(self.to_graph())
+        critical_path_lengths = self.critical_path_lengths()
+        ready_tasks = []
+        ready_counter = itertools.count()
+        blocked_tasks = defaultdict(list)
+        futures_list = {}
+        futures_resource_tags = {}
+        resource_usage = Counter()
+        exit_loop = False
+
+        sorter.prepare()
+
+        # Tasks become ready as soon as all of their parents are done, so fast branches don't wait for slow ones.
+        # Ready tasks on the longest remaining chain are submitted first, as long as their resources are available.
+        # Tasks whose resources aren't available wait in a queue for one of those resources until it's released.
+        while sorter.is_active() and not exit_loop:
+            for task_id in sorter.get_ready():
+                task = self.find_task(task_id)
+
+                if task.is_pending():
+                    heapq.heappush(
+                        ready_tasks,
+                        (-critical_path_lengths[task_id], next(ready_counter), task, set(task.all_resource_tags))
+                    )
+                else:
+                    sorter.done(task_id)
+
+            self.__unblock_tasks(ready_tasks, blocked_tasks, resource_usage)
+
+            while ready_tasks and (self.max_concurrent_tasks is None or len(futures_list) < self.max_concurrent_tasks):
+                ready_task = heapq.heappop(ready_tasks)
+                task, resource_tags = ready_task[2], ready_task[3]
+                used_tag = next(
+                    (tag for tag in resource_tags if resource_usage[tag] >= self.concurrency_limits.get(tag, math.inf)),
+                    None
+                )
+
+                if used_tag is None:
+                    future = self.task_execution_driver.submit(task)
                     futures_list[future] = task
+                    futures_resource_tags[future] = resource_tags
+
+                    resource_usage.update(resource_tags)
+                else:
+                    heapq.heappush(blocked_tasks[used_tag], ready_task)
+
+                if not ready_tasks:
+                    self.__unblock_tasks(ready_tasks, blocked_tasks, resource_usage)
+
+            if not futures_list:
+                continue
 
-            # Wait for all tasks to complete
-            for future in futures.as_completed(futures_list):
-                if isinstance(future.result(), ErrorArtifact):
+            done, _ = futures.wait(futures_list, return_when=futures.FIRST_COMPLETED)
+
+            for future in done:
+                task = futures_list.pop(future)
+
+                resource_usage.subtract(futures_resource_tags.pop(future))
+
+                if self.__is_failed(future, task):
                     exit_loop = True
+                else:
+                    self.store_checkpoint(task)
+                    sorter.done(task.id)
 
-                    break
+        # Don't submit any more tasks after an error, but let the ones that are already executing finish and
+        # checkpoint them, so that resuming doesn't run them again.
+        futures.wait(futures_list)
+
+        for future, task in futures_list.items():
+            if not self.__is_failed(future, task):
+                self.store_checkpoint(task)
 
         self._execution_args = ()
 
@@ -65,16 +145,43 @@ class Workflow(Structure):
         return [task for task in self.tasks if not task.children]
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
-
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
+        graph: dict[str, set[str]] = {task.id: set() for task in self.tasks}
 
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in self.tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
+    def critical_path_lengths(self) -> dict[str, int]:
+        """Returns the number of tasks on the longest path from each task to an output task, including the task."""
+        lengths: dict[str, int] = {}
+
+        for task in reversed(self.order_tasks()):
+            lengths[task.id] = 1 + max(
+                (lengths[child_id] for child_id in task.child_ids if child_id in lengths),
+                default=0
+            )
+
+        return lengths
+
     def order_tasks(self) -> list[BaseTask]:
         return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
+
+    def __unblock_tasks(self, ready_tasks: list, blocked_tasks: dict[str, list], resource_usage: Counter) -> None:
+        # Moves as many waiting tasks back to the ready tasks as their resources have free slots. A moved task can
+        # still wait for another resource, in which case it's queued for that one.
+        for tag, tag_tasks in blocked_tasks.items():
+            for _ in range(min(len(tag_tasks), self.concurrency_limits[tag] - resource_usage[tag])):
+                heapq.heappush(ready_tasks, heapq.heappop(tag_tasks))
+
+    def __is_failed(self, future: futures.Future, task: BaseTask) -> bool:
+        # Task execution drivers can raise instead of returning an ErrorArtifact, for example if a remote task can't
+        # be submitted. That stops the run like a failed task, so that the tasks that are still executing finish.
+        if future.exception() is not None:
+            self.logger.error(f"{task.__class__.__name__} {task.id}\n{future.exception()}", exc_info=future.exception())
+
+            return True
+        else:
+            return isinstance(future.result(), ErrorArtifact)
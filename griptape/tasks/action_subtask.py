@@ -1,11 +1,13 @@
 from __future__ import annotations
 import json
 import re
+from functools import lru_cache
 from typing import Optional
 import schema
 from attr import define, field
 from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from schema import Schema, Literal
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.tools import BaseTool
@@ -20,7 +22,7 @@ from griptape.events import StartSubtaskEvent, FinishSubtaskEvent
 @define
 class ActionSubtask(PromptTask):
     THOUGHT_PATTERN = r"(?s)^Thought:\s*(.*?)$"
-    ACTION_PATTERN = r"(?s)Action:[^{]*({.*})"
+    ACTION_PATTERN = r"(?s)Action:[^{\[]*({.*}|\[.*\])"
     ANSWER_PATTERN = r"(?s)^Answer:\s?([\s\S]*)$"
 
     parent_task_id: Optional[str] = field(default=None, kw_only=True)
@@ -49,33 +51,37 @@ class ActionSubtask(PromptTask):
     def children(self) -> list[ActionSubtask]:
         return [self.origin_task.find_subtask(child_id) for child_id in self.child_ids]
 
+    @classmethod
+    def split_actions(cls, value: str) -> list[str]:
+        """Splits a prompt output with a list of actions into one prompt output per action.
+
+        Prompt outputs without a list of actions are returned as they are.
+        """
+        action_matches = re.findall(cls.ACTION_PATTERN, value, re.DOTALL)
+
+        if len(action_matches) == 0:
+            return [value]
+
+        try:
+            actions = json.loads(action_matches[-1], strict=False)
+        except ValueError:
+            return [value]
+
+        if not isinstance(actions, list) or len(actions) == 0:
+            return [value]
+
+        thought_matches = re.findall(cls.THOUGHT_PATTERN, value, re.MULTILINE)
+        thought = f"Thought: {thought_matches[-1]}\n" if len(thought_matches) > 0 else ""
+
+        return [f"{thought}Action: {json.dumps(action)}" for action in actions]
+
     @classmethod
     def action_schema(cls, action_types: list) -> Schema:
-        return Schema(
-            description="Actions have type, name, activity, and input value.",
-            schema={
-                Literal(
-                    "type",
-                    description="Action type"
-                ): schema.Or(*action_types),
-                Literal(
-                    "name",
-                    description="Action name"
-                ): str,
-                Literal(
-                    "activity",
-                    description="Action activity"
-                ): str,
-                schema.Optional(
-                    Literal(
-                        "input",
-                        description="Optional action activity input object"
-                    )
-                ): {
-                    schema.Optional("values", description="Optional activity values field"): dict
-                }
-            }
-        )
+        return _action_schema(tuple(action_types))
+
+    @classmethod
+    def action_validator(cls, action_types: list) -> Validator:
+        return _action_validator(tuple(action_types))
 
     def attach_to(self, parent_task: BaseTask):
         self.parent_task_id = parent_task.id
@@ -136,20 +142,14 @@ class ActionSubtask(PromptTask):
         return json.dumps(json_dict)
 
     def add_child(self, child: ActionSubtask) -> ActionSubtask:
-        if child.id not in self.child_ids:
-            self.child_ids.append(child.id)
-
-        if self.id not in child.parent_ids:
-            child.parent_ids.append(self.id)
+        self._add_child_id(child.id)
+        child._add_parent_id(self.id)
 
         return child
 
     def add_parent(self, parent: ActionSubtask) -> ActionSubtask:
-        if parent.id not in self.parent_ids:
-            self.parent_ids.append(parent.id)
-
-        if self.id not in parent.child_ids:
-            parent.child_ids.append(self.id)
+        self._add_parent_id(parent.id)
+        parent._add_child_id(self.id)
 
         return parent
 
@@ -166,10 +166,7 @@ class ActionSubtask(PromptTask):
                 data = action_matches[-1]
                 action_object: dict = json.loads(data, strict=False)
 
-                validate(
-                    instance=action_object,
-                    schema=self.action_schema(self.origin_task.action_types).schema
-                )
+                self.action_validator(self.origin_task.action_types).validate(action_object)
 
                 # Load action type; throw exception if the key is not present
                 if self.action_type is None:
@@ -224,15 +221,51 @@ class ActionSubtask(PromptTask):
 
     def __validate_action_input(self, action_input: dict, mixin: ActivityMixin) -> None:
         try:
-            activity_schema = mixin.activity_schema(getattr(mixin, self.action_activity))
+            activity_validator = mixin.activity_validator(getattr(mixin, self.action_activity))
 
-            if activity_schema:
-                validate(
-                    instance=action_input,
-                    schema=activity_schema
-                )
+            if activity_validator:
+                activity_validator.validate(action_input)
         except ValidationError as e:
             self.structure.logger.error(f"Subtask {self.origin_task.id}\nInvalid activity input JSON: {e}")
 
             self.action_name = "error"
             self.action_input = {"error": f"Activity input JSON validation error: {e}"}
+
+
+@lru_cache(maxsize=None)
+def _action_schema(action_types: tuple[str, ...]) -> Schema:
+    return Schema(
+        description="Actions have type, name, activity, and input value.",
+        schema={
+            Literal(
+                "type",
+                description="Action type"
+            ): schema.Or(*action_types),
+            Literal(
+                "name",
+                description="Action name"
+            ): str,
+            Literal(
+                "activity",
+                description="Action activity"
+            ): str,
+            schema.Optional(
+                Literal(
+                    "input",
+                    description="Optional action activity input object"
+                )
+            ): {
+                schema.Optional("values", description="Optional activity values field"): dict
+            }
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def _action_validator(action_types: tuple[str, ...]) -> Validator:
+    action_schema = _action_schema(action_types).schema
+    validator_class = validator_for(action_schema)
+
+    validator_class.check_schema(action_schema)
+
+    return validator_class(action_schema)
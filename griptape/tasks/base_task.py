@@ -1,9 +1,11 @@
 from __future__ import annotations
+import json
 import uuid
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 from attr import define, field, Factory
+from griptape import utils
 from griptape.events import StartTaskEvent, FinishTaskEvent
 from griptape.artifacts import ErrorArtifact
 
@@ -11,6 +13,17 @@ if TYPE_CHECKING:
     from griptape.artifacts import BaseArtifact
     from griptape.tasks import BaseTask
     from griptape.structures import Structure
+    from griptape.utils import TextStream
+
+
+def _id_set_updater(id_set_name: str):
+    # Keeps the set of IDs in sync when the list of IDs is replaced.
+    def update_id_set(task: BaseTask, _, ids: list[str]) -> list[str]:
+        setattr(task, id_set_name, set(ids))
+
+        return ids
+
+    return update_id_set
 
 
 @define
@@ -22,17 +35,36 @@ class BaseTask(ABC):
 
     id: str = field(default=Factory(lambda: uuid.uuid4().hex), kw_only=True)
     state: State = field(default=State.PENDING, kw_only=True)
-    parent_ids: list[str] = field(factory=list, kw_only=True)
-    child_ids: list[str] = field(factory=list, kw_only=True)
+    parent_ids: list[str] = field(factory=list, kw_only=True, on_setattr=_id_set_updater("_parent_id_set"))
+    child_ids: list[str] = field(factory=list, kw_only=True, on_setattr=_id_set_updater("_child_id_set"))
+    resource_tags: list[str] = field(factory=list, kw_only=True)
 
     output: Optional[BaseArtifact] = field(default=None, init=False)
     structure: Optional[Structure] = field(default=None, init=False)
+    input_stream: Optional[TextStream] = field(default=None, init=False)
+    _parent_id_set: set[str] = field(default=Factory(lambda self: set(self.parent_ids), takes_self=True), init=False)
+    _child_id_set: set[str] = field(default=Factory(lambda self: set(self.child_ids), takes_self=True), init=False)
 
     @property
     @abstractmethod
     def input(self) -> BaseArtifact:
         ...
 
+    @property
+    def all_resource_tags(self) -> list[str]:
+        """Returns tags of the resources the task uses, which structures can limit concurrent use of."""
+        return self.resource_tags
+
+    @property
+    def supports_input_stream(self) -> bool:
+        """Whether the task can start before its parent finishes, reading the parent output from `input_stream`."""
+        return False
+
+    @property
+    def supports_output_stream(self) -> bool:
+        """Whether the task output is generated by a prompt driver that publishes it in `CompletionChunkEvent`s."""
+        return False
+
     @property
     def parents(self) -> list[BaseTask]:
         return [self.structure.find_task(parent_id) for parent_id in self.parent_ids]
@@ -58,17 +90,11 @@ class BaseTask(ABC):
         elif child.structure:
             self.structure = child.structure
 
-        if child not in self.structure.tasks:
-            self.structure.tasks.append(child)
-
-        if self not in self.structure.tasks:
-            self.structure.tasks.append(self)
+        self.structure.register_task(child)
+        self.structure.register_task(self)
 
-        if child.id not in self.child_ids:
-            self.child_ids.append(child.id)
-
-        if self.id not in child.parent_ids:
-            child.parent_ids.append(self.id)
+        self._add_child_id(child.id)
+        child._add_parent_id(self.id)
 
         return child
 
@@ -78,19 +104,24 @@ class BaseTask(ABC):
         elif parent.structure:
             self.structure = parent.structure
 
-        if parent not in self.structure.tasks:
-            self.structure.tasks.append(parent)
+        self.structure.register_task(parent)
+        self.structure.register_task(self)
 
-        if self not in self.structure.tasks:
-            self.structure.tasks.append(self)
+        self._add_parent_id(parent.id)
+        parent._add_child_id(self.id)
 
-        if parent.id not in self.parent_ids:
-            self.parent_ids.append(parent.id)
+        return parent
 
-        if self.id not in parent.child_ids:
-            parent.child_ids.append(self.id)
+    def _add_parent_id(self, parent_id: str) -> None:
+        # Checking the set instead of the list keeps adding edges O(1) for tasks with many parents.
+        if parent_id not in self._parent_id_set:
+            self.parent_ids.append(parent_id)
+            self._parent_id_set.add(parent_id)
 
-        return parent
+    def _add_child_id(self, child_id: str) -> None:
+        if child_id not in self._child_id_set:
+            self.child_ids.append(child_id)
+            self._child_id_set.add(child_id)
 
     def is_pending(self) -> bool:
         return self.state == BaseTask.State.PENDING
@@ -114,7 +145,7 @@ class BaseTask(ABC):
             self.structure.publish_event(StartTaskEvent(task=self))
             self.before_run()
 
-            self.output = self.run()
+            self.output = self.__run_with_cache()
 
             self.after_run()
         except Exception as e:
@@ -130,12 +161,60 @@ class BaseTask(ABC):
     def can_execute(self) -> bool:
         return self.state == BaseTask.State.PENDING and all(parent.is_finished() for parent in self.parents)
 
+    def cache_params(self) -> Optional[dict]:
+        """Returns task configuration the task output depends on, other than its input and parent outputs.
+
+        Returns:
+            JSON-serializable parameters, or `None` if the task output can't be memoized, for example because the
+            task has side effects.
+        """
+        return None
+
+    def cache_key(self) -> Optional[str]:
+        params = self.cache_params()
+
+        if params is None:
+            return None
+
+        return utils.str_to_hash(
+            json.dumps(
+                {
+                    "type": self.__class__.__name__,
+                    "input": self.input.to_text(),
+                    "parent_outputs": [
+                        utils.str_to_hash(parent.output.to_text()) if parent.output else None
+                        for parent in self.parents
+                    ],
+                    "params": params
+                },
+                sort_keys=True
+            )
+        )
+
     def reset(self) -> BaseTask:
         self.state = BaseTask.State.PENDING
         self.output = None
+        self.input_stream = None
 
         return self
 
     @abstractmethod
     def run(self) -> BaseArtifact:
         ...
+
+    def __run_with_cache(self) -> BaseArtifact:
+        cache_driver = self.structure.task_cache_driver
+        cache_key = self.cache_key() if cache_driver else None
+
+        if cache_key is None:
+            return self.run()
+
+        output = cache_driver.load(cache_key)
+
+        if output is None:
+            output = self.run()
+
+            if not isinstance(output, ErrorArtifact):
+                cache_driver.store(cache_key, output)
+
+        return output
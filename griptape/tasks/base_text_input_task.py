@@ -35,7 +35,10 @@ class BaseTextInputTask(BaseTask, ABC):
     def before_run(self) -> None:
         super().before_run()
 
-        self.structure.logger.info(f"{self.__class__.__name__} {self.id}\nInput: {self.input.to_text()}")
+        if self.input_stream is None:
+            self.structure.logger.info(f"{self.__class__.__name__} {self.id}\nInput: {self.input.to_text()}")
+        else:
+            self.structure.logger.info(f"{self.__class__.__name__} {self.id}\nInput: streaming from parent")
 
     def after_run(self) -> None:
         super().after_run()
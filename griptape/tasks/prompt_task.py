@@ -58,6 +58,16 @@ class PromptTask(BaseTextInputTask):
 
         return structure_rulesets + task_rulesets
 
+    @property
+    def all_resource_tags(self) -> list[str]:
+        driver = self.active_driver()
+
+        return super().all_resource_tags + [f"prompt_driver:{driver.__class__.__name__}", f"model:{driver.model}"]
+
+    @property
+    def supports_output_stream(self) -> bool:
+        return self.active_driver().supports_streaming
+
     @property
     def prompt_stack(self) -> PromptStack:
         stack = PromptStack()
@@ -82,6 +92,12 @@ class PromptTask(BaseTextInputTask):
             rulesets=self.all_rulesets
         )
 
+    def cache_params(self) -> Optional[dict]:
+        return {
+            "prompt_driver": self.active_driver().cache_params(),
+            "prompt_stack": [[i.role, i.content] for i in self.prompt_stack.inputs]
+        }
+
     def run(self) -> TextArtifact:
         self.output = self.active_driver().run(self.prompt_stack)
 
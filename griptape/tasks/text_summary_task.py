@@ -1,3 +1,4 @@
+import re
 from attr import define, field, Factory
 from griptape.artifacts import TextArtifact
 from griptape.engines import BaseSummaryEngine, PromptSummaryEngine
@@ -11,7 +12,17 @@ class TextSummaryTask(BaseTextInputTask):
         default=Factory(lambda: PromptSummaryEngine())
     )
 
+    @property
+    def supports_input_stream(self) -> bool:
+        # The streamed parent output is only the same input if the template renders nothing but the parent output.
+        return re.sub(r"\s", "", self.input_template) == "{{parent_output}}"
+
     def run(self) -> TextArtifact:
-        return TextArtifact(
-            self.summary_engine.summarize_text(self.input.to_text())
-        )
+        if self.input_stream is None:
+            return TextArtifact(
+                self.summary_engine.summarize_text(self.input.to_text())
+            )
+        else:
+            return TextArtifact(
+                self.summary_engine.summarize_text_stream(self.input_stream)
+            )
@@ -2,7 +2,7 @@ import json
 from typing import Optional
 from attr import define, field
 from griptape import utils
-from griptape.artifacts import TextArtifact, InfoArtifact
+from griptape.artifacts import BaseArtifact, TextArtifact, InfoArtifact
 from griptape.memory.tool import BaseToolMemory
 from griptape.tasks import PromptTask, ActionSubtask
 from griptape.tools import BaseTool
@@ -15,6 +15,15 @@ class ToolTask(PromptTask, ActionSubtaskOriginMixin):
     tool: BaseTool = field(kw_only=True)
     subtask: Optional[ActionSubtask] = field(default=None, kw_only=True)
 
+    @property
+    def all_resource_tags(self) -> list[str]:
+        return super().all_resource_tags + [f"tool:{self.tool.name}"]
+
+    @property
+    def supports_output_stream(self) -> bool:
+        # The output is the final answer after actions, not the text of every prompt driver run.
+        return False
+
     @property
     def action_types(self) -> list[str]:
         return ["tool"]
@@ -32,6 +41,16 @@ class ToolTask(PromptTask, ActionSubtaskOriginMixin):
             tool=J2("tasks/partials/_tool.j2").render(tool=self.tool)
         )
 
+    def cache_params(self) -> Optional[dict]:
+        # Tool activities can have side effects, so outputs aren't memoized.
+        return None
+
+    def execute(self) -> BaseArtifact:
+        try:
+            return super().execute()
+        finally:
+            self.tool.finish_task(self)
+
     def run(self) -> TextArtifact:
         output = self.active_driver().run(prompt_stack=self.prompt_stack).to_text()
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 import json
+from concurrent import futures
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Callable
 from attr import define, field, Factory
 from griptape import utils
-from griptape.artifacts import TextArtifact, ErrorArtifact
+from griptape.artifacts import BaseArtifact, TextArtifact, ErrorArtifact
 from griptape.tools import BaseTool
 from griptape.utils import PromptStack
 from griptape.mixins import ActionSubtaskOriginMixin
@@ -16,6 +18,11 @@ if TYPE_CHECKING:
     from griptape.structures import Structure
 
 
+@lru_cache(maxsize=None)
+def _default_futures_executor() -> futures.Executor:
+    return futures.ThreadPoolExecutor()
+
+
 @define
 class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
     DEFAULT_MAX_STEPS = 20
@@ -38,6 +45,24 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
         ),
         kw_only=True
     )
+    generate_assistant_step_template: Callable[[list[ActionSubtask]], str] = field(
+        default=Factory(
+            lambda self: self.default_assistant_step_template_generator,
+            takes_self=True
+        ),
+        kw_only=True
+    )
+    generate_user_step_template: Callable[[list[ActionSubtask]], str] = field(
+        default=Factory(
+            lambda self: self.default_user_step_template_generator,
+            takes_self=True
+        ),
+        kw_only=True
+    )
+    # Tasks share one default thread pool for concurrent actions, so creating tasks doesn't leave idle threads behind.
+    futures_executor: futures.Executor = field(default=Factory(_default_futures_executor), kw_only=True)
+    _prompt_stack: Optional[PromptStack] = field(default=None, init=False)
+    _prompt_stack_step_count: int = field(default=0, init=False)
 
     def __attrs_post_init__(self) -> None:
         self.set_default_tools_memory(self.tool_memory)
@@ -49,6 +74,15 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
         if len(tool_names) > len(set(tool_names)):
             raise ValueError("tools names have to be unique in task")
 
+    @property
+    def all_resource_tags(self) -> list[str]:
+        return super().all_resource_tags + [f"tool:{tool.name}" for tool in self.tools]
+
+    @property
+    def supports_output_stream(self) -> bool:
+        # The output is the final answer after actions, not the text of every prompt driver run.
+        return False
+
     @property
     def memory(self) -> list[BaseToolMemory]:
         unique_memory_dict = {}
@@ -63,12 +97,29 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
 
     @property
     def prompt_stack(self) -> PromptStack:
-        stack = super().prompt_stack
+        if self.output:
+            return super().prompt_stack
+
+        steps = self.steps()
+
+        # The system prompt and finished steps don't change during a run, so they are rendered once and kept in
+        # a persistent stack. Only steps that are still running are rendered on every call.
+        if self._prompt_stack is None or self._prompt_stack_step_count > len(steps):
+            self._prompt_stack = super().prompt_stack
+            self._prompt_stack_step_count = 0
+
+        for step in steps[self._prompt_stack_step_count:]:
+            if any(subtask.output is None for subtask in step):
+                break
+
+            self.__add_step_to_prompt_stack(self._prompt_stack, step)
 
-        if not self.output:
-            for s in self.subtasks:
-                stack.add_assistant_input(self.generate_assistant_subtask_template(s))
-                stack.add_user_input(self.generate_user_subtask_template(s))
+            self._prompt_stack_step_count += 1
+
+        stack = PromptStack(inputs=list(self._prompt_stack.inputs))
+
+        for step in steps[self._prompt_stack_step_count:]:
+            self.__add_step_to_prompt_stack(stack, step)
 
         return stack
 
@@ -117,6 +168,16 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
             subtask=subtask
         )
 
+    def default_assistant_step_template_generator(self, subtasks: list[ActionSubtask]) -> str:
+        return J2("tasks/toolkit_task/assistant_step.j2").render(
+            subtasks=subtasks
+        )
+
+    def default_user_step_template_generator(self, subtasks: list[ActionSubtask]) -> str:
+        return J2("tasks/toolkit_task/user_step.j2").render(
+            subtasks=subtasks
+        )
+
     def set_default_tools_memory(self, memory: BaseToolMemory) -> None:
         self.tool_memory = memory
 
@@ -130,55 +191,109 @@ class ToolkitTask(PromptTask, ActionSubtaskOriginMixin):
                         for a in tool.activities() if tool.activity_uses_default_memory(a)
                     }
 
-    def run(self) -> TextArtifact:
-        from griptape.tasks import ActionSubtask
+    def cache_params(self) -> Optional[dict]:
+        # Tool activities can have side effects, so outputs aren't memoized.
+        return None
+
+    def reset(self) -> ToolkitTask:
+        super().reset()
+
+        # Assign a new list so that copies made by `Structure.copy_for_run` don't share subtasks.
+        self.subtasks = []
+        self._prompt_stack = None
+
+        return self
+
+    def execute(self) -> BaseArtifact:
+        try:
+            return super().execute()
+        finally:
+            for tool in self.tools:
+                tool.finish_task(self)
 
+    def run(self) -> TextArtifact:
         self.subtasks.clear()
 
-        subtask = self.add_subtask(
-            ActionSubtask(
-                self.active_driver().run(prompt_stack=self.prompt_stack).to_text()
-            )
-        )
+        self._prompt_stack = None
+
+        subtasks = self.add_step(self.active_driver().run(prompt_stack=self.prompt_stack).to_text())
 
-        while True:
-            if subtask.output is None:
-                if len(self.subtasks) >= self.max_subtasks:
-                    subtask.output = ErrorArtifact(
-                        f"Exceeded tool limit of {self.max_subtasks} subtasks per task"
-                    )
-                elif subtask.action_name is None:
-                    # handle case when the LLM failed to follow the ReAct prompt and didn't return a proper action
-                    subtask.output = TextArtifact(subtask.input_template)
-                else:
-                    subtask.before_run()
-                    subtask.run()
-                    subtask.after_run()
-
-                    subtask = self.add_subtask(
-                        ActionSubtask(
-                            self.active_driver().run(prompt_stack=self.prompt_stack).to_text()
-                        )
-                    )
+        while subtasks[-1].output is None:
+            if len(self.subtasks) >= self.max_subtasks:
+                subtasks[-1].output = ErrorArtifact(
+                    f"Exceeded tool limit of {self.max_subtasks} subtasks per task"
+                )
+            elif len(subtasks) == 1 and subtasks[0].action_name is None:
+                # handle case when the LLM failed to follow the ReAct prompt and didn't return a proper action
+                subtasks[0].output = TextArtifact(subtasks[0].input_template)
             else:
-                break
+                self.run_step(subtasks)
+
+                subtasks = self.add_step(self.active_driver().run(prompt_stack=self.prompt_stack).to_text())
 
-        self.output = subtask.output
+        self.output = subtasks[-1].output
 
         return self.output
 
+    def run_step(self, subtasks: list[ActionSubtask]) -> None:
+        """Runs the subtasks of a step, concurrently on `futures_executor` if there's more than one."""
+        if len(subtasks) == 1:
+            self.__run_subtask(subtasks[0])
+        else:
+            utils.execute_futures_dict({
+                subtask.id: self.futures_executor.submit(self.__run_subtask, subtask) for subtask in subtasks
+            })
+
+    def steps(self) -> list[list[ActionSubtask]]:
+        """Returns subtasks grouped by step. Subtasks of the same step share their parents."""
+        steps = []
+
+        for subtask in self.subtasks:
+            if steps and steps[-1][0].parent_ids == subtask.parent_ids:
+                steps[-1].append(subtask)
+            else:
+                steps.append([subtask])
+
+        return steps
+
     def find_subtask(self, subtask_id: str) -> Optional[ActionSubtask]:
         return next((subtask for subtask in self.subtasks if subtask.id == subtask_id), None)
 
     def add_subtask(self, subtask: ActionSubtask) -> ActionSubtask:
-        subtask.attach_to(self)
+        return self.add_subtasks(subtask)[0]
+
+    def add_subtasks(self, *subtasks: ActionSubtask) -> list[ActionSubtask]:
+        """Adds subtasks as a single step, whose subtasks are children of all subtasks of the previous step."""
+        previous_step = self.steps()[-1] if self.subtasks else []
+
+        for subtask in subtasks:
+            subtask.attach_to(self)
 
-        if len(self.subtasks) > 0:
-            self.subtasks[-1].add_child(subtask)
+            for parent in previous_step:
+                parent.add_child(subtask)
 
-        self.subtasks.append(subtask)
+        self.subtasks.extend(subtasks)
+
+        return list(subtasks)
+
+    def add_step(self, value: str) -> list[ActionSubtask]:
+        """Adds a step with one subtask for each action in a prompt output."""
+        from griptape.tasks import ActionSubtask
+
+        return self.add_subtasks(*[ActionSubtask(action) for action in ActionSubtask.split_actions(value)])
+
+    def __add_step_to_prompt_stack(self, stack: PromptStack, step: list[ActionSubtask]) -> None:
+        if len(step) == 1:
+            stack.add_assistant_input(self.generate_assistant_subtask_template(step[0]))
+            stack.add_user_input(self.generate_user_subtask_template(step[0]))
+        else:
+            stack.add_assistant_input(self.generate_assistant_step_template(step))
+            stack.add_user_input(self.generate_user_step_template(step))
 
-        return subtask
+    def __run_subtask(self, subtask: ActionSubtask) -> None:
+        subtask.before_run()
+        subtask.run()
+        subtask.after_run()
 
     def find_tool(self, tool_name: str) -> Optional[BaseTool]:
         return next(
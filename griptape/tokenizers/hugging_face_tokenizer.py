@@ -1,3 +1,5 @@
+from __future__ import annotations
+from functools import lru_cache
 from os import environ
 
 environ["TRANSFORMERS_VERBOSITY"] = "error"
@@ -15,8 +17,34 @@ class HuggingFaceTokenizer(BaseTokenizer):
         kw_only=True
     )
 
+    @classmethod
+    def from_pretrained(
+        cls, tokenizer_class: type[PreTrainedTokenizerBase], name: str, **kwargs
+    ) -> HuggingFaceTokenizer:
+        """Creates a tokenizer from a pretrained Hugging Face tokenizer.
+
+        Loading a pretrained tokenizer reads its files from disk or the Hugging Face Hub, so loaded tokenizers are
+        cached for the whole process and shared by all drivers that use the same tokenizer.
+
+        Args:
+            tokenizer_class: Hugging Face tokenizer class, for example `AutoTokenizer`.
+            name: Hugging Face Hub model name or path.
+            **kwargs: Additional `from_pretrained` arguments. They have to be hashable.
+
+        Returns:
+            HuggingFaceTokenizer: Tokenizer wrapping the cached pretrained tokenizer.
+        """
+        return cls(tokenizer=_load_pretrained_tokenizer(tokenizer_class, name, **kwargs))
+
     def encode(self, text: str) -> list[int]:
         return self.tokenizer.encode(text)
 
     def decode(self, tokens: list[int]) -> str:
         return self.tokenizer.decode(tokens)
+
+
+@lru_cache(maxsize=None)
+def _load_pretrained_tokenizer(
+    tokenizer_class: type[PreTrainedTokenizerBase], name: str, **kwargs
+) -> PreTrainedTokenizerBase:
+    return tokenizer_class.from_pretrained(name, **kwargs)
@@ -1,8 +1,12 @@
 from __future__ import annotations
+import copy
+import importlib
+import importlib.metadata
+import json
 import logging
 import subprocess
 import sys
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import TYPE_CHECKING
 import inspect
 import os
@@ -10,12 +14,14 @@ from abc import ABC
 from typing import Optional
 import yaml
 from attr import define, field, Factory
+from packaging.requirements import Requirement, InvalidRequirement
+from griptape import utils
 from griptape.artifacts import BaseArtifact, InfoArtifact, TextArtifact
 from griptape.mixins import ActivityMixin
 
 if TYPE_CHECKING:
     from griptape.memory.tool import BaseToolMemory
-    from griptape.tasks import ActionSubtask
+    from griptape.tasks import ActionSubtask, BaseTask
 
 
 @define
@@ -28,6 +34,16 @@ class BaseTool(ActivityMixin, ABC):
     output_memory: Optional[dict[str, list[BaseToolMemory]]] = field(default=None, kw_only=True)
     install_dependencies_on_init: bool = field(default=True, kw_only=True)
     dependencies_install_directory: Optional[str] = field(default=None, kw_only=True)
+    dependencies_cache_dir: Optional[str] = field(
+        default=Factory(
+            lambda: os.path.join(
+                os.environ.get("XDG_CACHE_HOME", os.path.expanduser(os.path.join("~", ".cache"))),
+                "griptape",
+                "tool_dependencies"
+            )
+        ),
+        kw_only=True
+    )
     verbose: bool = field(default=False, kw_only=True)
 
     def __attrs_post_init__(self) -> None:
@@ -60,8 +76,7 @@ class BaseTool(ActivityMixin, ABC):
 
     @property
     def manifest(self) -> dict:
-        with open(self.manifest_path, "r") as yaml_file:
-            return yaml.safe_load(yaml_file)
+        return copy.deepcopy(_load_manifest(self.manifest_path))
 
     @property
     def abs_file_path(self):
@@ -100,6 +115,10 @@ class BaseTool(ActivityMixin, ABC):
         else:
             return value
 
+    def finish_task(self, task: BaseTask) -> None:
+        """Called when a task that uses the tool finishes, so that the tool can release resources of the task."""
+        pass
+
     def validate(self) -> bool:
         from griptape.utils import ManifestValidator
 
@@ -119,8 +138,88 @@ class BaseTool(ActivityMixin, ABC):
         return os.path.dirname(os.path.abspath(class_file))
 
     def install_dependencies(self, env: Optional[dict[str, str]] = None) -> None:
-        env = env if env else {}
+        """Installs the tool requirements with pip, unless they are already installed.
+
+        Requirements count as installed if the installed distributions satisfy them or, when that can't be fully
+        checked, if every distribution that can be checked is installed and the same requirements were installed
+        before for the same interpreter and install directory.
+        Successful installs are recorded with a marker file in `dependencies_cache_dir`.
+        """
+        if not os.path.exists(self.requirements_path):
+            return
+
+        fingerprint = self.requirements_fingerprint()
+
+        if fingerprint in _installed_requirements:
+            return
+
+        satisfied = self.requirements_satisfied()
+
+        if satisfied is None:
+            satisfied = self.__marker_path(fingerprint) is not None and os.path.exists(self.__marker_path(fingerprint))
+
+        if not satisfied:
+            if not self.__pip_install(env if env else {}):
+                return
+
+            importlib.invalidate_caches()
+            self.__write_marker(fingerprint)
+
+        _installed_requirements.add(fingerprint)
+
+    def requirements_fingerprint(self) -> str:
+        with open(self.requirements_path, "r") as file:
+            requirements = file.read()
+
+        return utils.str_to_hash(
+            json.dumps([requirements, sys.executable, sys.version, self.dependencies_install_directory])
+        )
+
+    def requirements_satisfied(self) -> Optional[bool]:
+        """Returns whether installed distributions satisfy the tool requirements.
+
+        Returns:
+            `False` if a required distribution is missing or has the wrong version, and `None` if the installed
+            distributions can't be fully checked, for example for requirements with pip options, extras, or URLs.
+        """
+        path = [self.dependencies_install_directory] if self.dependencies_install_directory else None
+        checked = True
+
+        with open(self.requirements_path, "r") as file:
+            lines = [line.split("#", 1)[0].strip() for line in file]
+
+        for line in [line for line in lines if line]:
+            try:
+                requirement = Requirement(line)
+            except InvalidRequirement:
+                checked = False
+
+                continue
+
+            if requirement.marker and not requirement.marker.evaluate():
+                continue
 
+            if path is None:
+                try:
+                    version = importlib.metadata.version(requirement.name)
+                except importlib.metadata.PackageNotFoundError:
+                    return False
+            else:
+                distribution = next(iter(importlib.metadata.distributions(name=requirement.name, path=path)), None)
+
+                if distribution is None:
+                    return False
+
+                version = distribution.version
+
+            if requirement.extras or requirement.url:
+                checked = False
+            elif not requirement.specifier.contains(version, prereleases=True):
+                return False
+
+        return True if checked else None
+
+    def __pip_install(self, env: dict[str, str]) -> bool:
         command = [
             sys.executable,
             "-m",
@@ -135,7 +234,7 @@ class BaseTool(ActivityMixin, ABC):
         else:
             command.extend(["-t", self.dependencies_install_directory])
 
-        subprocess.run(
+        result = subprocess.run(
             command,
             env=env,
             cwd=self.tool_dir(),
@@ -143,8 +242,40 @@ class BaseTool(ActivityMixin, ABC):
             stderr=None if self.verbose else subprocess.DEVNULL
         )
 
+        return result.returncode == 0
+
+    def __marker_path(self, fingerprint: str) -> Optional[str]:
+        if self.dependencies_cache_dir is None:
+            return None
+        else:
+            return os.path.join(self.dependencies_cache_dir, fingerprint)
+
+    def __write_marker(self, fingerprint: str) -> None:
+        marker_path = self.__marker_path(fingerprint)
+
+        if marker_path is None:
+            return
+
+        try:
+            os.makedirs(self.dependencies_cache_dir, exist_ok=True)
+
+            with open(marker_path, "w") as file:
+                file.write(self.requirements_path)
+        except OSError as e:
+            logging.warning(f"Can't write tool dependencies marker {marker_path}: {e}")
+
     def find_input_memory(self, memory_name: str) -> Optional[BaseToolMemory]:
         if self.input_memory:
             return next((m for m in self.input_memory if m.name == memory_name), None)
         else:
             return None
+
+
+@lru_cache(maxsize=None)
+def _load_manifest(manifest_path: str) -> dict:
+    with open(manifest_path, "r") as yaml_file:
+        return yaml.safe_load(yaml_file)
+
+
+# Fingerprints of requirements that are installed, so that tools of the same class don't check them again.
+_installed_requirements: set[str] = set()
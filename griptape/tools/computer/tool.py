@@ -2,20 +2,36 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 import stringcase
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import docker
 from attr import define, field, Factory
 from docker.errors import NotFound
-from griptape.artifacts import BaseArtifact, ErrorArtifact, TextArtifact
+from griptape.artifacts import BaseArtifact, ErrorArtifact
+from griptape.drivers import BaseSandboxDriver, DockerSandboxDriver
 from griptape.tools import BaseTool
 from griptape.utils.decorators import activity
 from schema import Schema, Literal
 
+if TYPE_CHECKING:
+    from griptape.structures import Structure
+    from griptape.tasks import ActionSubtask, BaseTask
+
 
 @define
 class Computer(BaseTool):
+    """Executes Python code and shell commands in sandboxes.
+
+    Attributes:
+        sandbox_driver: Driver of the sandboxes. Defaults to a `DockerSandboxDriver` for the image that
+            `install_dependencies` builds, with a single pooled container.
+        use_repl_sessions: Whether to execute code in a REPL session per task instead of a new process, so that
+            imports and variables are kept between executions of the same task. Sessions are closed when their task
+            finishes.
+    """
+
     local_workdir: Optional[str] = field(default=None, kw_only=True)
     container_workdir: str = field(default="/griptape", kw_only=True)
     env_vars: dict = field(factory=dict, kw_only=True)
@@ -33,32 +49,53 @@ class Computer(BaseTool):
         ),
         kw_only=True,
     )
-    docker_client: docker.DockerClient = field(
-        default=Factory(lambda self: self.default_docker_client(), takes_self=True),
+    sandbox_driver: Optional[BaseSandboxDriver] = field(default=None, kw_only=True)
+    docker_client: Optional[docker.DockerClient] = field(
+        default=Factory(
+            lambda self: self.default_docker_client() if self.sandbox_driver is None else None,
+            takes_self=True
+        ),
         kw_only=True,
     )
+    use_repl_sessions: bool = field(default=False, kw_only=True)
 
     __tempdir: Optional[tempfile.TemporaryDirectory] = field(default=None, kw_only=True)
+    _repl_sessions: dict[tuple[Optional[str], str], BaseSandboxDriver.ReplSession] = field(factory=dict, init=False)
+    _repl_sessions_lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _execution_context: threading.local = field(factory=threading.local, init=False)
 
     def __attrs_post_init__(self) -> None:
-        super().__attrs_post_init__()
-
         if self.local_workdir:
             Path(self.local_workdir).mkdir(parents=True, exist_ok=True)
         else:
             self.__tempdir = tempfile.TemporaryDirectory()
             self.local_workdir = self.__tempdir.name
 
+        if self.sandbox_driver is None:
+            self.sandbox_driver = DockerSandboxDriver(
+                docker_client=self.docker_client,
+                image_name=self.image_name(self),
+                container_name_prefix=self.container_name(self),
+                workdir=self.container_workdir,
+                env_vars=self.env_vars
+            )
+
+        if self.sandbox_driver.local_workdir is None:
+            self.sandbox_driver.local_workdir = self.local_workdir
+
+        super().__attrs_post_init__()
+
     @docker_client.validator
-    def validate_docker_client(self, _, docker_client: docker.DockerClient) -> None:
-        if not docker_client:
+    def validate_docker_client(self, _, docker_client: Optional[docker.DockerClient]) -> None:
+        if self.sandbox_driver is None and not docker_client:
             raise ValueError("Docker client can't be initialized: make sure the Docker daemon is running")
 
     def install_dependencies(self, env: Optional[dict[str, str]] = None) -> None:
         super().install_dependencies(env)
 
-        self.remove_existing_container(self.container_name(self))
-        self.build_image(self)
+        if isinstance(self.sandbox_driver, DockerSandboxDriver):
+            self.sandbox_driver.remove_containers()
+            self.build_image(self)
 
     @activity(
         config={
@@ -98,60 +135,78 @@ class Computer(BaseTool):
 
         return self.execute_command_in_container(command)
 
-    def execute_command_in_container(self, command: str) -> BaseArtifact:
+    def execute(self, activity: callable, subtask: "ActionSubtask") -> BaseArtifact:
+        # REPL sessions are per task and structure run, so activities need to know which task they run for.
+        task_id = subtask.parent_task_id or subtask.id
+        self._execution_context.session_key = self.__session_key(subtask.structure, task_id)
+
         try:
-            binds = {self.local_workdir: {"bind": self.container_workdir, "mode": "rw"}}
-
-            container = self.docker_client.containers.run(
-                self.image_name(self),
-                environment=self.env_vars,
-                command=command,
-                name=self.container_name(self),
-                volumes=binds,
-                stdout=True,
-                stderr=True,
-                detach=True,
-            )
+            return super().execute(activity, subtask)
+        finally:
+            self._execution_context.session_key = None
 
-            container.wait()
+    def execute_command_in_container(self, command: str) -> BaseArtifact:
+        try:
+            return self.sandbox_driver.execute_command(command)
+        except Exception as e:
+            return ErrorArtifact(f"error executing command: {e}")
 
-            stderr = container.logs(stdout=False, stderr=True).decode().strip()
-            stdout = container.logs(stdout=True, stderr=False).decode().strip()
+    def execute_code_in_container(self, filename: str, code: str) -> BaseArtifact:
+        session_key = getattr(self._execution_context, "session_key", None)
 
-            container.stop()
-            container.remove()
+        try:
+            if self.use_repl_sessions and session_key is not None:
+                with open(BaseSandboxDriver.workdir_file_path(self.local_workdir, filename), "w") as f:
+                    f.write(code)
 
-            if stderr:
-                return ErrorArtifact(stderr)
+                return self.repl_session(*session_key).execute(code)
             else:
-                return TextArtifact(stdout)
+                return self.sandbox_driver.execute_code(filename, code)
         except Exception as e:
-            return ErrorArtifact(f"error executing command: {e}")
+            return ErrorArtifact(f"error executing code: {e}")
 
-    def execute_code_in_container(self, filename: str, code: str) -> BaseArtifact:
-        container_file_path = os.path.join(self.container_workdir, filename)
+    def repl_session(self, structure_id: Optional[str], task_id: str) -> BaseSandboxDriver.ReplSession:
+        """Returns the REPL session of a task in a structure run, starting it if it doesn't exist yet.
 
-        if self.local_workdir:
-            tempdir = None
-            local_workdir = self.local_workdir
-        else:
-            tempdir = tempfile.TemporaryDirectory()
-            local_workdir = tempdir.name
+        Structure copies for concurrent runs have their own ids, so their tasks don't share REPL sessions.
+        """
+        with self._repl_sessions_lock:
+            session = self._repl_sessions.get((structure_id, task_id))
 
-        local_file_path = os.path.join(local_workdir, filename)
+            if session is None or session.closed:
+                session = self.sandbox_driver.start_repl_session()
 
-        try:
-            with open(local_file_path, "w") as f:
-                f.write(code)
+                self._repl_sessions[(structure_id, task_id)] = session
 
-            return self.execute_command_in_container(
-                f"python {container_file_path}"
-            )
+            return session
+
+    def finish_task(self, task: "BaseTask") -> None:
+        try:
+            self.close_repl_session(*self.__session_key(task.structure, task.id))
         except Exception as e:
-            return ErrorArtifact(f"error executing code: {e}")
-        finally:
-            if tempdir:
-                tempdir.cleanup()
+            logging.error(f"Error closing REPL session: {e}")
+
+    def close_repl_session(self, structure_id: Optional[str], task_id: str) -> None:
+        with self._repl_sessions_lock:
+            session = self._repl_sessions.pop((structure_id, task_id), None)
+
+        if session is not None:
+            session.close()
+
+    def close(self) -> None:
+        """Closes REPL sessions and stops the sandboxes."""
+        with self._repl_sessions_lock:
+            sessions = list(self._repl_sessions.values())
+
+            self._repl_sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+        self.sandbox_driver.stop()
+
+    def __session_key(self, structure: Optional["Structure"], task_id: str) -> tuple[Optional[str], str]:
+        return structure.id if structure else None, task_id
 
     def default_docker_client(self) -> Optional[docker.DockerClient]:
         try:
@@ -194,5 +249,11 @@ class Computer(BaseTool):
             return [line.strip() for line in file.readlines()]
 
     def __del__(self) -> None:
+        try:
+            if self.sandbox_driver is not None:
+                self.close()
+        except Exception as e:
+            logging.error(f"Error stopping sandboxes: {e}")
+
         if self.__tempdir:
             self.__tempdir.cleanup()
@@ -1,13 +1,19 @@
+from __future__ import annotations
+import json
 from textwrap import dedent
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urljoin
 import schema
 from schema import Schema, Literal
-from attr import define, field
+from attr import define, field, Factory
 from griptape.tools import BaseTool
+from griptape.utils import HttpResponseCache
 from griptape.utils.decorators import activity
 from griptape.artifacts import BaseArtifact, TextArtifact, ErrorArtifact
 
+if TYPE_CHECKING:
+    from requests import Session
+
 
 @define
 class RestApiClient(BaseTool):
@@ -20,7 +26,19 @@ class RestApiClient(BaseTool):
         request_query_params_schema: A JSON schema string describing the available query parameters.
         request_path_params_schema: A JSON schema string describing the available path parameters. The schema must describe an array of string values.
         response_body_schema: A JSON schema string describing the response body.
+        session: HTTP session that pools connections across requests.
+        timeout: Request timeout in seconds.
+        max_retries: Maximum number of retries of GET, PUT, and DELETE requests after connection errors and 429, 502,
+            503, and 504 responses.
+        retry_backoff_factor: Factor of the exponential delay between retries.
+        pool_maxsize: Maximum number of connections kept open per host.
+        get_cache_ttl: Seconds that GET responses are cached by URL and query parameters. Once the TTL has passed,
+            cached responses are revalidated with the `ETag` and `Last-Modified` headers of the response. If `None`,
+            GET responses aren't cached. PUT, PATCH, POST, and DELETE requests clear the cache, since they can change
+            any resource of the API.
+        max_cached_responses: Maximum number of cached GET responses. The least recently used are evicted first.
     """
+
     base_url: str = field(kw_only=True)
     path: Optional[str] = field(
         default=None,
@@ -43,6 +61,23 @@ class RestApiClient(BaseTool):
         default=None,
         kw_only=True,
     )
+    timeout: float = field(default=30, kw_only=True)
+    max_retries: int = field(default=3, kw_only=True)
+    retry_backoff_factor: float = field(default=0.5, kw_only=True)
+    pool_maxsize: int = field(default=10, kw_only=True)
+    session: Session = field(
+        default=Factory(lambda self: self.default_session(), takes_self=True),
+        kw_only=True,
+    )
+    get_cache_ttl: Optional[float] = field(default=None, kw_only=True)
+    max_cached_responses: int = field(default=128, kw_only=True)
+    _get_cache: HttpResponseCache = field(
+        default=Factory(
+            lambda self: HttpResponseCache(ttl=self.get_cache_ttl or 0, max_size=self.max_cached_responses),
+            takes_self=True
+        ),
+        init=False
+    )
 
     @property
     def full_url(self) -> str:
@@ -66,7 +101,7 @@ class RestApiClient(BaseTool):
         }
     )
     def put(self, params: dict) -> BaseArtifact:
-        from requests import put, exceptions
+        from requests import exceptions
 
         values = params["values"]
         base_url = self.base_url
@@ -75,11 +110,13 @@ class RestApiClient(BaseTool):
         url = self._build_url(base_url, path=path)
 
         try:
-            response = put(url, data=body, timeout=30)
+            response = self.session.put(url, data=body, timeout=self.timeout)
 
             return TextArtifact(response.text)
         except exceptions.RequestException as err:
             return ErrorArtifact(str(err))
+        finally:
+            self.clear_get_cache()
 
     @activity(
         config={
@@ -103,7 +140,7 @@ class RestApiClient(BaseTool):
         }
     )
     def patch(self, params: dict) -> BaseArtifact:
-        from requests import patch, exceptions
+        from requests import exceptions
 
         values = params["values"]
         base_url = self.base_url
@@ -113,10 +150,12 @@ class RestApiClient(BaseTool):
         url = self._build_url(base_url, path=path, path_params=path_params)
 
         try:
-            response = patch(url, data=body, timeout=30)
+            response = self.session.patch(url, data=body, timeout=self.timeout)
             return TextArtifact(response.text)
         except exceptions.RequestException as err:
             return ErrorArtifact(str(err))
+        finally:
+            self.clear_get_cache()
 
     @activity(
         config={
@@ -136,7 +175,7 @@ class RestApiClient(BaseTool):
         }
     )
     def post(self, params: dict) -> BaseArtifact:
-        from requests import post, exceptions
+        from requests import exceptions
 
         values = params["values"]
         base_url = self.base_url
@@ -145,10 +184,12 @@ class RestApiClient(BaseTool):
         body = values["body"]
 
         try:
-            response = post(url, data=body, timeout=30)
+            response = self.session.post(url, data=body, timeout=self.timeout)
             return TextArtifact(response.text)
         except exceptions.RequestException as err:
             return ErrorArtifact(str(err))
+        finally:
+            self.clear_get_cache()
 
     @activity(
         config={
@@ -182,7 +223,7 @@ class RestApiClient(BaseTool):
         }
     )
     def get(self, params: dict) -> BaseArtifact:
-        from requests import get, exceptions
+        from requests import exceptions
 
         values = params["values"]
         base_url = self.base_url
@@ -196,8 +237,7 @@ class RestApiClient(BaseTool):
         url = self._build_url(base_url, path=path, path_params=path_params)
 
         try:
-            response = get(url, params=query_params, timeout=30)
-            return TextArtifact(response.text)
+            return TextArtifact(self._get_text(url, query_params))
         except exceptions.RequestException as err:
             return ErrorArtifact(str(err))
 
@@ -229,7 +269,7 @@ class RestApiClient(BaseTool):
         }
     )
     def delete(self, params: dict = None) -> BaseArtifact:
-        from requests import delete, exceptions
+        from requests import exceptions
 
         values = params["values"]
         base_url = self.base_url
@@ -240,10 +280,55 @@ class RestApiClient(BaseTool):
         url = self._build_url(base_url, path=path, path_params=path_params)
 
         try:
-            response = delete(url, params=query_params, timeout=30)
+            response = self.session.delete(url, params=query_params, timeout=self.timeout)
             return TextArtifact(response.text)
         except exceptions.RequestException as err:
             return ErrorArtifact(str(err))
+        finally:
+            self.clear_get_cache()
+
+    def default_session(self) -> Session:
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = Session()
+        # Retry only applies to idempotent methods by default, so POST and PATCH requests aren't sent twice.
+        adapter = HTTPAdapter(
+            pool_maxsize=self.pool_maxsize,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=self.retry_backoff_factor,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def clear_get_cache(self) -> None:
+        self._get_cache.clear()
+
+    def _get_text(self, url: str, query_params: dict) -> str:
+        if self.get_cache_ttl is None:
+            return self.session.get(url, params=query_params, timeout=self.timeout).text
+
+        key = json.dumps([url, query_params], sort_keys=True, default=str)
+        cached_response = self._get_cache.get(key)
+
+        if cached_response is not None and self._get_cache.is_fresh(cached_response):
+            return cached_response.content
+
+        headers = self._get_cache.conditional_headers(cached_response)
+        response = self.session.get(url, params=query_params, headers=headers, timeout=self.timeout)
+        cached_response = self._get_cache.put(
+            key, cached_response, response.status_code, response.text, response.headers
+        )
+
+        return response.text if cached_response is None else cached_response.content
 
     def _build_url(self, base_url, path=None, path_params=None):
         url = ""
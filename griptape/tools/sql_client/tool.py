@@ -1,20 +1,45 @@
 from __future__ import annotations
-from typing import Optional
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
 from attr import define, field
-from griptape.artifacts import InfoArtifact, ListArtifact
+from griptape.artifacts import BaseArtifact, InfoArtifact, ListArtifact
 from griptape.tools import BaseTool
 from griptape.utils.decorators import activity
 from griptape.loaders import SqlLoader
 from schema import Schema
 
+if TYPE_CHECKING:
+    from griptape.tasks import ActionSubtask
+
 
 @define
 class SqlClient(BaseTool):
+    """Runs SQL SELECT queries on a table.
+
+    Attributes:
+        table_schema_ttl: Seconds that the table schema is cached, since it's part of the activity description and
+            fetching it queries the database metadata.
+        page_size: Number of rows fetched from the database at a time.
+        max_rows: Maximum number of rows returned by a query. Fetching stops once the limit is reached, and a warning
+            is logged for truncated results. If `None`, all rows are returned.
+        max_inline_rows: Results with up to this many rows are returned directly instead of going to output memory.
+            Larger results go to output memory. If `None`, all results go to output memory.
+    """
+
     sql_loader: SqlLoader = field(kw_only=True)
     schema_name: Optional[str] = field(default=None, kw_only=True)
     table_name: str = field(kw_only=True)
     table_description: Optional[str] = field(default=None, kw_only=True)
     engine_name: Optional[str] = field(default=None, kw_only=True)
+    table_schema_ttl: float = field(default=300, kw_only=True)
+    page_size: int = field(default=100, kw_only=True)
+    max_rows: Optional[int] = field(default=None, kw_only=True)
+    max_inline_rows: Optional[int] = field(default=None, kw_only=True)
+    _table_schema: Optional[str] = field(default=None, init=False)
+    _table_schema_expires_at: Optional[float] = field(default=None, init=False)
+    _table_schema_lock: threading.Lock = field(factory=threading.Lock, init=False)
 
     @property
     def full_table_name(self) -> str:
@@ -22,7 +47,19 @@ class SqlClient(BaseTool):
 
     @property
     def table_schema(self) -> str:
-        return self.sql_loader.sql_driver.get_table_schema(self.full_table_name, schema=self.schema_name)
+        with self._table_schema_lock:
+            if self._table_schema_expires_at is None or time.monotonic() >= self._table_schema_expires_at:
+                self._table_schema = self.sql_loader.sql_driver.get_table_schema(
+                    self.full_table_name, schema=self.schema_name
+                )
+                self._table_schema_expires_at = time.monotonic() + self.table_schema_ttl
+
+            return self._table_schema
+
+    def clear_table_schema_cache(self) -> None:
+        with self._table_schema_lock:
+            self._table_schema = None
+            self._table_schema_expires_at = None
 
     @activity(config={
         "description":
@@ -34,16 +71,37 @@ class SqlClient(BaseTool):
             "to get better results. "
             "You can use JOINs if more tables are available in other tools.\n"
             "{{ _self.table_name }} schema: {{ _self.table_schema }}\n"
-            "{% if _self.table_description %}{{ _self.table_name }} description: {{ _self.table_description }}{% endif %}",
+            "{% if _self.table_description %}"
+            "{{ _self.table_name }} description: {{ _self.table_description }}"
+            "{% endif %}"
+            "{% if _self.max_rows %}\nQueries return at most {{ _self.max_rows }} rows.{% endif %}",
         "schema": Schema({
             "sql_query": str
         })
     })
     def execute_query(self, params: dict) -> ListArtifact | InfoArtifact:
         query = params["values"]["sql_query"]
-        rows = self.sql_loader.load(query)
+        rows = []
+
+        for page in self.sql_loader.iter_pages(query, self.page_size):
+            rows.extend(page)
+
+            # One row past the limit tells truncated results apart from results with exactly `max_rows` rows.
+            if self.max_rows is not None and len(rows) > self.max_rows:
+                rows = rows[:self.max_rows]
+
+                logging.warning(f"Results of query {query} were truncated to the first {self.max_rows} rows")
+
+                break
 
         if len(rows) > 0:
             return ListArtifact(rows)
         else:
             return InfoArtifact("No results found")
+
+    def after_execute(self, activity: callable, subtask: ActionSubtask, value: BaseArtifact) -> BaseArtifact:
+        if self.max_inline_rows is not None and isinstance(value, ListArtifact):
+            if len(value.value) <= self.max_inline_rows:
+                return value
+
+        return super().after_execute(activity, subtask, value)
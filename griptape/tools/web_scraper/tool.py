@@ -1,7 +1,6 @@
 from __future__ import annotations
-from attr import define, field
+from attr import define, field, Factory
 from griptape.artifacts import BaseArtifact, TextArtifact, ErrorArtifact, ListArtifact
-from griptape.loaders import TextLoader
 from schema import Schema, Literal
 from griptape.tools import BaseTool
 from griptape.utils.decorators import activity
@@ -11,6 +10,7 @@ from griptape.loaders import WebLoader
 @define
 class WebScraper(BaseTool):
     include_links: bool = field(default=True, kw_only=True)
+    web_loader: WebLoader = field(default=Factory(lambda: WebLoader()), kw_only=True)
 
     @activity(config={
         "description": "Can be used to browse a web page and load its content",
@@ -23,13 +23,13 @@ class WebScraper(BaseTool):
     })
     def get_content(self, params: dict) -> ListArtifact | ErrorArtifact:
         url = params["values"]["url"]
-        page = WebLoader().extract_page(url, self.include_links)
+        page = self.web_loader.extract_page(url, self.include_links)
 
         if isinstance(page, ErrorArtifact):
             return page
         else:
             return ListArtifact(
-                TextLoader().text_to_artifacts(page.get("text"))
+                self.web_loader.text_to_artifacts(page.get("text"))
             )
 
     @activity(config={
@@ -43,7 +43,7 @@ class WebScraper(BaseTool):
     })
     def get_author(self, params: dict) -> BaseArtifact:
         url = params["values"]["url"]
-        page = WebLoader().extract_page(url, self.include_links)
+        page = self.web_loader.extract_page(url, self.include_links)
 
         if isinstance(page, ErrorArtifact):
             return page
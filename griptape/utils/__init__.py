@@ -11,7 +11,12 @@ from .chat import Chat
 from .futures import execute_futures_dict
 from .token_counter import TokenCounter
 from .prompt_stack import PromptStack
+from .text_stream import TextStream
+from .batch_run import BatchRun
+from .run_profiler import RunProfiler
 from .dict_utils import remove_null_values_in_dict_recursively
+from .cache_params import fields_to_cache_params
+from .http_response_cache import HttpResponseCache
 
 
 def minify_json(value: str) -> str:
@@ -31,5 +36,10 @@ __all__ = [
     "execute_futures_dict",
     "TokenCounter",
     "PromptStack",
-    "remove_null_values_in_dict_recursively"
+    "TextStream",
+    "BatchRun",
+    "RunProfiler",
+    "remove_null_values_in_dict_recursively",
+    "fields_to_cache_params",
+    "HttpResponseCache"
 ]
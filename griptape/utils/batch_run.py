@@ -0,0 +1,158 @@
+from __future__ import annotations
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+from attr import define, field
+from griptape.artifacts import ErrorArtifact, ListArtifact
+
+if TYPE_CHECKING:
+    from griptape.artifacts import BaseArtifact
+    from griptape.structures import Structure
+    from griptape.tasks import BaseTask
+
+
+@define
+class BatchRun:
+    """Runs a structure once for each input, with up to `concurrency` runs at a time.
+
+    Runs start when the batch run is iterated. Each iteration step yields the result of a finished run, in the order
+    runs finish. New inputs are only read when a run finishes, so at most `concurrency` runs are in flight and
+    inputs can be a lazy iterable of any size. Runs use `Structure.copy_for_run`, so they share the drivers, tools,
+    and task cache of the structure.
+
+    Attributes:
+        structure: Structure to run.
+        inputs: Inputs to run the structure with. Each input is passed to `run` as its only execution arg.
+        concurrency: Maximum number of concurrent runs.
+        completed_count: Number of finished runs, including failed ones.
+        failed_count: Number of runs with an error output.
+        start_time: Time when the first run started, from `time.perf_counter`.
+        end_time: Time when the last run finished, from `time.perf_counter`.
+    """
+
+    @define(frozen=True)
+    class Result:
+        """Result of a single run.
+
+        Attributes:
+            index: Position of the input in the inputs.
+            input: Input of the run.
+            output: Output of the run. Runs with several output tasks have a `ListArtifact` output. If any task of
+                the run failed, the output is the first error, and if an output task didn't run, it's an error that
+                says so.
+            structure: Structure copy the run used, or `None` if the run raised an exception.
+        """
+
+        index: int = field(kw_only=True)
+        input: Any = field(kw_only=True)
+        output: Optional[BaseArtifact] = field(kw_only=True)
+        structure: Optional[Structure] = field(default=None, kw_only=True)
+
+        def is_error(self) -> bool:
+            return isinstance(self.output, ErrorArtifact)
+
+    DEFAULT_CONCURRENCY = 8
+
+    structure: Structure = field(kw_only=True)
+    inputs: Iterable[Any] = field(kw_only=True)
+    concurrency: int = field(default=DEFAULT_CONCURRENCY, kw_only=True)
+    completed_count: int = field(default=0, init=False)
+    failed_count: int = field(default=0, init=False)
+    start_time: Optional[float] = field(default=None, init=False)
+    end_time: Optional[float] = field(default=None, init=False)
+
+    @concurrency.validator
+    def validate_concurrency(self, _, concurrency: int) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency has to be at least 1")
+
+    @property
+    def elapsed_time(self) -> float:
+        if self.start_time is None:
+            return 0.0
+        elif self.end_time is None:
+            return time.perf_counter() - self.start_time
+        else:
+            return self.end_time - self.start_time
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of finished runs per second."""
+        elapsed_time = self.elapsed_time
+
+        return self.completed_count / elapsed_time if elapsed_time > 0 else 0.0
+
+    def __iter__(self) -> Iterator[Result]:
+        if self.start_time is not None:
+            raise ValueError("batch runs can only be iterated once")
+
+        self.start_time = time.perf_counter()
+        inputs = enumerate(self.inputs)
+        running: dict[futures.Future[BatchRun.Result], int] = {}
+
+        with futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            try:
+                while True:
+                    while len(running) < self.concurrency:
+                        index, item = next(inputs, (None, None))
+
+                        if index is None:
+                            break
+
+                        running[executor.submit(self.__run, index, item)] = index
+
+                    if not running:
+                        break
+
+                    done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+
+                    for future in sorted(done, key=lambda f: running[f]):
+                        del running[future]
+
+                        result = future.result()
+
+                        self.completed_count += 1
+
+                        if result.is_error():
+                            self.failed_count += 1
+
+                        yield result
+            finally:
+                # Stopping the iteration early cancels runs that haven't started yet.
+                for future in running:
+                    future.cancel()
+
+                self.end_time = time.perf_counter()
+
+                self.structure.logger.info(
+                    f"Batch run: {self.completed_count} runs finished, {self.failed_count} failed, "
+                    f"{self.throughput:.2f} runs/s"
+                )
+
+    def __run(self, index: int, item: Any) -> Result:
+        structure = self.structure.copy_for_run()
+
+        try:
+            output = self.__output(structure, structure.run(item))
+        except Exception as e:
+            self.structure.logger.error(f"Batch run input {index}\n{e}", exc_info=True)
+
+            return BatchRun.Result(index=index, input=item, output=ErrorArtifact(str(e)))
+
+        return BatchRun.Result(index=index, input=item, output=output, structure=structure)
+
+    def __output(self, structure: Structure, tasks: BaseTask | list[BaseTask]) -> BaseArtifact:
+        output_tasks = tasks if isinstance(tasks, list) else [tasks]
+        # Failed tasks that aren't output tasks, like a failed middle task of a pipeline, stop the run before the
+        # output tasks run.
+        errors = [task.output for task in structure.tasks if isinstance(task.output, ErrorArtifact)]
+        unfinished_tasks = [task for task in output_tasks if task.output is None]
+
+        if errors:
+            return errors[0]
+        elif unfinished_tasks:
+            return ErrorArtifact(f"output task {unfinished_tasks[0].id} didn't run")
+        elif len(output_tasks) == 1:
+            return output_tasks[0].output
+        else:
+            return ListArtifact([task.output for task in output_tasks])
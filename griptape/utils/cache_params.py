@@ -0,0 +1,49 @@
+from __future__ import annotations
+from enum import Enum
+from typing import Any, Optional
+from attr import fields
+
+CREDENTIAL_FIELD_NAMES = ("api_key", "api_token", "password", "secret")
+
+
+def fields_to_cache_params(obj: Any, exclude: Optional[set[str]] = None) -> dict:
+    """Returns the class name and the fields with JSON values of an attrs instance, for task cache keys.
+
+    Values with a `cache_params` method, like nested drivers, are replaced with its result. Fields with other values,
+    like clients, tokenizers, and executors, fields with credentials, and `init=False` fields, which hold state rather
+    than configuration, are left out.
+
+    Args:
+        obj: attrs instance.
+        exclude: Names of fields to leave out, without leading underscores.
+    """
+    exclude = exclude or set()
+    params = {"type": obj.__class__.__name__}
+
+    for attribute in fields(type(obj)):
+        name = attribute.name.lstrip("_")
+
+        if not attribute.init or name in exclude or any(credential in name for credential in CREDENTIAL_FIELD_NAMES):
+            continue
+
+        try:
+            params[name] = _to_cache_param(getattr(obj, attribute.name))
+        except TypeError:
+            pass
+
+    return params
+
+
+def _to_cache_param(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    elif isinstance(value, Enum):
+        return _to_cache_param(value.value)
+    elif isinstance(value, (list, tuple)):
+        return [_to_cache_param(v) for v in value]
+    elif isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {k: _to_cache_param(v) for k, v in value.items()}
+    elif callable(getattr(value, "cache_params", None)):
+        return value.cache_params()
+    else:
+        raise TypeError(f"{value.__class__.__name__} isn't a cache parameter")
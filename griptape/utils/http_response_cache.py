@@ -0,0 +1,116 @@
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, Optional
+from attr import define, field
+
+
+@define
+class HttpResponseCache:
+    """Thread-safe LRU cache of HTTP responses that are revalidated with conditional requests.
+
+    Cached responses are used without a request for `ttl` seconds. After that, requests should send the
+    `conditional_headers` of the cached response, so that `put` keeps it if the server answers with 304 Not Modified.
+
+    Attributes:
+        ttl: Seconds that cached responses are used without revalidation.
+        max_size: Maximum number of cached responses. The least recently used are evicted first. Set to 0 to disable
+            the cache.
+    """
+
+    @define
+    class Entry:
+        """A cached response.
+
+        Attributes:
+            content: Response body.
+            etag: `ETag` header of the response.
+            last_modified: `Last-Modified` header of the response.
+            fetched_at: `time.monotonic()` of the last request that returned or revalidated the response.
+            derived_values: Values computed from the content, which are cached as long as the response.
+        """
+
+        content: Any = field(kw_only=True)
+        etag: Optional[str] = field(kw_only=True)
+        last_modified: Optional[str] = field(kw_only=True)
+        fetched_at: float = field(kw_only=True)
+        derived_values: dict = field(factory=dict, kw_only=True)
+
+    ttl: float = field(kw_only=True)
+    max_size: int = field(default=128, kw_only=True)
+    _entries: OrderedDict[str, Entry] = field(factory=OrderedDict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def get(self, key: str) -> Optional[Entry]:
+        """Returns the cached response for a key, fresh or not, and marks it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def is_fresh(self, entry: Entry) -> bool:
+        return time.monotonic() - entry.fetched_at < self.ttl
+
+    def conditional_headers(self, entry: Optional[Entry]) -> dict:
+        headers = {}
+
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        return headers
+
+    def put(
+            self,
+            key: str,
+            entry: Optional[Entry],
+            status_code: int,
+            content: Any,
+            headers: Mapping[str, str]
+    ) -> Optional[Entry]:
+        """Caches a response to a request for a key.
+
+        Args:
+            key: Cache key of the request.
+            entry: Cached response that the request revalidated, if any.
+            status_code: Status code of the response.
+            content: Response body.
+            headers: Response headers.
+
+        Returns:
+            The revalidated entry for 304 responses, a new entry for 200 responses, and `None` for other responses.
+            200 responses with `Cache-Control: no-store` are returned but not cached.
+        """
+        if status_code == 304 and entry is not None:
+            entry.fetched_at = time.monotonic()
+
+            return entry
+        elif status_code != 200:
+            return None
+
+        entry = HttpResponseCache.Entry(
+            content=content,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            fetched_at=time.monotonic()
+        )
+
+        if self.max_size > 0 and "no-store" not in headers.get("Cache-Control", ""):
+            with self._lock:
+                self._entries[key] = entry
+
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,303 @@
+from __future__ import annotations
+import json
+import threading
+from typing import Optional
+from attr import define, field
+from griptape.events import (
+    BaseEvent, StartTaskEvent, FinishTaskEvent, StartPromptEvent, FinishPromptEvent, StartSubtaskEvent,
+    FinishSubtaskEvent
+)
+
+
+@define
+class RunProfiler:
+    """Event listener that profiles where the wall-clock time of structure runs goes.
+
+    Add the profiler to the event listeners of a structure:
+
+        profiler = RunProfiler()
+        workflow = Workflow(event_listeners=[profiler])
+
+    Prompts are attributed to the task that runs on the same thread and tool activities to the task of their
+    action subtask. Prompts that overlap on the same thread, like batched prompts or prompts of drivers that wrap
+    other drivers, are matched last in, first out, and only count once towards the prompt time of the task.
+
+    Events published in other processes, for example by remote task execution drivers, aren't recorded.
+
+    Attributes:
+        task_profiles: Profiles of the started tasks by task ID.
+        spans: Timeline of tasks, prompts, and tool activities.
+        max_concurrency: Highest number of tasks that were executing at the same time.
+    """
+
+    @define
+    class TaskProfile:
+        """Timings of a single task.
+
+        Attributes:
+            task_id: Task ID.
+            task_type: Task class name.
+            parent_ids: IDs of the task parents.
+            start_time: Time when the task started.
+            end_time: Time when the task finished.
+            queue_wait_time: Time between the task becoming ready, when its last parent finished or the run
+                started, and the task starting.
+            prompt_time: Time spent running prompts.
+            tool_time: Time spent running tool activities.
+            prompt_token_count: Number of tokens in prompts.
+            completion_token_count: Number of tokens in completions.
+        """
+
+        task_id: str = field(kw_only=True)
+        task_type: str = field(kw_only=True)
+        parent_ids: list[str] = field(kw_only=True)
+        start_time: float = field(kw_only=True)
+        end_time: Optional[float] = field(default=None, kw_only=True)
+        queue_wait_time: float = field(default=0.0, kw_only=True)
+        prompt_time: float = field(default=0.0, kw_only=True)
+        tool_time: float = field(default=0.0, kw_only=True)
+        prompt_token_count: int = field(default=0, kw_only=True)
+        completion_token_count: int = field(default=0, kw_only=True)
+
+        @property
+        def execution_time(self) -> float:
+            return 0.0 if self.end_time is None else self.end_time - self.start_time
+
+    @define(frozen=True)
+    class Span:
+        name: str = field(kw_only=True)
+        category: str = field(kw_only=True)
+        start_time: float = field(kw_only=True)
+        end_time: float = field(kw_only=True)
+        thread_id: int = field(kw_only=True)
+        args: dict = field(factory=dict, kw_only=True)
+
+    task_profiles: dict[str, TaskProfile] = field(factory=dict, init=False)
+    spans: list[Span] = field(factory=list, init=False)
+    max_concurrency: int = field(default=0, init=False)
+    _start_time: Optional[float] = field(default=None, init=False)
+    _executing_count: int = field(default=0, init=False)
+    _task_threads: dict[str, int] = field(factory=dict, init=False)
+    _thread_tasks: dict[int, str] = field(factory=dict, init=False)
+    _started_prompts: dict[int, list[StartPromptEvent]] = field(factory=dict, init=False)
+    _started_subtasks: dict[str, StartSubtaskEvent] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def __call__(self, event: BaseEvent) -> None:
+        thread_id = threading.get_ident()
+
+        with self._lock:
+            if self._start_time is None:
+                self._start_time = event.timestamp
+
+            if isinstance(event, StartTaskEvent):
+                self.__start_task(event, thread_id)
+            elif isinstance(event, FinishTaskEvent):
+                self.__finish_task(event, thread_id)
+            elif isinstance(event, StartPromptEvent):
+                self._started_prompts.setdefault(thread_id, []).append(event)
+            elif isinstance(event, FinishPromptEvent):
+                self.__finish_prompt(event, thread_id)
+            elif isinstance(event, StartSubtaskEvent):
+                self._started_subtasks[event.subtask.id] = event
+            elif isinstance(event, FinishSubtaskEvent):
+                self.__finish_subtask(event, thread_id)
+
+    @property
+    def elapsed_time(self) -> float:
+        end_times = [p.end_time for p in self.task_profiles.values() if p.end_time is not None]
+
+        return max(end_times) - self._start_time if end_times else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self.task_profiles.clear()
+            self.spans.clear()
+            self.max_concurrency = 0
+            self._start_time = None
+            self._executing_count = 0
+            self._task_threads.clear()
+            self._thread_tasks.clear()
+            self._started_prompts.clear()
+            self._started_subtasks.clear()
+
+    def critical_path(self) -> list[TaskProfile]:
+        """Returns the chain of tasks that determined the run duration.
+
+        The chain ends with the task that finished last and is followed backwards through the parent that
+        finished last, which is the parent the task was waiting for.
+        """
+        finished_profiles = {
+            task_id: p for task_id, p in self.task_profiles.items() if p.end_time is not None
+        }
+
+        if not finished_profiles:
+            return []
+
+        profile = max(finished_profiles.values(), key=lambda p: p.end_time)
+        path = [profile]
+
+        while True:
+            parents = [finished_profiles[i] for i in profile.parent_ids if i in finished_profiles]
+
+            if not parents:
+                break
+
+            profile = max(parents, key=lambda p: p.end_time)
+
+            path.append(profile)
+
+        return list(reversed(path))
+
+    def idle_worker_time(self, worker_count: Optional[int] = None) -> float:
+        """Returns the total time workers weren't executing tasks.
+
+        Args:
+            worker_count: Number of workers. Defaults to `max_concurrency`.
+        """
+        worker_count = self.max_concurrency if worker_count is None else worker_count
+        busy_time = sum(p.execution_time for p in self.task_profiles.values())
+
+        return max(worker_count * self.elapsed_time - busy_time, 0.0)
+
+    def to_chrome_trace(self) -> dict:
+        """Returns the timeline in the Chrome trace event format, which Perfetto and chrome://tracing can open."""
+        thread_numbers = {}
+        trace_events = []
+
+        for span in sorted(self.spans, key=lambda s: s.start_time):
+            thread_number = thread_numbers.setdefault(span.thread_id, len(thread_numbers) + 1)
+
+            trace_events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_time - self._start_time) * 1_000_000,
+                "dur": (span.end_time - span.start_time) * 1_000_000,
+                "pid": 1,
+                "tid": thread_number,
+                "args": span.args
+            })
+
+        trace_events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": thread_number,
+                "args": {"name": f"Worker {thread_number}"}
+            }
+            for thread_number in thread_numbers.values()
+        )
+
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms"
+        }
+
+    def to_chrome_trace_json(self) -> str:
+        return json.dumps(self.to_chrome_trace())
+
+    def __start_task(self, event: StartTaskEvent, thread_id: int) -> None:
+        task = event.task
+        parent_end_times = [
+            self.task_profiles[parent_id].end_time for parent_id in task.parent_ids
+            if parent_id in self.task_profiles and self.task_profiles[parent_id].end_time is not None
+        ]
+        ready_time = max(parent_end_times, default=self._start_time)
+
+        self.task_profiles[task.id] = RunProfiler.TaskProfile(
+            task_id=task.id,
+            task_type=task.__class__.__name__,
+            parent_ids=list(task.parent_ids),
+            start_time=event.timestamp,
+            queue_wait_time=max(event.timestamp - ready_time, 0.0)
+        )
+        self._task_threads[task.id] = thread_id
+        self._thread_tasks[thread_id] = task.id
+        self._executing_count += 1
+        self.max_concurrency = max(self.max_concurrency, self._executing_count)
+
+    def __finish_task(self, event: FinishTaskEvent, thread_id: int) -> None:
+        profile = self.task_profiles.get(event.task.id)
+
+        if profile is None or profile.end_time is not None:
+            return
+
+        profile.end_time = event.timestamp
+        self._executing_count -= 1
+
+        if self._thread_tasks.get(thread_id) == profile.task_id:
+            del self._thread_tasks[thread_id]
+
+        self.spans.append(
+            RunProfiler.Span(
+                name=f"{profile.task_type} {profile.task_id}",
+                category="task",
+                start_time=profile.start_time,
+                end_time=profile.end_time,
+                thread_id=self._task_threads.pop(profile.task_id, thread_id),
+                args={
+                    "queue_wait_time": profile.queue_wait_time,
+                    "prompt_time": profile.prompt_time,
+                    "tool_time": profile.tool_time,
+                    "prompt_token_count": profile.prompt_token_count,
+                    "completion_token_count": profile.completion_token_count
+                }
+            )
+        )
+
+    def __finish_prompt(self, event: FinishPromptEvent, thread_id: int) -> None:
+        started_prompts = self._started_prompts.get(thread_id)
+
+        if not started_prompts:
+            return
+
+        start_event = started_prompts.pop()
+        profile = self.task_profiles.get(self._thread_tasks.get(thread_id))
+
+        if not started_prompts:
+            del self._started_prompts[thread_id]
+
+        if profile is not None:
+            if thread_id not in self._started_prompts:
+                profile.prompt_time += event.timestamp - start_event.timestamp
+
+            profile.prompt_token_count += start_event.token_count
+            profile.completion_token_count += event.token_count
+
+        self.spans.append(
+            RunProfiler.Span(
+                name="Prompt",
+                category="prompt",
+                start_time=start_event.timestamp,
+                end_time=event.timestamp,
+                thread_id=thread_id,
+                args={
+                    "prompt_token_count": start_event.token_count,
+                    "completion_token_count": event.token_count
+                }
+            )
+        )
+
+    def __finish_subtask(self, event: FinishSubtaskEvent, thread_id: int) -> None:
+        subtask = event.subtask
+        start_event = self._started_subtasks.pop(subtask.id, None)
+
+        if start_event is None:
+            return
+
+        profile = self.task_profiles.get(subtask.parent_task_id)
+
+        if profile is not None:
+            profile.tool_time += event.timestamp - start_event.timestamp
+
+        self.spans.append(
+            RunProfiler.Span(
+                name=f"{subtask.action_name}.{subtask.action_activity}" if subtask.action_name else "Subtask",
+                category="tool",
+                start_time=start_event.timestamp,
+                end_time=event.timestamp,
+                thread_id=thread_id
+            )
+        )
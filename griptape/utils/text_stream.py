@@ -0,0 +1,47 @@
+from __future__ import annotations
+import queue
+from typing import Iterator, Optional
+from attr import define, field
+
+
+@define
+class TextStream:
+    """Text written in chunks by one thread and read by another as the chunks arrive.
+
+    Iterating over the stream blocks until the next chunk is written and ends when the stream is closed. If the
+    stream is closed with an error, the error is raised once all chunks written before it have been read. Each
+    chunk is read only once, so a stream should have a single reader.
+    """
+
+    has_chunks: bool = field(default=False, init=False)
+    _queue: queue.Queue = field(factory=queue.Queue, init=False)
+
+    @define
+    class Close:
+        error: Optional[Exception] = field(default=None)
+
+    def write(self, chunk: str) -> None:
+        self.has_chunks = True
+
+        self._queue.put(chunk)
+
+    def close(self, error: Optional[Exception] = None) -> None:
+        self._queue.put(TextStream.Close(error))
+
+    def read(self) -> str:
+        return "".join(self)
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            chunk = self._queue.get()
+
+            if isinstance(chunk, TextStream.Close):
+                # Leave the close marker in the queue, so that reading a closed stream again doesn't block.
+                self._queue.put(chunk)
+
+                if chunk.error:
+                    raise chunk.error
+                else:
+                    return
+            else:
+                yield chunk
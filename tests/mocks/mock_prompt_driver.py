@@ -1,3 +1,5 @@
+from __future__ import annotations
+from typing import Callable
 from attr import define, field
 from griptape.utils import PromptStack
 from griptape.drivers import BasePromptDriver
@@ -9,7 +11,14 @@ from griptape.artifacts import TextArtifact
 class MockPromptDriver(BasePromptDriver):
     model: str = "test-model"
     tokenizer: BaseTokenizer = OpenAiTokenizer()
-    mock_output: str = field(default="mock output", kw_only=True)
+    mock_output: str | Callable[[PromptStack], str] = field(default="mock output", kw_only=True)
+    stream: bool = field(default=False, kw_only=True)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.stream
 
     def try_run(self, prompt_stack: PromptStack) -> TextArtifact:
-        return TextArtifact(value=self.mock_output)
+        return TextArtifact(
+            value=self.mock_output(prompt_stack) if callable(self.mock_output) else self.mock_output
+        )
@@ -0,0 +1,24 @@
+import threading
+from attr import define, field
+from griptape.artifacts import TextArtifact
+from griptape.tasks import BaseTextInputTask
+
+
+@define
+class MockStreamingInputTask(BaseTextInputTask):
+    chunks: list[str] = field(factory=list, kw_only=True)
+    chunk_read: threading.Event = field(factory=threading.Event, kw_only=True)
+
+    @property
+    def supports_input_stream(self) -> bool:
+        return True
+
+    def run(self) -> TextArtifact:
+        if self.input_stream is None:
+            return TextArtifact(self.input.to_text())
+
+        for chunk in self.input_stream:
+            self.chunks.append(chunk)
+            self.chunk_read.set()
+
+        return TextArtifact("".join(self.chunks))
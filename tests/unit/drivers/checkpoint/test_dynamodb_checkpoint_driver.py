@@ -0,0 +1,64 @@
+import pytest
+from moto import mock_dynamodb
+import boto3
+from tests.utils.aws import mock_aws_credentials
+from griptape.artifacts import TextArtifact
+from griptape.drivers import DynamoDbCheckpointDriver
+
+
+class TestDynamoDbCheckpointDriver:
+    DYNAMODB_TABLE_NAME = "griptape"
+    DYNAMODB_PARTITION_KEY = "checkpointId"
+    DYNAMODB_SORT_KEY = "taskId"
+    AWS_REGION = "us-west-2"
+    VALUE_ATTRIBUTE_KEY = "output"
+
+    @pytest.fixture(autouse=True)
+    def run_before_and_after_tests(self):
+        mock_aws_credentials()
+        self.mock_dynamodb = mock_dynamodb()
+        self.mock_dynamodb.start()
+
+        dynamodb = boto3.Session(region_name=self.AWS_REGION).client("dynamodb")
+        dynamodb.create_table(
+            TableName=self.DYNAMODB_TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": self.DYNAMODB_PARTITION_KEY, "KeyType": "HASH"},
+                {"AttributeName": self.DYNAMODB_SORT_KEY, "KeyType": "RANGE"}
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": self.DYNAMODB_PARTITION_KEY, "AttributeType": "S"},
+                {"AttributeName": self.DYNAMODB_SORT_KEY, "AttributeType": "S"}
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+        yield
+
+        dynamodb.delete_table(TableName=self.DYNAMODB_TABLE_NAME)
+        self.mock_dynamodb.stop()
+
+    @pytest.fixture
+    def driver(self):
+        return DynamoDbCheckpointDriver(
+            session=boto3.Session(region_name=self.AWS_REGION),
+            table_name=self.DYNAMODB_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            sort_key=self.DYNAMODB_SORT_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY
+        )
+
+    def test_store_and_load(self, driver):
+        driver.store("checkpoint1", "task1", TextArtifact("foo"))
+        driver.store("checkpoint1", "task2", TextArtifact("bar"))
+        driver.store("checkpoint2", "task1", TextArtifact("baz"))
+
+        outputs = driver.load("checkpoint1")
+
+        assert len(outputs) == 2
+        assert outputs["task1"].value == "foo"
+        assert outputs["task2"].value == "bar"
+        assert driver.load("checkpoint2")["task1"].value == "baz"
+
+    def test_load_missing_checkpoint(self, driver):
+        assert driver.load("checkpoint1") == {}
@@ -0,0 +1,30 @@
+import pytest
+from griptape.artifacts import TextArtifact, ListArtifact
+from griptape.drivers import LocalCheckpointDriver
+
+
+class TestLocalCheckpointDriver:
+    @pytest.fixture
+    def driver(self, tmp_path):
+        return LocalCheckpointDriver(dir_path=str(tmp_path / "checkpoints"))
+
+    def test_store_and_load(self, driver):
+        driver.store("checkpoint1", "task1", TextArtifact("foo"))
+        driver.store("checkpoint1", "task2", ListArtifact([TextArtifact("bar")]))
+        driver.store("checkpoint2", "task1", TextArtifact("baz"))
+
+        outputs = driver.load("checkpoint1")
+
+        assert list(outputs.keys()) == ["task1", "task2"]
+        assert outputs["task1"].value == "foo"
+        assert outputs["task2"].value[0].value == "bar"
+        assert driver.load("checkpoint2")["task1"].value == "baz"
+
+    def test_store_overwrites_task_output(self, driver):
+        driver.store("checkpoint1", "task1", TextArtifact("foo"))
+        driver.store("checkpoint1", "task1", TextArtifact("bar"))
+
+        assert driver.load("checkpoint1")["task1"].value == "bar"
+
+    def test_load_missing_checkpoint(self, driver):
+        assert driver.load("checkpoint1") == {}
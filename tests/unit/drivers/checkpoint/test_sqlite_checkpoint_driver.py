@@ -0,0 +1,30 @@
+import pytest
+from griptape.artifacts import TextArtifact
+from griptape.drivers import SqliteCheckpointDriver
+
+
+class TestSqliteCheckpointDriver:
+    @pytest.fixture
+    def driver(self, tmp_path):
+        return SqliteCheckpointDriver(database=str(tmp_path / "checkpoints.db"))
+
+    def test_store_and_load(self, driver):
+        driver.store("checkpoint1", "task1", TextArtifact("foo"))
+        driver.store("checkpoint1", "task2", TextArtifact("bar"))
+        driver.store("checkpoint2", "task1", TextArtifact("baz"))
+
+        outputs = driver.load("checkpoint1")
+
+        assert len(outputs) == 2
+        assert outputs["task1"].value == "foo"
+        assert outputs["task2"].value == "bar"
+        assert driver.load("checkpoint2")["task1"].value == "baz"
+
+    def test_store_overwrites_task_output(self, driver):
+        driver.store("checkpoint1", "task1", TextArtifact("foo"))
+        driver.store("checkpoint1", "task1", TextArtifact("bar"))
+
+        assert driver.load("checkpoint1")["task1"].value == "bar"
+
+    def test_load_missing_checkpoint(self, driver):
+        assert driver.load("checkpoint1") == {}
@@ -1,3 +1,4 @@
+import openai
 import pytest
 from griptape.drivers import OpenAiEmbeddingDriver
 from griptape.tokenizers import OpenAiTokenizer
@@ -30,6 +31,19 @@ class TestOpenAiEmbeddingDriver:
         OpenAiEmbeddingDriver(model=model).try_embed_string("foo\nbar")
         assert mock_openai.call_args.kwargs['input'] == 'foo bar' if model.endswith('001') else 'foo\nbar'
 
+    def test_init_does_not_set_global_config(self):
+        api_key = openai.api_key
+
+        OpenAiEmbeddingDriver(api_key="driver-api-key")
+
+        assert openai.api_key == api_key
+
+    def test_try_embed_string_passes_config(self, mock_openai):
+        OpenAiEmbeddingDriver(api_key="driver-api-key", request_timeout=5).try_embed_string("foobar")
+
+        assert mock_openai.call_args.kwargs["api_key"] == "driver-api-key"
+        assert mock_openai.call_args.kwargs["request_timeout"] == 5
+
     def test_embed_chunk(self):
         assert OpenAiEmbeddingDriver().embed_chunk("foobar") == [0, 1, 0]
         assert OpenAiEmbeddingDriver().embed_chunk([1,2,3]) == [0, 1, 0]
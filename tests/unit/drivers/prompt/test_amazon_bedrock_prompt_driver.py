@@ -1,6 +1,7 @@
 from botocore.response import StreamingBody
 from griptape.artifacts import TextArtifact
 from griptape.drivers import AmazonBedrockPromptDriver
+from griptape.events import CompletionChunkEvent
 from griptape.drivers import BedrockClaudePromptModelDriver, BedrockTitanPromptModelDriver
 from griptape.tokenizers import AnthropicTokenizer, BedrockTitanTokenizer
 from io import StringIO
@@ -69,6 +70,52 @@ class TestAmazonBedrockPromptDriver:
         mock_model_driver.process_output.assert_called_once_with(response_body)
         assert text_artifact == mock_model_driver.process_output.return_value
 
+    def test_try_run_with_response_stream(self, mock_model_driver, mock_client, mocker):
+        # Given
+        driver = AmazonBedrockPromptDriver(
+            model='model',
+            prompt_model_driver=mock_model_driver,
+            stream=True
+        )
+        driver.structure = Mock()
+        mock_model_driver.prompt_stack_to_model_input.return_value = {}
+        mock_model_driver.process_output_chunk.side_effect = lambda chunk: TextArtifact(chunk.decode())
+        mock_client.invoke_model_with_response_stream.return_value = {
+            'body': [{'chunk': {'bytes': b'foo '}}, {'chunk': {'bytes': b'bar'}}]
+        }
+
+        # When
+        text_artifact = driver.try_run('prompt-stack')
+
+        # Then
+        mock_client.invoke_model.assert_not_called()
+        mock_client.invoke_model_with_response_stream.assert_called_once_with(
+            modelId=driver.model,
+            contentType='application/json',
+            accept='application/json',
+            body=json.dumps(mock_model_driver.prompt_stack_to_model_params.return_value),
+        )
+        assert text_artifact.value == 'foo bar'
+        events = [call.args[0] for call in driver.structure.publish_event.call_args_list]
+        assert all(isinstance(e, CompletionChunkEvent) for e in events)
+        assert [e.token for e in events] == ['foo ', 'bar']
+
+    def test_try_run_with_response_stream_throws_on_empty_response(self, mock_model_driver, mock_client):
+        # Given
+        driver = AmazonBedrockPromptDriver(
+            model='model',
+            prompt_model_driver=mock_model_driver,
+            stream=True
+        )
+        mock_client.invoke_model_with_response_stream.return_value = { 'body': [] }
+
+        # When
+        with pytest.raises(Exception) as e:
+            driver.try_run('prompt-stack')
+
+        # Then
+        assert e.value.args[0] == 'model response is empty'
+
     def test_try_run_throws_on_empty_response(self, mock_model_driver, mock_client):
         # Given
         driver = AmazonBedrockPromptDriver(
@@ -1,3 +1,4 @@
+from __future__ import annotations
 from botocore.response import StreamingBody
 from griptape.artifacts import TextArtifact
 from griptape.drivers import AmazonSageMakerPromptDriver, SageMakerLlamaPromptModelDriver
@@ -66,6 +67,37 @@ class TestAmazonSageMakerPromptDriver:
         mock_model_driver.process_output.assert_called_once_with(response_body)
         assert text_artifact == mock_model_driver.process_output.return_value
 
+    def test_try_run_many(self, mock_model_driver, mock_client):
+        # Given
+        driver = AmazonSageMakerPromptDriver(
+            model='model',
+            prompt_model_driver=mock_model_driver
+        )
+        prompt_stacks = ['prompt-stack-1', 'prompt-stack-2']
+        response_body = ['output-1', 'output-2']
+        mock_model_driver.prompt_stacks_to_model_input.return_value = ['model-input-1', 'model-input-2']
+        mock_model_driver.prompt_stacks_to_model_params.return_value = 'model-params'
+        mock_model_driver.process_outputs.return_value = [
+            TextArtifact('model-output-1'), TextArtifact('model-output-2')
+        ]
+        mock_client.invoke_endpoint.return_value = { 'Body': to_streaming_body(response_body) }
+
+        # When
+        text_artifacts = driver.try_run_many(prompt_stacks)
+
+        # Then
+        mock_client.invoke_endpoint.assert_called_once_with(
+            EndpointName=driver.model,
+            ContentType='application/json',
+            Body=json.dumps({
+                'inputs': ['model-input-1', 'model-input-2'],
+                'parameters': 'model-params'
+            }),
+            CustomAttributes='accept_eula=true',
+        )
+        mock_model_driver.process_outputs.assert_called_once_with(response_body)
+        assert text_artifacts == mock_model_driver.process_outputs.return_value
+
     def test_try_run_throws_on_empty_response(self, mock_model_driver, mock_client):
         # Given
         driver = AmazonSageMakerPromptDriver(
@@ -82,6 +114,6 @@ class TestAmazonSageMakerPromptDriver:
         assert e.value.args[0] == 'model response is empty'
 
 
-def to_streaming_body(text: str) -> StreamingBody:
+def to_streaming_body(text: str | list) -> StreamingBody:
     bytes = json.dumps(text).encode('utf-8')
     return StreamingBody(BytesIO(bytes), len(bytes))
\ No newline at end of file
@@ -43,6 +43,20 @@ class TestAnthropicPromptDriver:
         )
         assert text_artifact.value == 'model-output'
 
+    def test_try_run_reuses_client(self, mocker, mock_completion_create):
+        # Given
+        mock_anthropic = mocker.patch("anthropic.Anthropic")
+        driver = AnthropicPromptDriver(api_key='api-key', request_timeout=10, max_connections=5)
+
+        # When
+        driver.try_run(PromptStack())
+        driver.try_run(PromptStack())
+
+        # Then
+        mock_anthropic.assert_called_once_with(api_key='api-key', timeout=10, connection_pool_limits=ANY)
+        assert mock_anthropic.call_args.kwargs['connection_pool_limits'].max_connections == 5
+        assert mock_anthropic.return_value.completions.create.call_count == 2
+
     def test_try_run_throws_when_prompt_stack_is_string(self):
         # Given
         prompt_stack = 'prompt-stack'
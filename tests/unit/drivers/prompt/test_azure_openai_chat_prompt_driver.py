@@ -33,6 +33,7 @@ class TestAzureOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
             api_version=driver.api_version,
             api_base=driver.api_base,
             api_type=driver.api_type,
+            request_timeout=driver.request_timeout,
             messages=messages,
             deployment_id='deployment-id'
         )
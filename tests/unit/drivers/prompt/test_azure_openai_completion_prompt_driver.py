@@ -34,6 +34,7 @@ class TestAzureOpenAiCompletionPromptDriver(TestOpenAiCompletionPromptDriverFixt
             api_version=driver.api_version,
             api_base=driver.api_base,
             api_type=driver.api_type,
+            request_timeout=driver.request_timeout,
             prompt=prompt,
             deployment_id='deployment-id',
         )
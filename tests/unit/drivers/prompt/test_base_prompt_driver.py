@@ -45,6 +45,64 @@ class TestBasePromptDriver:
         assert isinstance(MockPromptDriver().run('prompt-stack'), TextArtifact)
 
 
+    def test_run_many(self):
+        prompt_stacks = [
+            PromptStack(inputs=[PromptStack.Input(f"foo{i}", role=PromptStack.USER_ROLE)]) for i in range(5)
+        ]
+
+        results = MockPromptDriver(
+            mock_output=lambda prompt_stack: prompt_stack.inputs[0].content
+        ).run_many(prompt_stacks)
+
+        assert [r.value for r in results] == [f"foo{i}" for i in range(5)]
+
+    def test_run_many_returns_per_item_errors(self):
+        def mock_output(prompt_stack: PromptStack) -> str:
+            if prompt_stack.inputs[0].content == "fail":
+                raise Exception("failed run")
+            else:
+                return prompt_stack.inputs[0].content
+
+        results = MockPromptDriver(mock_output=mock_output, max_attempts=1).run_many([
+            PromptStack(inputs=[PromptStack.Input("foo", role=PromptStack.USER_ROLE)]),
+            PromptStack(inputs=[PromptStack.Input("fail", role=PromptStack.USER_ROLE)]),
+            PromptStack(inputs=[PromptStack.Input("bar", role=PromptStack.USER_ROLE)])
+        ])
+
+        assert isinstance(results[0], TextArtifact)
+        assert results[0].value == "foo"
+        assert isinstance(results[1], ErrorArtifact)
+        assert results[1].value == "failed run"
+        assert isinstance(results[2], TextArtifact)
+        assert results[2].value == "bar"
+
+    def test_run_many_with_batching(self, mocker):
+        mocker.patch.object(MockPromptDriver, "supports_batching", True)
+        try_run_many = mocker.patch.object(
+            MockPromptDriver, "try_run_many", return_value=[TextArtifact(" foo "), TextArtifact(" bar ")]
+        )
+
+        results = MockPromptDriver().run_many(["prompt-stack-1", "prompt-stack-2"])
+
+        try_run_many.assert_called_once_with(["prompt-stack-1", "prompt-stack-2"])
+        assert [r.value for r in results] == ["foo", "bar"]
+
+    def test_run_many_falls_back_when_batch_fails(self, mocker):
+        mocker.patch.object(MockPromptDriver, "supports_batching", True)
+        mocker.patch.object(MockPromptDriver, "try_run_many", side_effect=Exception("batch failed"))
+
+        results = MockPromptDriver().run_many(["prompt-stack-1", "prompt-stack-2"])
+
+        assert [r.value for r in results] == ["mock output", "mock output"]
+
+    def test_try_run_many(self):
+        results = MockPromptDriver().try_run_many(["prompt-stack-1", "prompt-stack-2"])
+
+        assert [r.value for r in results] == ["mock output", "mock output"]
+
+    def test_shared_futures_executor(self):
+        assert MockPromptDriver().futures_executor is MockPromptDriver().futures_executor
+
     def test_token_count(self):
         assert MockPromptDriver().token_count(
             PromptStack(inputs=[PromptStack.Input("foobar", role=PromptStack.USER_ROLE)])
@@ -0,0 +1,168 @@
+import threading
+import time
+import pytest
+from griptape.artifacts import TextArtifact
+from griptape.drivers import CompositePromptDriver
+from griptape.utils import PromptStack
+from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def sleeping_output(seconds: float, output: str):
+    def mock_output(_: PromptStack) -> str:
+        time.sleep(seconds)
+
+        return output
+
+    return mock_output
+
+
+class TestCompositePromptDriver:
+    def test_init(self):
+        driver = MockPromptDriver()
+
+        assert CompositePromptDriver(prompt_drivers=[driver]).model == driver.model
+        assert CompositePromptDriver(prompt_drivers=[driver]).tokenizer == driver.tokenizer
+
+    def test_init_without_prompt_drivers(self):
+        with pytest.raises(ValueError):
+            CompositePromptDriver(prompt_drivers=[])
+
+    def test_init_with_invalid_hedge_percentile(self):
+        with pytest.raises(ValueError):
+            CompositePromptDriver(prompt_drivers=[MockPromptDriver()], hedge_percentile=0)
+
+    def test_init_with_invalid_max_hedged_requests(self):
+        with pytest.raises(ValueError):
+            CompositePromptDriver(prompt_drivers=[MockPromptDriver()], max_hedged_requests=0)
+
+    def test_run_retries_prompt_drivers(self):
+        driver = CompositePromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1, min_retry_delay=0, max_retry_delay=0)]
+        )
+
+        assert driver.run(PromptStack()).value == "success"
+
+    def test_run_failover(self):
+        driver = CompositePromptDriver(
+            prompt_drivers=[
+                MockFailingPromptDriver(max_failures=1, max_attempts=1),
+                MockPromptDriver(mock_output="backup output")
+            ]
+        )
+
+        assert driver.run(PromptStack()).value == "backup output"
+
+    def test_run_failover_raises_when_all_fail(self):
+        driver = CompositePromptDriver(
+            prompt_drivers=[
+                MockFailingPromptDriver(max_failures=1, max_attempts=1),
+                MockFailingPromptDriver(max_failures=1, max_attempts=1)
+            ]
+        )
+
+        with pytest.raises(Exception) as e:
+            driver.run(PromptStack())
+
+        assert e.value.args[0] == "failed attempt"
+
+    def test_run_least_latency(self):
+        slow_driver = MockPromptDriver(mock_output=sleeping_output(0.05, "slow output"))
+        fast_driver = MockPromptDriver(mock_output=sleeping_output(0, "fast output"))
+        driver = CompositePromptDriver(
+            prompt_drivers=[slow_driver, fast_driver],
+            strategy=CompositePromptDriver.Strategy.LEAST_LATENCY
+        )
+
+        # Drivers without latency samples are tried first.
+        assert driver.run(PromptStack()).value == "slow output"
+        assert driver.run(PromptStack()).value == "fast output"
+        assert driver.run(PromptStack()).value == "fast output"
+        assert driver.mean_latency(slow_driver) > driver.mean_latency(fast_driver)
+
+    def test_run_hedged(self):
+        driver = CompositePromptDriver(
+            prompt_drivers=[
+                MockPromptDriver(mock_output=sleeping_output(1, "slow output")),
+                MockPromptDriver(mock_output="fast output")
+            ],
+            strategy=CompositePromptDriver.Strategy.HEDGED,
+            default_hedge_delay=0.01
+        )
+
+        start_time = time.perf_counter()
+        result = driver.run(PromptStack())
+
+        assert isinstance(result, TextArtifact)
+        assert result.value == "fast output"
+        assert time.perf_counter() - start_time < 1
+
+    def test_run_hedged_with_duplicate_requests(self):
+        lock = threading.Lock()
+        runs = []
+
+        def mock_output(_: PromptStack) -> str:
+            with lock:
+                runs.append(True)
+                first_run = len(runs) == 1
+
+            if first_run:
+                time.sleep(1)
+
+                return "slow output"
+            else:
+                return "fast output"
+
+        driver = CompositePromptDriver(
+            prompt_drivers=[MockPromptDriver(mock_output=mock_output)],
+            strategy=CompositePromptDriver.Strategy.HEDGED,
+            default_hedge_delay=0.01,
+            max_hedged_requests=2
+        )
+
+        start_time = time.perf_counter()
+
+        assert driver.run(PromptStack()).value == "fast output"
+        assert time.perf_counter() - start_time < 1
+        assert len(runs) == 2
+
+    def test_run_hedged_fails_over_on_error(self):
+        driver = CompositePromptDriver(
+            prompt_drivers=[
+                MockFailingPromptDriver(max_failures=1, max_attempts=1),
+                MockPromptDriver(mock_output="backup output")
+            ],
+            strategy=CompositePromptDriver.Strategy.HEDGED,
+            default_hedge_delay=10
+        )
+
+        start_time = time.perf_counter()
+
+        assert driver.run(PromptStack()).value == "backup output"
+        assert time.perf_counter() - start_time < 10
+
+    def test_run_hedged_raises_when_all_fail(self):
+        driver = CompositePromptDriver(
+            prompt_drivers=[
+                MockFailingPromptDriver(max_failures=1, max_attempts=1),
+                MockFailingPromptDriver(max_failures=1, max_attempts=1)
+            ],
+            strategy=CompositePromptDriver.Strategy.HEDGED
+        )
+
+        with pytest.raises(Exception) as e:
+            driver.run(PromptStack())
+
+        assert e.value.args[0] == "failed attempt"
+
+    def test_hedge_delay(self):
+        prompt_driver = MockPromptDriver()
+        driver = CompositePromptDriver(prompt_drivers=[prompt_driver], default_hedge_delay=5, latency_window=3)
+
+        assert driver.hedge_delay(prompt_driver) == 5
+
+        for _ in range(5):
+            driver.run(PromptStack())
+
+        assert driver.hedge_delay(prompt_driver) < 5
+        assert len(driver._latencies[id(prompt_driver)]) == 3
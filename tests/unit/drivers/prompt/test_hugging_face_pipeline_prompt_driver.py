@@ -56,6 +56,57 @@ class TestHuggingFacePipelinePromptDriver:
         # Then
         e.value.args[0] == 'Completion with more than one choice is not supported yet.'
 
+    def test_try_run_reuses_pipeline(self, prompt_stack, mock_pipeline, mock_generator):
+        # Given
+        driver = HuggingFacePipelinePromptDriver(model='foo')
+
+        # When
+        driver.try_run(prompt_stack)
+        driver.try_run(prompt_stack)
+
+        # Then
+        mock_pipeline.assert_called_once()
+        assert mock_generator.call_count == 2
+        assert 'max_new_tokens' not in mock_pipeline.call_args.kwargs
+        assert 'max_new_tokens' in mock_generator.call_args.kwargs
+
+    def test_try_run_many(self, prompt_stack, mock_pipeline, mock_generator):
+        # Given
+        driver = HuggingFacePipelinePromptDriver(model='foo', batch_size=2)
+        mock_generator.return_value = [
+            [{'generated_text': 'model-output-1'}],
+            [{'generated_text': 'model-output-2'}]
+        ]
+
+        # When
+        text_artifacts = driver.try_run_many([prompt_stack, prompt_stack])
+
+        # Then
+        mock_pipeline.assert_called_once()
+        mock_generator.assert_called_once()
+        assert len(mock_generator.call_args.args[0]) == 2
+        assert mock_generator.call_args.kwargs['batch_size'] == 2
+        assert [a.value for a in text_artifacts] == ['model-output-1', 'model-output-2']
+
+    def test_try_run_many_without_pad_token(self, prompt_stack, mock_pipeline, mock_generator, mock_autotokenizer):
+        # Given
+        mock_autotokenizer.pad_token_id = None
+        mock_autotokenizer.eos_token_id = 42
+        driver = HuggingFacePipelinePromptDriver(model='foo', batch_size=2)
+        mock_generator.return_value = [[{'generated_text': 'model-output-1'}], [{'generated_text': 'model-output-2'}]]
+
+        # When
+        driver.try_run_many([prompt_stack, prompt_stack])
+
+        # Then
+        assert mock_pipeline.call_args.kwargs['tokenizer'].pad_token_id == 42
+        assert mock_autotokenizer.pad_token_id is None
+        assert mock_generator.call_args.kwargs['pad_token_id'] == 42
+
+    def test_try_run_many_empty(self, mock_pipeline):
+        assert HuggingFacePipelinePromptDriver(model='foo').try_run_many([]) == []
+        mock_pipeline.assert_not_called()
+
     def test_try_run_throws_when_unsupported_task_returned(self, prompt_stack, mock_generator):
         # Given
         driver = HuggingFacePipelinePromptDriver(model='foo')
@@ -55,10 +55,31 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
             api_version=driver.api_version,
             api_base=driver.api_base,
             api_type=driver.api_type,
+            request_timeout=driver.request_timeout,
             messages=messages
         )
         assert text_artifact.value == 'model-output'
 
+    def test_try_run_with_stream(self, mock_chat_completion_create, prompt_stack):
+        # Given
+        events = []
+        driver = OpenAiChatPromptDriver(stream=True, structure=Mock(publish_event=events.append))
+        mock_chat_completion_create.return_value = [
+            Mock(choices=[{'delta': {'role': 'assistant'}}]),
+            Mock(choices=[{'delta': {'content': 'model'}}]),
+            Mock(choices=[{'delta': {'content': '-output'}}]),
+            Mock(choices=[{'delta': {}}])
+        ]
+
+        # When
+        text_artifact = driver.try_run(prompt_stack)
+
+        # Then
+        assert mock_chat_completion_create.call_args.kwargs['stream'] is True
+        assert [event.token for event in events] == ['model', '-output']
+        assert text_artifact.value == 'model-output'
+        assert driver.supports_streaming
+
     def test_try_run_throws_when_prompt_stack_is_string(self):
         # Given
         driver = OpenAiChatPromptDriver()
@@ -53,6 +53,7 @@ class TestOpenAiCompletionPromptDriver(TestOpenAiCompletionPromptDriverFixtureMi
             api_version=driver.api_version,
             api_base=driver.api_base,
             api_type=driver.api_type,
+            request_timeout=driver.request_timeout,
             prompt=prompt
         )
         assert text_artifact.value == 'model-output'
@@ -80,3 +81,28 @@ class TestOpenAiCompletionPromptDriver(TestOpenAiCompletionPromptDriverFixtureMi
 
         # Then
         e.value.args[0] == 'Completion with more than one choice is not supported yet.'
+
+    def test_try_run_many(self, mock_completion_create, prompt_stack, prompt):
+        # Given
+        driver = OpenAiCompletionPromptDriver()
+        choices = [Mock(index=1, text='model-output-2 '), Mock(index=0, text=' model-output-1')]
+        mock_completion_create.return_value.choices = choices
+
+        # When
+        text_artifacts = driver.try_run_many([prompt_stack, prompt_stack])
+
+        # Then
+        assert driver.supports_batching
+        assert mock_completion_create.call_args.kwargs['prompt'] == [prompt, prompt]
+        assert [a.value for a in text_artifacts] == ['model-output-1', 'model-output-2']
+
+    def test_try_run_many_throws_when_choice_count_mismatches(self, mock_completion_create, prompt_stack):
+        # Given
+        driver = OpenAiCompletionPromptDriver()
+
+        # When
+        with pytest.raises(Exception) as e:
+            driver.try_run_many([prompt_stack, prompt_stack])
+
+        # Then
+        assert e.value.args[0] == 'Completion with more than one choice per prompt is not supported yet.'
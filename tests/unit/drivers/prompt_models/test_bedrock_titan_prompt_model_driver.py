@@ -58,5 +58,11 @@ class TestBedrockTitanPromptModelDriver:
             == "foobar"
         )
 
+    def test_process_output_chunk(self, driver):
+        assert driver.process_output_chunk(json.dumps({"outputText": "foobar", "index": 0}).encode()).value == "foobar"
+
     def test_session_initialization(self, driver, mock_session):
         assert driver.tokenizer.session == mock_session
+
+    def test_tokenizer_shares_prompt_driver_client(self, driver):
+        assert driver.tokenizer.bedrock_client is driver.prompt_driver.bedrock_client
@@ -42,6 +42,29 @@ class TestSageMakerLlamaPromptModelDriver:
             {"generation": {"content": "foobar"}}
         ]).value == "foobar"
 
+    def test_prompt_stacks_to_model_input(self, driver, stack):
+        model_input = driver.prompt_stacks_to_model_input([stack, stack])
+
+        assert len(model_input) == 2
+        assert model_input[1][1]["content"] == "bar"
+
+    def test_prompt_stacks_to_model_params(self, driver, stack):
+        long_stack = PromptStack()
+
+        long_stack.add_user_input("bar " * 100)
+
+        params = driver.prompt_stacks_to_model_params([stack, long_stack])
+
+        assert params["max_new_tokens"] == driver.prompt_stack_to_model_params(long_stack)["max_new_tokens"]
+        assert params["max_new_tokens"] < 588
+        assert params["temperature"] == 0.12345
+
+    def test_process_outputs(self, driver):
+        assert [a.value for a in driver.process_outputs([
+            {"generation": {"content": "foo"}},
+            {"generation": {"content": "bar"}}
+        ])] == ["foo", "bar"]
+
     def test_tokenizer_max_model_length(self, driver):
         assert driver.tokenizer.tokenizer.model_max_length == 600
 
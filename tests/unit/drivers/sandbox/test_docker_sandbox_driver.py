@@ -0,0 +1,109 @@
+import json
+import socket
+import struct
+import threading
+import pytest
+from griptape.artifacts import ErrorArtifact
+from griptape.drivers import DockerSandboxDriver
+from tests.mocks.docker.fake_api_client import make_fake_client
+
+
+class TestDockerSandboxDriver:
+    @pytest.fixture
+    def driver(self, tmp_path):
+        return DockerSandboxDriver(
+            docker_client=make_fake_client({"exec_start.return_value": (b"hello world\n", None)}),
+            image_name="test_image",
+            local_workdir=str(tmp_path),
+            env_vars={"FOO": "bar"},
+            pool_size=2
+        )
+
+    def test_start(self, driver, tmp_path):
+        driver.start()
+        driver.start()
+
+        api = driver.docker_client.api
+        _, kwargs = api.create_container.call_args
+
+        assert api.create_container.call_count == 2
+        assert kwargs["image"] == "test_image"
+        assert kwargs["command"] == ["sleep", "infinity"]
+        assert kwargs["environment"] == {"FOO": "bar"}
+        assert kwargs["name"].startswith("griptape_sandbox_")
+        assert kwargs["labels"] == {"griptape.sandbox": "griptape_sandbox"}
+
+    def test_execute_command(self, driver):
+        assert driver.execute_command("ls").value == "hello world"
+
+        (_, cmd), kwargs = driver.docker_client.api.exec_create.call_args
+
+        assert cmd == ["sh", "-c", "ls"]
+        assert kwargs["workdir"] == "/griptape"
+
+    def test_execute_code(self, driver, tmp_path):
+        assert driver.execute_code("foo.py", "print(1)").value == "hello world"
+        assert (tmp_path / "foo.py").read_text() == "print(1)"
+
+        (_, cmd), _ = driver.docker_client.api.exec_create.call_args
+
+        assert cmd == ["sh", "-c", "python foo.py"]
+
+    def test_execute_command_error(self, tmp_path):
+        driver = DockerSandboxDriver(
+            docker_client=make_fake_client({"exec_start.return_value": (None, b"error\n")}),
+            image_name="test_image",
+            local_workdir=str(tmp_path)
+        )
+        result = driver.execute_command("ls")
+
+        assert isinstance(result, ErrorArtifact)
+        assert result.value == "error"
+
+    def test_stop(self, driver):
+        driver.execute_command("ls")
+        driver.stop()
+
+        assert driver.docker_client.api.remove_container.call_count == 2
+
+        driver.execute_command("ls")
+
+        assert driver.docker_client.api.create_container.call_count == 4
+
+    def test_remove_containers(self, driver):
+        driver.execute_command("ls")
+        driver.remove_containers()
+
+        _, kwargs = driver.docker_client.api.containers.call_args
+
+        assert kwargs["all"] is True
+        assert kwargs["filters"] == {"label": "griptape.sandbox=griptape_sandbox"}
+        # The two pool containers and the container that was listed.
+        assert driver.docker_client.api.remove_container.call_count == 3
+
+    def test_repl_session(self, driver):
+        client_socket, server_socket = socket.socketpair()
+        driver.docker_client.api.attach_socket.return_value = client_socket
+
+        def serve() -> None:
+            with server_socket, server_socket.makefile("rb") as requests:
+                for line in requests:
+                    output = json.dumps({"stdout": f"ran {json.loads(line)['code']}", "stderr": ""}).encode() + b"\n"
+
+                    server_socket.sendall(struct.pack(">BxxxL", 1, len(output)) + output)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+
+        session = driver.start_repl_session()
+
+        assert session.execute("x = 1").value == "ran x = 1"
+        assert session.execute("print(x)").value == "ran print(x)"
+
+        session.close()
+        thread.join(timeout=5)
+
+        _, kwargs = driver.docker_client.api.create_container.call_args
+
+        assert kwargs["stdin_open"] is True
+        assert driver.docker_client.api.remove_container.call_count == 1
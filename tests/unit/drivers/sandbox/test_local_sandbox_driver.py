@@ -0,0 +1,122 @@
+import os
+import threading
+import pytest
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.drivers import LocalSandboxDriver
+
+
+class TestLocalSandboxDriver:
+    @pytest.fixture
+    def driver(self, tmp_path):
+        driver = LocalSandboxDriver(local_workdir=str(tmp_path), env_vars={"FOO": "bar"})
+
+        yield driver
+
+        driver.stop()
+
+    def test_execute_command(self, driver):
+        assert driver.execute_command("echo $FOO").value == "bar"
+        assert isinstance(driver.execute_command("echo error >&2"), ErrorArtifact)
+
+    def test_execute_code(self, driver, tmp_path):
+        result = driver.execute_code("foo.py", "import os\nprint(os.getcwd())")
+
+        assert isinstance(result, TextArtifact)
+        assert result.value == str(tmp_path)
+        assert (tmp_path / "foo.py").exists()
+
+    def test_execute_code_error(self, driver):
+        result = driver.execute_code("foo.py", "raise Exception('failed')")
+
+        assert isinstance(result, ErrorArtifact)
+        assert "failed" in result.value
+
+    @pytest.mark.parametrize("filename", ["../foo.py", "/tmp/foo.py", "foo/../../foo.py", "."])
+    def test_execute_code_outside_workdir(self, driver, filename):
+        with pytest.raises(ValueError):
+            driver.execute_code(filename, "print(1)")
+
+    def test_execute_code_in_subdirectory(self, driver, tmp_path):
+        os.mkdir(tmp_path / "foo")
+
+        assert driver.execute_code("foo/../foo/bar.py", "print(1)").value == "1"
+        assert (tmp_path / "foo" / "bar.py").exists()
+
+    def test_pool(self, tmp_path):
+        driver = LocalSandboxDriver(local_workdir=str(tmp_path), pool_size=2)
+        barrier = threading.Barrier(2, timeout=10)
+        sandboxes = []
+
+        def use_sandbox():
+            with driver.sandbox() as sandbox:
+                sandboxes.append(sandbox)
+                barrier.wait()
+
+        threads = [threading.Thread(target=use_sandbox) for _ in range(2)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert len({id(sandbox) for sandbox in sandboxes}) == 2
+
+        with driver.sandbox() as sandbox:
+            assert any(sandbox is s for s in sandboxes)
+
+    def test_reset_workdir(self, tmp_path):
+        driver = LocalSandboxDriver(local_workdir=str(tmp_path), reset_workdir=True)
+
+        with driver.sandbox() as sandbox:
+            assert sandbox.local_workdir != str(tmp_path)
+
+            driver.execute_command("mkdir foo && touch foo/bar baz", sandbox)
+
+            assert sorted(os.listdir(sandbox.local_workdir)) == ["baz", "foo"]
+
+        assert os.listdir(sandbox.local_workdir) == []
+
+        driver.stop()
+
+        assert not os.path.exists(sandbox.local_workdir)
+
+    def test_start_without_local_workdir(self):
+        with pytest.raises(ValueError):
+            LocalSandboxDriver().start()
+
+    def test_pool_size_validation(self):
+        with pytest.raises(ValueError):
+            LocalSandboxDriver(pool_size=0)
+
+    def test_repl_session(self, driver):
+        session = driver.start_repl_session()
+
+        try:
+            assert session.execute("import os\nx = os.environ['FOO']").value == ""
+            assert session.execute("print(x)").value == "bar"
+
+            result = session.execute("print(y)")
+
+            assert isinstance(result, ErrorArtifact)
+            assert "NameError" in result.value
+            assert session.execute("print(x * 2)").value == "barbar"
+        finally:
+            session.close()
+
+        assert isinstance(session.execute("print(x)"), ErrorArtifact)
+
+    def test_repl_session_timeout(self, tmp_path):
+        driver = LocalSandboxDriver(local_workdir=str(tmp_path), repl_timeout=3)
+        session = driver.start_repl_session()
+
+        try:
+            assert session.execute("x = 1").value == ""
+
+            result = session.execute("import time\ntime.sleep(60)")
+
+            assert isinstance(result, ErrorArtifact)
+            assert "timed out" in result.value
+            assert session.closed
+        finally:
+            session.close()
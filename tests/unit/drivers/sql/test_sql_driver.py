@@ -31,3 +31,14 @@ class TestSqlDriver:
                "[('id', INTEGER()), ('name', TEXT()), ('age', INTEGER()), ('city', TEXT())]"
 
         assert driver.get_table_schema("doesnt-exist") is None
+
+    def test_execute_query_pages(self, driver):
+        for i in range(4):
+            driver.execute_query(f"INSERT INTO test_table (name, age, city) VALUES ('Bob {i}', {30 + i}, 'Chicago');")
+
+        pages = list(driver.execute_query_pages("SELECT name FROM test_table ORDER BY id", page_size=2))
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert pages[0][0].cells == {"name": "Alice"}
+        assert pages[2][0].cells == {"name": "Bob 3"}
+        assert list(driver.execute_query_pages("SELECT name FROM test_table WHERE age > 100", page_size=2)) == []
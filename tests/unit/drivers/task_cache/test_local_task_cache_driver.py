@@ -0,0 +1,21 @@
+from griptape.artifacts import TextArtifact
+from griptape.drivers import LocalTaskCacheDriver
+
+
+class TestLocalTaskCacheDriver:
+    def test_store_and_load(self):
+        driver = LocalTaskCacheDriver()
+
+        driver.store("foo", TextArtifact("bar"))
+
+        assert driver.load("foo").value == "bar"
+        assert driver.load("baz") is None
+
+    def test_store_and_load_with_dir_path(self, tmp_path):
+        LocalTaskCacheDriver(dir_path=str(tmp_path)).store("foo", TextArtifact("bar"))
+
+        driver = LocalTaskCacheDriver(dir_path=str(tmp_path))
+
+        assert driver.load("foo").value == "bar"
+        assert "foo" in driver.entries
+        assert driver.load("baz") is None
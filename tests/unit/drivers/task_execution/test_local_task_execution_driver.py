@@ -0,0 +1,25 @@
+from concurrent import futures
+from griptape.drivers import LocalTaskExecutionDriver
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask, BaseTask
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+class TestLocalTaskExecutionDriver:
+    def test_submit(self):
+        driver = LocalTaskExecutionDriver()
+        task = PromptTask("test")
+        Workflow(prompt_driver=MockPromptDriver()) + task
+
+        output = driver.submit(task).result()
+
+        assert output.value == "mock output"
+        assert task.output is output
+        assert task.state == BaseTask.State.FINISHED
+
+    def test_workflow_default(self):
+        executor = futures.ThreadPoolExecutor()
+        workflow = Workflow(futures_executor=executor)
+
+        assert isinstance(workflow.task_execution_driver, LocalTaskExecutionDriver)
+        assert workflow.task_execution_driver.futures_executor is executor
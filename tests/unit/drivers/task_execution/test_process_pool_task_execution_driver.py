@@ -0,0 +1,100 @@
+import pickle
+import threading
+import pytest
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.drivers import ProcessPoolTaskExecutionDriver
+from griptape.events import StartTaskEvent, FinishTaskEvent
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask, BaseTask
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+class TestProcessPoolTaskExecutionDriver:
+    @pytest.fixture(scope="class")
+    def driver(self):
+        driver = ProcessPoolTaskExecutionDriver()
+
+        yield driver
+
+        driver.futures_executor.shutdown()
+
+    @pytest.fixture
+    def workflow(self, driver):
+        return Workflow(
+            prompt_driver=MockPromptDriver(),
+            embedding_driver=MockEmbeddingDriver(),
+            task_execution_driver=driver
+        )
+
+    def test_run(self, workflow):
+        events = []
+        task1 = PromptTask("test {{ args[0] }}", id="task1")
+        task2 = PromptTask("parent output: {{ parent_outputs['task1'] }}", id="task2")
+
+        workflow.event_listeners = [lambda event: events.append(event)]
+
+        workflow + task1
+        task1 >> task2
+
+        workflow.run("arg")
+
+        assert isinstance(task1.output, TextArtifact)
+        assert task1.output.value == "mock output"
+        assert task1.state == BaseTask.State.FINISHED
+        assert task2.output.value == "mock output"
+        assert task2.state == BaseTask.State.FINISHED
+        assert [type(event) for event in events] == [StartTaskEvent, FinishTaskEvent] * 2
+
+    def test_run_with_error(self, workflow):
+        task1 = PromptTask("test", prompt_driver=MockPromptDriver(mock_output=lambda _: "not picklable"))
+        task2 = PromptTask("test")
+
+        workflow + task1
+        task1 >> task2
+
+        workflow.run()
+
+        assert isinstance(task1.output, ErrorArtifact)
+        assert task1.state == BaseTask.State.FINISHED
+        assert task2.state == BaseTask.State.PENDING
+
+    def test_execute_payload(self, workflow, driver):
+        task = PromptTask("test")
+
+        workflow + task
+
+        output = driver.execute_payload(driver.task_to_payload(task))
+
+        assert output["type"] == "TextArtifact"
+        assert output["value"] == "mock output"
+        assert task.state == BaseTask.State.PENDING
+
+    def test_task_to_payload(self, workflow, driver):
+        task1 = PromptTask("test", id="task1")
+        task2 = PromptTask("test", id="task2")
+        task3 = PromptTask("test", id="task3")
+        task4 = PromptTask("test", id="task4")
+
+        workflow + task1
+        task1 >> task2 >> task3 >> task4
+        task1.output = TextArtifact("task1 output")
+
+        structure, task_id = pickle.loads(driver.task_to_payload(task2))
+
+        assert task_id == "task2"
+        assert [task.id for task in structure.tasks] == ["task2", "task1", "task3"]
+        assert structure.find_task("task1").output.value == "task1 output"
+        assert all(task.structure is structure for task in structure.tasks)
+        assert len(workflow.tasks) == 4
+        assert task2.structure is workflow
+
+    def test_task_to_payload_with_locks(self, workflow, driver):
+        task = PromptTask("test")
+
+        workflow + task
+        workflow.rules = [threading.Lock(), threading.RLock()]
+
+        structure, _ = pickle.loads(driver.task_to_payload(task))
+
+        assert [type(lock) for lock in structure.rules] == [type(threading.Lock()), type(threading.RLock())]
@@ -1,4 +1,5 @@
 import pytest
+from concurrent import futures
 from griptape.artifacts import TextArtifact, BaseArtifact
 from griptape.drivers import LocalVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
@@ -34,6 +35,18 @@ class TestLocalVectorStoreDriver:
         assert BaseArtifact.from_json(foo_entries[0].meta["artifact"]).value == "foo"
         assert BaseArtifact.from_json(bar_entries[0].meta["artifact"]).value == "bar"
 
+    def test_upsert_concurrently(self, driver):
+        def upsert_and_load(i: int) -> None:
+            driver.upsert_text_artifact(TextArtifact(f"foo {i}"), namespace=f"namespace{i % 2}")
+            driver.load_entries("namespace0")
+            driver.query("foo", namespace="namespace1")
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(upsert_and_load, range(200)))
+
+        assert len(driver.entries) == 200
+        assert len(driver.load_entries("namespace0")) == 100
+
     def test_query(self, driver):
         driver.upsert_text_artifact(
             TextArtifact("foobar"),
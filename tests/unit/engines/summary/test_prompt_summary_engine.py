@@ -18,3 +18,19 @@ class TestPromptSummaryEngine:
         assert engine.summarize_artifacts(
             ListArtifact([TextArtifact("foo"), TextArtifact("bar")])
         ).value == "mock output"
+
+    def test_summarize_text_stream(self, engine):
+        assert engine.summarize_text_stream(["foo", "bar"]) == "mock output"
+
+    def test_summarize_long_text_stream(self):
+        prompts = []
+        engine = PromptSummaryEngine(
+            prompt_driver=MockPromptDriver(
+                mock_output=lambda stack: prompts.append(stack.inputs[0].content) or "summary"
+            )
+        )
+        chunks = ["foo "] * (engine.max_chunker_tokens + 100)
+
+        assert engine.summarize_text_stream(chunks) == "summary"
+        assert len(prompts) == 2
+        assert "summary" in prompts[1]
@@ -0,0 +1,11 @@
+import pytest
+from griptape.events import CompletionChunkEvent
+
+
+class TestCompletionChunkEvent:
+    @pytest.fixture
+    def completion_chunk_event(self):
+        return CompletionChunkEvent(token="foo bar")
+
+    def test_token(self, completion_chunk_event):
+        assert completion_chunk_event.token == "foo bar"
@@ -44,6 +44,12 @@ class TestSqlLoader:
         assert result[1].value == {"id": 2, "name": "Bob", "age": 30, "city": "Los Angeles"}
         assert result[2].value == {"id": 3, "name": "Charlie", "age": 22, "city": "Chicago"}
 
+    def test_iter_pages(self, loader):
+        pages = list(loader.iter_pages("SELECT * FROM test_table;", page_size=2))
+
+        assert [len(page) for page in pages] == [2, 1]
+        assert pages[1][0].value == {"id": 3, "name": "Charlie", "age": 22, "city": "Chicago"}
+
     def test_load_collection(self, loader):
         artifacts = loader.load_collection([
             "SELECT * FROM test_table LIMIT 1;",
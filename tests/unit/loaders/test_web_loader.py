@@ -1,4 +1,10 @@
+import asyncio
 import json
+import multiprocessing
+import threading
+import time
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 from griptape import utils
@@ -7,20 +13,60 @@ from griptape.loaders import WebLoader
 MAX_TOKENS = 50
 
 
+class PageRequestHandler(BaseHTTPRequestHandler):
+    # Paths are "/<status>" for error responses and "/page-<number>" for pages. "/flaky" fails once and
+    # "/rate-limited" is rate limited once.
+    requests = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.requests.append(self.path)
+            request_count = self.requests.count(self.path)
+
+        if self.path == "/rate-limited" and request_count == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+
+            return
+
+        if self.path == "/flaky" and request_count == 1 or self.path.strip("/").isdigit():
+            self.send_response(503 if self.path == "/flaky" else int(self.path.strip("/")))
+            self.end_headers()
+
+            return
+
+        body = (
+            f"<html><body><article><h1>Page {self.path}</h1>"
+            + f"<p>This is the content of page {self.path}, which has a few sentences of text to extract. " * 5
+            + "</p></article></body></html>"
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
 class TestWebLoader:
     @pytest.fixture(autouse=True)
-    def mock_trafilatura(self, mocker):
-        fake_response = {
-            "status": 200,
-            "data": "foobar"
-        }
+    def mock_get(self, mocker):
+        fake_response = mocker.MagicMock(status_code=200, content=b"foobar", headers={"ETag": '"foo"'})
+
+        return mocker.patch("requests.Session.get", return_value=fake_response)
 
+    @pytest.fixture(autouse=True)
+    def mock_extract(self, mocker):
         fake_extract = {
             "text": "foobar"
         }
 
-        mocker.patch("trafilatura.fetch_url", return_value=fake_response)
-        mocker.patch("trafilatura.extract", return_value=json.dumps(fake_extract))
+        return mocker.patch("trafilatura.extract", return_value=json.dumps(fake_extract))
 
     @pytest.fixture
     def loader(self):
@@ -34,14 +80,147 @@ class TestWebLoader:
         assert len(artifacts) >= 1
         assert "foobar" in artifacts[0].value.lower()
 
-    def test_load_collection(self, loader):
-        artifacts = loader.load_collection([
-            "https://github.com/griptape-ai/griptape",
-            "https://github.com/griptape-ai/griptape-docs"
-        ])
-
-        assert list(artifacts.keys()) == [
-            utils.str_to_hash("https://github.com/griptape-ai/griptape"),
-            utils.str_to_hash("https://github.com/griptape-ai/griptape-docs")
-        ]
-        assert "foobar" in [a.value for artifact_list in artifacts.values() for a in artifact_list][0].lower()
+    def test_load_error(self, loader, mock_get):
+        mock_get.return_value.status_code = 404
+
+        with pytest.raises(Exception, match="can't access URL"):
+            loader.load("https://github.com/griptape-ai/griptape")
+
+    def test_page_cache(self, loader, mock_get, mock_extract):
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+
+        assert mock_get.call_count == 1
+        assert mock_extract.call_count == 1
+
+        loader.extract_page("https://github.com/griptape-ai/griptape", include_links=False)
+
+        assert mock_get.call_count == 1
+        assert mock_extract.call_count == 2
+
+        loader.clear_page_cache()
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+
+        assert mock_get.call_count == 2
+
+    def test_page_cache_revalidation(self, mocker, mock_get, mock_extract):
+        loader = WebLoader(page_cache_ttl=0)
+
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+
+        mock_get.return_value = mocker.MagicMock(status_code=304, headers={})
+
+        assert loader.extract_page("https://github.com/griptape-ai/griptape") == {"text": "foobar"}
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"foo"'}
+        assert mock_extract.call_count == 1
+
+    def test_page_cache_max_size(self, mock_get):
+        loader = WebLoader(max_cached_pages=1)
+
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+        loader.extract_page("https://github.com/griptape-ai/griptape-docs")
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+
+        assert mock_get.call_count == 3
+
+    def test_page_cache_disabled(self, mock_get):
+        loader = WebLoader(max_cached_pages=0)
+
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+        loader.extract_page("https://github.com/griptape-ai/griptape")
+
+        assert mock_get.call_count == 2
+
+
+class TestWebLoaderCollection:
+    @pytest.fixture
+    def server_url(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), PageRequestHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+
+        PageRequestHandler.requests = []
+
+        thread.start()
+
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def collection_loader(self):
+        return WebLoader(
+            max_tokens=MAX_TOKENS,
+            extraction_executor=futures.ThreadPoolExecutor(),
+            max_concurrency=4,
+            min_retry_delay=0,
+            max_retry_delay=0
+        )
+
+    def test_load_collection(self, server_url):
+        loader = WebLoader(max_tokens=MAX_TOKENS)
+        urls = [f"{server_url}/page-1", f"{server_url}/page-2"]
+        artifacts = loader.load_collection(urls)
+
+        assert loader.extraction_executor is loader.futures_executor
+        assert list(artifacts.keys()) == [utils.str_to_hash(url) for url in urls]
+        assert "content of page /page-1" in artifacts[utils.str_to_hash(urls[0])][0].value
+        assert "content of page /page-2" in artifacts[utils.str_to_hash(urls[1])][0].value
+
+    def test_load_collection_with_process_pool(self, server_url):
+        with futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            loader = WebLoader(max_tokens=MAX_TOKENS, extraction_executor=executor)
+            artifacts = loader.load_collection([f"{server_url}/page-1"])
+
+        assert "content of page /page-1" in artifacts[utils.str_to_hash(f"{server_url}/page-1")][0].value
+
+    def test_iter_collection(self, collection_loader, server_url):
+        urls = (f"{server_url}/page-{i}" for i in range(20))
+        results = list(collection_loader.iter_collection(urls))
+
+        assert sorted(url for url, _ in results) == sorted(f"{server_url}/page-{i}" for i in range(20))
+        assert all(len(artifacts) >= 1 for _, artifacts in results)
+
+    def test_iter_collection_retries(self, collection_loader, server_url):
+        results = list(collection_loader.iter_collection([f"{server_url}/flaky"]))
+
+        assert [url for url, _ in results] == [f"{server_url}/flaky"]
+        assert PageRequestHandler.requests == ["/flaky", "/flaky"]
+
+    def test_iter_collection_retry_after(self, collection_loader, server_url):
+        start_time = time.monotonic()
+        results = list(collection_loader.iter_collection([f"{server_url}/rate-limited"]))
+
+        assert [url for url, _ in results] == [f"{server_url}/rate-limited"]
+        assert time.monotonic() - start_time >= 1
+
+    def test_iter_collection_errors(self, collection_loader, server_url):
+        with pytest.raises(Exception, match="can't access URL"):
+            list(collection_loader.iter_collection([f"{server_url}/page-1", f"{server_url}/404"]))
+
+        results = list(
+            collection_loader.iter_collection([f"{server_url}/page-1", f"{server_url}/404"], ignore_errors=True)
+        )
+
+        assert [url for url, _ in results] == [f"{server_url}/page-1"]
+
+    def test_iter_collection_stop_early(self, collection_loader, server_url):
+        urls = (f"{server_url}/page-{i}" for i in range(1000))
+
+        for _ in collection_loader.iter_collection(urls):
+            break
+
+        assert len(PageRequestHandler.requests) < 1000
+
+    def test_iter_collection_uses_page_cache(self, collection_loader, server_url):
+        collection_loader.load(f"{server_url}/page-1")
+
+        list(collection_loader.iter_collection([f"{server_url}/page-1", f"{server_url}/page-2"]))
+
+        assert sorted(PageRequestHandler.requests) == ["/page-1", "/page-2"]
+
+    def test_aiter_collection(self, collection_loader, server_url):
+        async def load():
+            return [url async for url, _ in collection_loader.aiter_collection([f"{server_url}/page-1"])]
+
+        assert asyncio.run(load()) == [f"{server_url}/page-1"]
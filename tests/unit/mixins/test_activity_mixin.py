@@ -1,8 +1,33 @@
 import pytest
+from attr import define, field
+from jinja2 import Template
+from jsonschema.exceptions import ValidationError
 from schema import Schema
+from griptape.mixins import ActivityMixin
+from griptape.utils.decorators import activity
 from tests.mocks.mock_tool.tool import MockTool
 
 
+@define
+class MockActivities(ActivityMixin):
+    units: str = field(default="metric", kw_only=True)
+    unit_symbol_reads: int = field(default=0, init=False)
+
+    @property
+    def unit_symbol(self) -> str:
+        self.unit_symbol_reads += 1
+
+        return "C" if self.units == "metric" else "F"
+
+    @activity(config={"description": "Temperatures are returned in {{ _self.units }}."})
+    def get_temperature(self, _: dict) -> str:
+        return "20"
+
+    @activity(config={"description": "Temperatures are returned in degrees {{ _self.unit_symbol }}."})
+    def get_temperature_with_symbol(self, _: dict) -> str:
+        return "20"
+
+
 class TestActivityMixin:
     @pytest.fixture
     def tool(self):
@@ -19,6 +44,38 @@ class TestActivityMixin:
 
         assert description == f"test description: {tool.foo()}"
 
+    def test_activity_description_cache(self, mocker):
+        render = mocker.spy(Template, "render")
+        activities = MockActivities()
+
+        assert activities.activity_description(activities.get_temperature) == "Temperatures are returned in metric."
+        assert activities.activity_description(activities.get_temperature) == "Temperatures are returned in metric."
+        assert render.call_count == 1
+
+        activities.units = "imperial"
+
+        assert activities.activity_description(activities.get_temperature) == "Temperatures are returned in imperial."
+        assert render.call_count == 2
+
+    def test_activity_description_with_property(self, mocker):
+        render = mocker.spy(Template, "render")
+        activities = MockActivities()
+
+        description = activities.activity_description(activities.get_temperature_with_symbol)
+
+        assert description == "Temperatures are returned in degrees C."
+        assert activities.activity_description(activities.get_temperature_with_symbol) == description
+        assert render.call_count == 2
+        assert activities.unit_symbol_reads == 2
+
+    def test_activity_description_with_method_call(self, tool, mocker):
+        render = mocker.spy(Template, "render")
+
+        tool.activity_description(tool.test)
+        tool.activity_description(tool.test)
+
+        assert render.call_count == 2
+
     def test_activity_uses_default_memory(self, tool):
         assert tool.activity_uses_default_memory(tool.test) is True
         assert tool.activity_uses_default_memory(tool.test_without_default_memory) is False
@@ -31,6 +88,21 @@ class TestActivityMixin:
 
     def test_activity_with_no_schema(self, tool):
         assert tool.activity_schema(tool.test_no_schema) is None
+        assert tool.activity_validator(tool.test_no_schema) is None
+
+    def test_activity_schema_is_cached(self, tool):
+        assert tool.activity_schema(tool.test) is MockTool().activity_schema(MockTool().test)
+
+    def test_activity_validator(self, tool):
+        validator = tool.activity_validator(tool.test)
+
+        assert validator is tool.activity_validator(tool.test)
+        assert validator.schema == tool.activity_schema(tool.test)
+
+        validator.validate({"values": {"test": "foo"}})
+
+        with pytest.raises(ValidationError):
+            validator.validate({"values": {"test": 1}})
 
     def test_find_activity(self):
         tool = MockTool(
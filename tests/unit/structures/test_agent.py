@@ -1,4 +1,6 @@
+from concurrent import futures
 import pytest
+from griptape.events import StartPromptEvent
 from griptape.memory.structure import ConversationMemory
 from griptape.memory.tool import TextToolMemory
 from griptape.rules import Rule, Ruleset
@@ -230,6 +232,69 @@ class TestAgent:
 
         assert task.input.to_text() == "-"
 
+    def test_run_isolated(self):
+        prompt_driver = MockPromptDriver(mock_output=lambda prompt_stack: prompt_stack.inputs[-1].content)
+        agent = Agent(prompt_driver=prompt_driver, input_template="{{ args[0] }}")
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            runs = list(executor.map(agent.run_isolated, [f"input {i}" for i in range(16)]))
+
+        for i, run in enumerate(runs):
+            assert run is not agent
+            assert run.id != agent.id
+            assert run.prompt_driver is not prompt_driver
+            assert run.prompt_driver.structure is run
+            assert run.task.output.value == f"input {i}"
+            assert [r.input for r in run.memory.runs] == [f"input {i}"]
+
+        assert agent.task.state == BaseTask.State.PENDING
+        assert agent.task.output is None
+        assert agent.execution_args == ()
+        assert agent.memory.runs == []
+
+    def test_run_isolated_prompt_events(self):
+        agent = Agent(prompt_driver=MockPromptDriver(), event_listeners={StartPromptEvent: []})
+        runs = [agent.copy_for_run() for _ in range(2)]
+        events = [[], []]
+
+        for run, run_events in zip(runs, events):
+            run.event_listeners = {StartPromptEvent: [run_events.append]}
+
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda run: run.run("test"), runs))
+
+        assert [len(run_events) for run_events in events] == [1, 1]
+        assert agent.prompt_driver.structure is agent
+
+    def test_run_isolated_with_memory(self):
+        agent = Agent(prompt_driver=MockPromptDriver())
+        memory = ConversationMemory()
+
+        agent.run_isolated("test1", memory=memory)
+        run = agent.run_isolated("test2", memory=memory)
+
+        assert run.memory is memory
+        assert len(memory.runs) == 2
+        assert agent.memory.runs == []
+
+    def test_copy_for_run(self):
+        agent = Agent(prompt_driver=MockPromptDriver(), tools=[MockTool()])
+        agent.run("test")
+
+        run = agent.copy_for_run()
+
+        assert run.task is not agent.task
+        assert run.task.id == agent.task.id
+        assert run.task.structure is run
+        assert run.task.generate_system_template.__self__ is run.task
+        assert run.task.tools == agent.task.tools
+        assert run.task.state == BaseTask.State.PENDING
+        assert run.task.subtasks == []
+        assert len(agent.task.subtasks) > 0
+        assert run.memory is not agent.memory
+        assert run.memory.runs == agent.memory.runs
+        assert run.find_task(agent.task.id) is run.task
+
     def test_context(self):
         task = PromptTask("test prompt")
         agent = Agent(prompt_driver=MockPromptDriver())
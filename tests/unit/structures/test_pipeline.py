@@ -1,12 +1,20 @@
+import logging
+import sys
 import pytest
 
-from griptape.artifacts import TextArtifact
+from griptape.artifacts import TextArtifact, ErrorArtifact
 from griptape.memory.tool import TextToolMemory
 from griptape.rules import Rule, Ruleset
 from griptape.tokenizers import OpenAiTokenizer
-from griptape.tasks import PromptTask, BaseTask, ToolkitTask
+from griptape.tasks import PromptTask, BaseTask, ToolkitTask, TextSummaryTask
+from griptape.engines import PromptSummaryEngine
+from griptape.events import CompletionChunkEvent
 from griptape.memory.structure import ConversationMemory
+from griptape.drivers import LocalCheckpointDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
+from tests.mocks.mock_streaming_input_task import MockStreamingInputTask
+from tests.mocks.mock_text_input_task import MockTextInputTask
 from griptape.structures import Pipeline
 from tests.mocks.mock_tool.tool import MockTool
 from tests.unit.structures.test_agent import MockEmbeddingDriver
@@ -276,6 +284,152 @@ class TestPipeline:
 
         assert task.input.to_text() == "-"
 
+    def test_run_resume_from_checkpoint(self, tmp_path):
+        prompts = []
+        prompt_driver = MockPromptDriver(mock_output=lambda prompt_stack: prompts.append(prompt_stack) or "mock output")
+        task1 = PromptTask("test1", id="task1", prompt_driver=prompt_driver)
+        task2 = PromptTask("test2", id="task2", prompt_driver=MockFailingPromptDriver(max_failures=1, max_attempts=1))
+        task3 = PromptTask("test3", id="task3", prompt_driver=prompt_driver)
+        pipeline = Pipeline(
+            prompt_driver=MockPromptDriver(),
+            checkpoint_driver=LocalCheckpointDriver(dir_path=str(tmp_path))
+        )
+
+        pipeline + [task1, task2, task3]
+
+        pipeline.run()
+
+        assert isinstance(task2.output, ErrorArtifact)
+        assert task3.state == BaseTask.State.PENDING
+        assert len(prompts) == 1
+
+        result = pipeline.run(resume_from=pipeline.checkpoint_id)
+
+        assert result.output.value == "mock output"
+        assert task1.output.value == "mock output"
+        assert task2.output.value == "success"
+        assert len(prompts) == 2
+
+    def test_run_resume_without_checkpoint_driver(self):
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline + PromptTask("test")
+
+        with pytest.raises(ValueError):
+            pipeline.run(resume_from="checkpoint")
+
+    def test_run_long_pipeline(self):
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(), logger_level=logging.ERROR)
+
+        pipeline + [MockTextInputTask("{{ parent_output or 'test' }}") for _ in range(sys.getrecursionlimit() + 100)]
+
+        assert pipeline.run().output.value == "test"
+
+    def test_run_with_stream(self):
+        consumer = MockStreamingInputTask()
+        pipeline = Pipeline(stream=True)
+
+        def mock_output(_) -> str:
+            pipeline.publish_event(CompletionChunkEvent(token="foo"))
+
+            # The consumer reads the first chunk before the producer finishes.
+            read = consumer.chunk_read.wait(timeout=5)
+
+            pipeline.publish_event(CompletionChunkEvent(token="bar"))
+
+            return "foobar" if read else "timed out"
+
+        producer = PromptTask("test", prompt_driver=MockPromptDriver(mock_output=mock_output, stream=True))
+        child = PromptTask("child: {{ parent_output }}")
+
+        pipeline.prompt_driver = MockPromptDriver(mock_output=lambda stack: stack.inputs[-1].content)
+        pipeline + [producer, consumer, child]
+
+        result = pipeline.run()
+
+        assert producer.output.value == "foobar"
+        assert consumer.chunks == ["foo", "bar"]
+        assert result.output.value == "child: foobar"
+
+    def test_run_with_stream_without_chunks(self):
+        consumer = TextSummaryTask("{{ parent_output }}", summary_engine=PromptSummaryEngine(
+            prompt_driver=MockPromptDriver(mock_output=lambda stack: f"summary of {stack.inputs[-1].content}")
+        ))
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(stream=True), stream=True)
+
+        pipeline + [PromptTask("test"), consumer]
+
+        assert consumer.supports_input_stream
+
+        pipeline.run()
+
+        assert "summary of" in consumer.output.value
+        assert "mock output" in consumer.output.value
+
+    def test_run_with_stream_without_streaming_driver(self):
+        consumer = MockStreamingInputTask()
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(), stream=True)
+
+        pipeline + [PromptTask("test"), consumer]
+
+        with pytest.raises(ValueError):
+            pipeline.run()
+
+        assert consumer.state == BaseTask.State.PENDING
+
+    def test_run_with_stream_from_task_without_output_stream(self):
+        consumer = MockStreamingInputTask()
+        producer = ToolkitTask("test", tools=[MockTool()])
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(), stream=True)
+
+        def mock_output(_) -> str:
+            pipeline.publish_event(CompletionChunkEvent(token="Answer: done"))
+
+            return "Answer: done"
+
+        pipeline.prompt_driver = MockPromptDriver(mock_output=mock_output, stream=True)
+        pipeline + [producer, consumer]
+
+        pipeline.run()
+
+        assert not producer.supports_output_stream
+        assert producer.output.value == "done"
+        assert consumer.chunks == ["done"]
+
+    def test_run_with_stream_and_custom_template(self):
+        consumer = TextSummaryTask("Text: {{ parent_output }} (end)", summary_engine=PromptSummaryEngine(
+            prompt_driver=MockPromptDriver(mock_output=lambda stack: f"summary of {stack.inputs[-1].content}")
+        ))
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(), stream=True)
+
+        pipeline + [PromptTask("test"), consumer]
+
+        assert not consumer.supports_input_stream
+
+        pipeline.run()
+
+        assert "Text: mock output (end)" in consumer.output.value
+
+    def test_run_with_stream_and_error(self):
+        consumer = MockStreamingInputTask()
+        child = PromptTask("child")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(), memory=ConversationMemory(), stream=True)
+
+        def mock_output(_) -> str:
+            raise Exception("failed")
+
+        producer = PromptTask(
+            "test",
+            prompt_driver=MockPromptDriver(mock_output=mock_output, stream=True, max_attempts=1)
+        )
+
+        pipeline + [producer, consumer, child]
+
+        pipeline.run()
+
+        assert isinstance(consumer.output, ErrorArtifact)
+        assert child.state == BaseTask.State.PENDING
+
     def test_context(self):
         parent = PromptTask("parent")
         task = PromptTask("test")
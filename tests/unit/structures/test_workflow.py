@@ -1,7 +1,15 @@
+import threading
+import time
+from concurrent import futures
+from graphlib import CycleError
 import pytest
 
 from griptape.memory.tool import TextToolMemory
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.drivers import LocalCheckpointDriver, LocalTaskCacheDriver, LocalTaskExecutionDriver
+from griptape.events import FinishTaskEvent
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
 from griptape.rules import Rule, Ruleset
 from griptape.tasks import PromptTask, BaseTask, ToolkitTask
 from griptape.structures import Workflow
@@ -217,6 +225,348 @@ class TestWorkflow:
         assert task2.state == BaseTask.State.FINISHED
         assert task3.state == BaseTask.State.FINISHED
 
+    def test_run_starts_children_when_parents_finish(self):
+        release = threading.Event()
+        slow_task = PromptTask(
+            "slow",
+            prompt_driver=MockPromptDriver(mock_output=lambda _: "released" if release.wait(timeout=5) else "timed out")
+        )
+        fast_task = PromptTask("fast")
+        fast_child_task = PromptTask("fast child", prompt_driver=MockPromptDriver(mock_output=lambda _: release.set()))
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + [slow_task, fast_task]
+        fast_task >> fast_child_task
+
+        workflow.run()
+
+        # fast_child_task unblocks slow_task, so it has to start before slow_task finishes.
+        assert slow_task.output.value == "released"
+        assert fast_child_task.state == BaseTask.State.FINISHED
+
+    def test_run_stops_on_error(self):
+        task1 = PromptTask("test1", prompt_driver=MockFailingPromptDriver(max_failures=1, max_attempts=1))
+        task2 = PromptTask("test2")
+        task3 = PromptTask("test3")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + [task1, task2]
+        task1 >> task3
+
+        workflow.run()
+
+        assert isinstance(task1.output, ErrorArtifact)
+        assert task2.state == BaseTask.State.FINISHED
+        assert task3.state == BaseTask.State.PENDING
+
+    def test_run_skips_finished_tasks(self):
+        task1 = PromptTask("test1")
+        task2 = PromptTask("test2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task1
+        task1 >> task2
+
+        task1.output = TextArtifact("done")
+        task1.state = BaseTask.State.FINISHED
+
+        workflow.run()
+
+        assert task1.output.value == "done"
+        assert task2.state == BaseTask.State.FINISHED
+
+    def test_run_with_cycle(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + [task1, task2]
+        task1.child_ids.append("task2")
+        task2.child_ids.append("task1")
+
+        with pytest.raises(CycleError):
+            workflow.run()
+
+    def test_run_resume_from_checkpoint(self, tmp_path):
+        prompts = []
+        prompt_driver = MockPromptDriver(mock_output=lambda prompt_stack: prompts.append(prompt_stack) or "mock output")
+        checkpoint_driver = LocalCheckpointDriver(dir_path=str(tmp_path))
+
+        def create_workflow() -> Workflow:
+            workflow = Workflow(prompt_driver=prompt_driver, checkpoint_driver=checkpoint_driver)
+            task1 = PromptTask("test1", id="task1")
+            task2 = PromptTask(
+                "test2",
+                id="task2",
+                prompt_driver=MockFailingPromptDriver(max_failures=1, max_attempts=1)
+            )
+            task3 = PromptTask("test3", id="task3")
+
+            workflow + [task1, task2]
+            task1 >> task3
+            task2 >> task3
+
+            return workflow
+
+        workflow = create_workflow()
+
+        workflow.run()
+
+        assert isinstance(workflow.find_task("task2").output, ErrorArtifact)
+        assert workflow.find_task("task3").state == BaseTask.State.PENDING
+        assert len(prompts) == 1
+
+        workflow.run(resume_from=workflow.checkpoint_id)
+
+        assert workflow.find_task("task2").output.value == "success"
+        assert workflow.find_task("task3").state == BaseTask.State.FINISHED
+        assert len(prompts) == 2
+
+        # Resuming with a new structure with the same task IDs restores all task outputs.
+        new_workflow = create_workflow()
+
+        new_workflow.run(resume_from=workflow.checkpoint_id)
+
+        assert new_workflow.find_task("task1").output.value == "mock output"
+        assert new_workflow.find_task("task2").output.value == "success"
+        assert new_workflow.find_task("task3").state == BaseTask.State.FINISHED
+        assert len(prompts) == 2
+
+    def test_run_checkpoints_tasks_finishing_after_failure(self, tmp_path):
+        task2_finished = threading.Event()
+        prompts = []
+
+        def slow_output(prompt_stack) -> str:
+            # Only finish once the failing sibling has finished.
+            task2_finished.wait(timeout=5)
+            prompts.append(prompt_stack)
+
+            return "mock output"
+
+        checkpoint_driver = LocalCheckpointDriver(dir_path=str(tmp_path))
+        workflow = Workflow(
+            prompt_driver=MockPromptDriver(mock_output=slow_output),
+            checkpoint_driver=checkpoint_driver,
+            event_listeners={FinishTaskEvent: [lambda event: event.task.id == "task2" and task2_finished.set()]}
+        )
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2", prompt_driver=MockFailingPromptDriver(max_failures=1, max_attempts=1))
+        task3 = PromptTask("test3", id="task3")
+
+        workflow + [task1, task2]
+        task1 >> task3
+        task2 >> task3
+
+        workflow.run()
+
+        assert isinstance(task2.output, ErrorArtifact)
+        assert task1.output.value == "mock output"
+        assert "task1" in checkpoint_driver.load(workflow.checkpoint_id)
+        assert len(prompts) == 1
+
+        workflow.run(resume_from=workflow.checkpoint_id)
+
+        assert task3.state == BaseTask.State.FINISHED
+        assert len(prompts) == 2
+
+    def test_run_with_raising_task_execution_driver(self, mocker):
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+        task = PromptTask("{{ args[0] }}")
+
+        workflow + task
+
+        future = futures.Future()
+        future.set_exception(Exception("can't submit task"))
+        mocker.patch.object(LocalTaskExecutionDriver, "submit", return_value=future)
+
+        workflow.run("test")
+
+        assert task.output is None
+        assert workflow.execution_args == ()
+
+    def test_run_isolated(self):
+        prompt_driver = MockPromptDriver(mock_output=lambda prompt_stack: prompt_stack.inputs[-1].content)
+        workflow = Workflow(prompt_driver=prompt_driver)
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("{{ args[0] }}", id="task2")
+
+        workflow.add_task(task1)
+        task1 >> task2
+
+        run1 = workflow.run_isolated("foo")
+        run2 = workflow.run_isolated("bar")
+
+        assert run1.find_task("task2").output.value == "foo"
+        assert run2.find_task("task2").output.value == "bar"
+        assert run1.find_task("task2").state == BaseTask.State.FINISHED
+        assert run1.find_task("task2").parents[0] is run1.find_task("task1")
+        assert task1.state == BaseTask.State.PENDING
+        assert task2.state == BaseTask.State.PENDING
+        assert task2.output is None
+
+        run1.find_task("task1").child_ids.append("task3")
+
+        assert task1.child_ids == ["task2"]
+
+    def test_run_without_checkpoint_driver(self):
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + PromptTask("test")
+
+        workflow.run()
+
+        assert workflow.checkpoint_id is None
+
+        with pytest.raises(ValueError):
+            workflow.run(resume_from="checkpoint")
+
+    def test_run_with_task_cache(self):
+        prompts = []
+        cache_driver = LocalTaskCacheDriver()
+
+        def run_workflow(task2_template: str) -> Workflow:
+            workflow = Workflow(
+                prompt_driver=MockPromptDriver(
+                    mock_output=lambda stack: prompts.append(stack.inputs[-1].content) or "mock output"
+                ),
+                task_cache_driver=cache_driver
+            )
+            task1 = PromptTask("test1", id="task1")
+            task2 = PromptTask(task2_template, id="task2")
+            task3 = PromptTask("test3 {{ parent_outputs['task2'] }}", id="task3")
+
+            workflow + task1
+            task1 >> task2 >> task3
+
+            workflow.run()
+
+            return workflow
+
+        run_workflow("test2")
+
+        assert prompts == ["test1", "test2", "test3 mock output"]
+
+        run_workflow("test2")
+
+        assert len(prompts) == 3
+
+        # task3 input doesn't change because task2 output is the same.
+        run_workflow("test2 changed")
+
+        assert prompts == ["test1", "test2", "test3 mock output", "test2 changed"]
+
+    def test_run_with_concurrency_limits(self):
+        lock = threading.Lock()
+        executing = []
+        max_executing = []
+
+        def mock_output(_) -> str:
+            with lock:
+                executing.append(True)
+                max_executing.append(len(executing))
+
+            time.sleep(0.05)
+
+            with lock:
+                executing.pop()
+
+            return "mock output"
+
+        workflow = Workflow(
+            prompt_driver=MockPromptDriver(mock_output=mock_output),
+            concurrency_limits={"model:test-model": 2}
+        )
+
+        workflow + [PromptTask(f"test{i}") for i in range(6)]
+
+        workflow.run()
+
+        assert all(task.is_finished() for task in workflow.tasks)
+        assert max(max_executing) <= 2
+
+    def test_run_with_concurrency_limits_computes_resource_tags_once(self, mocker):
+        all_resource_tags = mocker.patch.object(
+            PromptTask, "all_resource_tags", new_callable=mocker.PropertyMock, return_value=["model:test-model"]
+        )
+        workflow = Workflow(prompt_driver=MockPromptDriver(), concurrency_limits={"model:test-model": 1})
+
+        workflow + [PromptTask(f"test{i}") for i in range(6)]
+
+        workflow.run()
+
+        assert all(task.is_finished() for task in workflow.tasks)
+        assert all_resource_tags.call_count == 6
+
+    def test_run_with_several_concurrency_limits(self):
+        lock = threading.Lock()
+        tags = [["a"], ["a", "b"], ["b"], ["b"], ["a", "b"], []]
+        executing = []
+        max_executing = []
+
+        def mock_output(stack) -> str:
+            task_tags = tags[int(stack.inputs[-1].content.removeprefix("test"))]
+
+            with lock:
+                executing.append(task_tags)
+                max_executing.append((sum("a" in t for t in executing), sum("b" in t for t in executing)))
+
+            time.sleep(0.02)
+
+            with lock:
+                executing.remove(task_tags)
+
+            return "mock output"
+
+        workflow = Workflow(
+            prompt_driver=MockPromptDriver(mock_output=mock_output),
+            concurrency_limits={"a": 1, "b": 2}
+        )
+
+        workflow + [PromptTask(f"test{i}", resource_tags=task_tags) for i, task_tags in enumerate(tags)]
+
+        workflow.run()
+
+        assert all(task.is_finished() for task in workflow.tasks)
+        assert max(a for a, _ in max_executing) <= 1
+        assert max(b for _, b in max_executing) <= 2
+
+    def test_run_with_critical_path_priority(self):
+        prompts = []
+        workflow = Workflow(
+            prompt_driver=MockPromptDriver(mock_output=lambda stack: prompts.append(stack.inputs[-1].content) or "out"),
+            max_concurrent_tasks=1
+        )
+        short_task = PromptTask("short")
+        long_task = PromptTask("long1")
+
+        workflow + [short_task, long_task]
+        long_task >> PromptTask("long2") >> PromptTask("long3")
+
+        workflow.run()
+
+        # Tasks with the same critical path length run in the order they became ready.
+        assert prompts == ["long1", "long2", "short", "long3"]
+
+    def test_concurrency_limits_validation(self):
+        with pytest.raises(ValueError):
+            Workflow(concurrency_limits={"model:test-model": 0})
+
+        with pytest.raises(ValueError):
+            Workflow(max_concurrent_tasks=0)
+
+    def test_critical_path_lengths(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        task3 = PromptTask("prompt3", id="task3")
+        task4 = PromptTask("prompt4", id="task4")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + [task1, task4]
+        task1 >> task2 >> task3
+        task1 >> task3
+
+        assert workflow.critical_path_lengths() == {"task1": 3, "task2": 2, "task3": 1, "task4": 1}
+
     def test_output_tasks(self):
         task1 = PromptTask("prompt1")
         task2 = PromptTask("prompt2")
@@ -246,6 +596,86 @@ class TestWorkflow:
         assert "task1" in graph["task2"]
         assert "task1" in graph["task3"]
 
+    def test_find_task(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task1
+        task1 >> task2
+
+        assert workflow.find_task("task1") is task1
+        assert workflow.find_task("task2") is task2
+        assert workflow.find_task("task3") is None
+
+    def test_find_task_with_directly_added_task(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task1
+        workflow.tasks.append(task2)
+
+        assert workflow.find_task("task2") is task2
+
+        workflow.tasks.remove(task1)
+
+        assert workflow.find_task("task1") is None
+
+    def test_find_task_with_replaced_task(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task1
+
+        assert workflow.find_task("task1") is task1
+
+        workflow.tasks[0] = task2
+
+        assert workflow.find_task("task1") is None
+        assert workflow.find_task("task2") is task2
+
+        workflow.tasks = []
+        workflow.tasks.append(task1)
+
+        assert workflow.find_task("task1") is task1
+        assert workflow.find_task("task2") is None
+
+    def test_add_task_with_duplicate_id(self):
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + PromptTask("prompt1", id="task1")
+
+        with pytest.raises(ValueError):
+            workflow + PromptTask("prompt2", id="task1")
+
+        assert len(workflow.tasks) == 1
+
+    def test_add_child_after_replacing_ids(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task1
+        task1 >> task2
+
+        task1.child_ids = []
+        task1 >> task2
+        task1 >> task2
+
+        assert task1.child_ids == ["task2"]
+        assert task2.parent_ids == ["task1"]
+
+    def test_add_task_twice(self):
+        task = PromptTask("prompt1")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + task
+        workflow + task
+
+        assert len(workflow.tasks) == 1
+
     def test_order_tasks(self):
         task1 = PromptTask("prompt1")
         task2 = PromptTask("prompt2")
@@ -1,4 +1,5 @@
 import json
+from tests.mocks.mock_tool.tool import MockTool
 from griptape.tasks import ToolkitTask, ActionSubtask
 from griptape.structures import Pipeline
 
@@ -54,3 +55,36 @@ class TestActionSubtask:
 
     def test_input(self):
         assert ActionSubtask("{{ hello }}").input.value == "{{ hello }}"
+
+    def test_split_actions(self):
+        value = 'Thought: need to test\n' \
+                'Action: [{"type": "tool", "name": "test", "activity": "foo"}, ' \
+                '{"type": "tool", "name": "test", "activity": "bar"}]'
+
+        assert ActionSubtask.split_actions(value) == [
+            'Thought: need to test\nAction: {"type": "tool", "name": "test", "activity": "foo"}',
+            'Thought: need to test\nAction: {"type": "tool", "name": "test", "activity": "bar"}'
+        ]
+
+    def test_split_actions_without_list(self):
+        single_action = 'Action: {"type": "tool", "name": "test", "activity": "foo"}\nObservation: [1]'
+        invalid_action = 'Action: [{"type": "tool"'
+
+        assert ActionSubtask.split_actions(single_action) == [single_action]
+        assert ActionSubtask.split_actions(invalid_action) == [invalid_action]
+        assert ActionSubtask.split_actions("Answer: done") == ["Answer: done"]
+
+    def test_action_validator(self):
+        validator = ActionSubtask.action_validator(["tool"])
+
+        assert validator is ActionSubtask.action_validator(["tool"])
+        assert validator is not ActionSubtask.action_validator(["tool", "memory"])
+
+    def test_init_from_prompt_with_invalid_activity_input(self):
+        value = 'Action: {"type": "tool", "name": "Tool1", "activity": "test", "input": {"values": {"test": 1}}}'
+        task = ToolkitTask(tools=[MockTool(name="Tool1")])
+        Pipeline().add_task(task)
+        subtask = task.add_subtask(ActionSubtask(value))
+
+        assert subtask.action_name == "error"
+        assert "Activity input JSON validation error" in subtask.action_input["error"]
@@ -1,3 +1,5 @@
+from griptape.artifacts import TextArtifact
+from griptape.drivers import CompositePromptDriver, LocalTaskCacheDriver, OpenAiChatPromptDriver
 from griptape.tasks import PromptTask
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from griptape.structures import Pipeline
@@ -18,3 +20,89 @@ class TestPromptSubtask:
         Pipeline().add_task(task)
 
         assert task.input.to_text() == "test value"
+
+    def test_cache_key(self):
+        task = PromptTask("test")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline.add_task(task)
+
+        cache_key = task.cache_key()
+
+        assert cache_key == task.cache_key()
+
+        task.input_template = "test2"
+
+        assert task.cache_key() != cache_key
+
+        task.input_template = "test"
+        task.prompt_driver = MockPromptDriver(model="test-model-2")
+
+        assert task.cache_key() != cache_key
+
+    def test_cache_key_with_driver_config(self):
+        task = PromptTask("test")
+        pipeline = Pipeline(prompt_driver=OpenAiChatPromptDriver(model="gpt-4", api_key="key"))
+
+        pipeline.add_task(task)
+
+        cache_key = task.cache_key()
+
+        task.prompt_driver = OpenAiChatPromptDriver(model="gpt-4", api_key="other key")
+
+        assert task.cache_key() == cache_key
+
+        task.prompt_driver = OpenAiChatPromptDriver(model="gpt-4", api_key="key", api_base="https://example.com/v1")
+
+        assert task.cache_key() != cache_key
+
+        task.prompt_driver = CompositePromptDriver(prompt_drivers=[MockPromptDriver(), MockPromptDriver(model="a")])
+        cache_key = task.cache_key()
+        task.prompt_driver = CompositePromptDriver(prompt_drivers=[MockPromptDriver(), MockPromptDriver(model="b")])
+
+        assert task.cache_key() != cache_key
+
+    def test_cache_key_with_parent_output(self):
+        parent = PromptTask("parent")
+        task = PromptTask("test")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline + [parent, task]
+
+        cache_key = task.cache_key()
+
+        parent.output = TextArtifact("parent output")
+
+        assert task.cache_key() != cache_key
+
+    def test_run_with_cache(self):
+        prompts = []
+        cache_driver = LocalTaskCacheDriver()
+
+        def run_pipeline(input_template: str) -> PromptTask:
+            task = PromptTask(input_template)
+            pipeline = Pipeline(
+                prompt_driver=MockPromptDriver(mock_output=lambda stack: prompts.append(stack) or "mock output"),
+                task_cache_driver=cache_driver
+            )
+
+            pipeline.add_task(task)
+            pipeline.run()
+
+            return task
+
+        assert run_pipeline("test").output.value == "mock output"
+        assert run_pipeline("test").output.value == "mock output"
+        assert len(prompts) == 1
+
+        run_pipeline("test2")
+
+        assert len(prompts) == 2
+
+    def test_all_resource_tags(self):
+        task = PromptTask("test", resource_tags=["foo"])
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline.add_task(task)
+
+        assert task.all_resource_tags == ["foo", "prompt_driver:MockPromptDriver", "model:test-model"]
@@ -1,12 +1,15 @@
+import json
+from concurrent import futures
 import pytest
 from griptape.drivers import LocalVectorStoreDriver
 from griptape.engines import VectorQueryEngine, PromptSummaryEngine
 from griptape.memory.tool import TextToolMemory
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.mocks.mock_tool.tool import MockTool
-from griptape.artifacts import ErrorArtifact
+from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.tasks import ToolkitTask, ActionSubtask
 from tests.mocks.mock_value_prompt_driver import MockValuePromptDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
 from griptape.structures import Pipeline, Agent
 
 
@@ -57,6 +60,131 @@ class TestToolkitSubtask:
         assert len(task.subtasks) == 3
         assert isinstance(task.output, ErrorArtifact)
 
+    def test_run_parallel_actions(self):
+        prompt_stacks = []
+        outputs = iter([
+            'Thought: test in parallel\n'
+            'Action: [{"type": "tool", "name": "Tool1", "activity": "test", "input": {"values": {"test": "foo"}}}, '
+            '{"type": "tool", "name": "Tool2", "activity": "test", "input": {"values": {"test": "bar"}}}]',
+            "Answer: done"
+        ])
+
+        class RecordingExecutor(futures.ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args, **kwargs):
+                RecordingExecutor.submitted += 1
+
+                return super().submit(*args, **kwargs)
+
+        task = ToolkitTask(
+            "test",
+            tools=[MockTool(name="Tool1"), MockTool(name="Tool2")],
+            futures_executor=RecordingExecutor()
+        )
+        pipeline = Pipeline(
+            prompt_driver=MockPromptDriver(mock_output=lambda stack: prompt_stacks.append(stack) or next(outputs)),
+            tool_memory=None
+        )
+
+        pipeline.add_task(task)
+
+        result = pipeline.run()
+        subtask1, subtask2, subtask3 = task.subtasks
+
+        assert result.output.to_text() == "done"
+        assert RecordingExecutor.submitted == 2
+        assert subtask1.output.to_text() == "ack foo"
+        assert subtask2.output.to_text() == "ack bar"
+        assert subtask1.thought == subtask2.thought == "test in parallel"
+        assert subtask3.parent_ids == [subtask1.id, subtask2.id]
+        assert [[s.id for s in step] for step in task.steps()] == [[subtask1.id, subtask2.id], [subtask3.id]]
+
+        assistant_input, user_input = [i.content for i in prompt_stacks[1].inputs[-2:]]
+
+        assert assistant_input.startswith("Thought: test in parallel\nAction: [")
+        assert json.loads(assistant_input.split("Action: ")[1])[1]["name"] == "Tool2"
+        assert user_input == "Observation 1: ack foo\nObservation 2: ack bar\n"
+
+    def test_default_futures_executor_is_shared(self):
+        assert ToolkitTask("test").futures_executor is ToolkitTask("test").futures_executor
+
+    def test_prompt_stack_renders_each_step_once(self):
+        rendered = []
+        action = 'Action: {"type": "tool", "name": "Tool1", "activity": "test", "input": {"values": {"test": "foo"}}}'
+        outputs = iter([action, action, action, "Answer: done"])
+        task = ToolkitTask(
+            "test",
+            tools=[MockTool(name="Tool1")],
+            generate_system_template=lambda _: rendered.append("system") or "system",
+            generate_assistant_subtask_template=lambda s: rendered.append(f"assistant {s.id}") or "assistant",
+            generate_user_subtask_template=lambda s: rendered.append(f"user {s.id}") or "user"
+        )
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(mock_output=lambda _: next(outputs)), tool_memory=None)
+
+        pipeline.add_task(task)
+        pipeline.run()
+
+        assert rendered.count("system") == 1
+        assert len(rendered) == 1 + 2 * 3
+        assert len(set(rendered)) == len(rendered)
+
+    def test_prompt_stack_with_unfinished_step(self):
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")])
+        subtask1 = ActionSubtask("test1", action_name="test", action_activity="test", action_input={"values": {"f": "b"}})
+        subtask2 = ActionSubtask("test2", action_name="test", action_activity="test", action_input={"values": {"f": "b"}})
+
+        Pipeline(prompt_driver=MockPromptDriver()).add_task(task)
+
+        task.add_subtask(subtask1)
+        subtask1.output = TextArtifact("foo")
+        task.add_subtask(subtask2)
+
+        assert task.prompt_stack.inputs[-1].content.strip() == "Please, keep going!"
+
+        subtask2.output = TextArtifact("bar")
+
+        assert [i.content.strip() for i in task.prompt_stack.inputs[-3:]] == [
+            "Observation: foo", 'Action: {"name": "test", "activity": "test", "input": {"values": {"f": "b"}}}',
+            "Observation: bar"
+        ]
+
+        task.reset()
+
+        assert len(task.prompt_stack.inputs) == 2
+
+    def test_add_subtasks(self):
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")])
+        subtask1 = ActionSubtask("test1", action_name="test", action_activity="test", action_input={"values": {"f": "b"}})
+        subtask2 = ActionSubtask("test2", action_name="test", action_activity="test", action_input={"values": {"f": "b"}})
+        subtask3 = ActionSubtask("test3", action_name="test", action_activity="test", action_input={"values": {"f": "b"}})
+
+        Pipeline().add_task(task)
+
+        task.add_subtasks(subtask1, subtask2)
+        task.add_subtask(subtask3)
+
+        assert subtask1.parent_ids == subtask2.parent_ids == []
+        assert subtask1.child_ids == subtask2.child_ids == [subtask3.id]
+        assert subtask3.parent_ids == [subtask1.id, subtask2.id]
+        assert len(task.steps()) == 2
+
+    def test_cache_key(self):
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")])
+
+        Pipeline(prompt_driver=MockValuePromptDriver("Answer: done")).add_task(task)
+
+        assert task.cache_key() is None
+
+    def test_all_resource_tags(self):
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1"), MockTool(name="Tool2")])
+
+        Pipeline(prompt_driver=MockValuePromptDriver("Answer: done")).add_task(task)
+
+        assert task.all_resource_tags == [
+            "prompt_driver:MockValuePromptDriver", "model:test-model", "tool:Tool1", "tool:Tool2"
+        ]
+
     def test_init_from_prompt_1(self):
         valid_input = 'Thought: need to test\n' \
                       'Action: {"type": "tool", "name": "test", "activity": "test action", "input": "test input"}\n' \
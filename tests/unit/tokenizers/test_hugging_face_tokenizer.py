@@ -3,6 +3,7 @@ from os import environ
 environ["TRANSFORMERS_VERBOSITY"] = "error"
 
 import pytest
+from unittest.mock import Mock
 from transformers import GPT2Tokenizer
 from griptape.tokenizers import HuggingFaceTokenizer
 
@@ -25,3 +26,19 @@ class TestHuggingFaceTokenizer:
 
     def test_tokens_left(self, tokenizer):
         assert tokenizer.tokens_left("foo bar huzzah") == 1019
+
+    def test_from_pretrained_is_cached(self):
+        tokenizer_class = Mock()
+        tokenizer_class.from_pretrained.side_effect = lambda name, **kwargs: Mock(**kwargs)
+
+        first_tokenizer = HuggingFaceTokenizer.from_pretrained(tokenizer_class, "foo", model_max_length=10)
+        second_tokenizer = HuggingFaceTokenizer.from_pretrained(tokenizer_class, "foo", model_max_length=10)
+        other_tokenizer = HuggingFaceTokenizer.from_pretrained(tokenizer_class, "foo", model_max_length=20)
+
+        assert first_tokenizer.tokenizer is second_tokenizer.tokenizer
+        assert other_tokenizer.tokenizer is not first_tokenizer.tokenizer
+        assert first_tokenizer.max_tokens == 10
+        assert other_tokenizer.max_tokens == 20
+        assert tokenizer_class.from_pretrained.call_count == 2
+        tokenizer_class.from_pretrained.assert_any_call("foo", model_max_length=10)
+        tokenizer_class.from_pretrained.assert_any_call("foo", model_max_length=20)
@@ -1,5 +1,6 @@
 import inspect
 import os
+import subprocess
 import pytest
 import yaml
 from schema import SchemaMissingKeyError
@@ -7,6 +8,7 @@ from griptape.drivers import LocalVectorStoreDriver
 from griptape.engines import VectorQueryEngine, PromptSummaryEngine
 from griptape.memory.tool import TextToolMemory
 from griptape.tasks import ActionSubtask
+from griptape.tools import base_tool
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.mocks.mock_tool.tool import MockTool
 
@@ -30,6 +32,14 @@ class TestBaseTool:
         with open(tool.manifest_path, "r") as yaml_file:
             assert tool.manifest == yaml.safe_load(yaml_file)
 
+    def test_manifest_cache(self, tool, mocker):
+        base_tool._load_manifest.cache_clear()
+        safe_load = mocker.spy(yaml, "safe_load")
+
+        assert tool.manifest == MockTool().manifest
+        assert tool.manifest is not tool.manifest
+        assert safe_load.call_count == 1
+
     def test_abs_file_path(self, tool):
         assert tool.abs_file_path == os.path.abspath(inspect.getfile(tool.__class__))
 
@@ -131,3 +141,87 @@ class TestBaseTool:
             tool.test_list_output,
             ActionSubtask("foo")
         ).to_text() == "foo\n\nbar"
+
+    @pytest.fixture
+    def requirements(self, mocker, tmp_path):
+        def create_requirements(content: str):
+            path = tmp_path / "requirements.txt"
+
+            path.write_text(content)
+            mocker.patch.object(MockTool, "requirements_path", new_callable=mocker.PropertyMock, return_value=str(path))
+            base_tool._installed_requirements.clear()
+
+            return mocker.patch(
+                "subprocess.run", return_value=subprocess.CompletedProcess(args=[], returncode=0)
+            )
+
+        return create_requirements
+
+    def test_install_dependencies_with_installed_requirements(self, requirements, tmp_path):
+        run = requirements("pyyaml>=1\n# comment\n\nfoo>=1; python_version < '3'\n")
+
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+
+        run.assert_not_called()
+
+    def test_install_dependencies_with_missing_requirements(self, requirements, tmp_path):
+        run = requirements("griptape-missing-package==1.0\n")
+
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+
+        run.assert_called_once()
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_install_dependencies_with_unverifiable_requirements(self, requirements, tmp_path):
+        run = requirements("pyyaml[extra]>=1\n")
+
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+        base_tool._installed_requirements.clear()
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+
+        run.assert_called_once()
+
+    def test_install_dependencies_with_uninstalled_unverifiable_requirements(self, requirements, tmp_path):
+        run = requirements("griptape-missing-package[extra]==1.0\n")
+
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+        base_tool._installed_requirements.clear()
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+
+        assert run.call_count == 2
+
+    def test_install_dependencies_with_failed_install(self, requirements, tmp_path):
+        run = requirements("griptape-missing-package==1.0\n")
+        run.return_value = subprocess.CompletedProcess(args=[], returncode=1)
+
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+        MockTool(dependencies_cache_dir=str(tmp_path / "cache"))
+
+        assert run.call_count == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_requirements_satisfied(self, requirements):
+        requirements("pyyaml>=1\n")
+
+        assert MockTool(install_dependencies_on_init=False).requirements_satisfied() is True
+
+        requirements("pyyaml<1\n")
+
+        assert MockTool(install_dependencies_on_init=False).requirements_satisfied() is False
+
+        requirements("-r other.txt\npyyaml>=1\n")
+
+        assert MockTool(install_dependencies_on_init=False).requirements_satisfied() is None
+
+        requirements("pyyaml[extra]>=1\n")
+
+        assert MockTool(install_dependencies_on_init=False).requirements_satisfied() is None
+
+        requirements("-r other.txt\ngriptape-missing-package\n")
+
+        assert MockTool(install_dependencies_on_init=False).requirements_satisfied() is False
+
+        requirements("griptape-missing-package[extra]\n")
+
+        assert MockTool(install_dependencies_on_init=False).requirements_satisfied() is False
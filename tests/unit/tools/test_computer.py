@@ -1,18 +1,132 @@
 import pytest
 from tests.mocks.docker.fake_api_client import make_fake_client
+from griptape.artifacts import ErrorArtifact
+from griptape.drivers import DockerSandboxDriver, LocalSandboxDriver
+from griptape.structures import Agent
+from griptape.tasks import ActionSubtask
 from griptape.tools import Computer
+from tests.mocks.mock_prompt_driver import MockPromptDriver
 
 
 class TestComputer:
     @pytest.fixture
     def computer(self):
         return Computer(
-            docker_client=make_fake_client(),
+            docker_client=make_fake_client({"exec_start.return_value": (b"hello world\n", None)}),
             install_dependencies_on_init=False
         )
 
+    @pytest.fixture
+    def local_computer(self, tmp_path):
+        computer = Computer(
+            sandbox_driver=LocalSandboxDriver(),
+            local_workdir=str(tmp_path),
+            install_dependencies_on_init=False
+        )
+
+        yield computer
+
+        computer.close()
+
     def test_execute_code(self, computer):
         assert computer.execute_code({"values": {"code": "print(1)", "filename": "foo.py"}}).value == "hello world"
 
     def test_execute_command(self, computer):
-        assert computer.execute_command({"values": {"command": "ls"}}).value == "hello world"
\ No newline at end of file
+        assert computer.execute_command({"values": {"command": "ls"}}).value == "hello world"
+
+    def test_default_sandbox_driver(self, computer):
+        assert isinstance(computer.sandbox_driver, DockerSandboxDriver)
+        assert computer.sandbox_driver.local_workdir == computer.local_workdir
+        assert computer.sandbox_driver.workdir == "/griptape"
+
+    def test_reuses_containers(self, computer):
+        computer.execute_command({"values": {"command": "ls"}})
+        computer.execute_command({"values": {"command": "ls"}})
+
+        assert computer.docker_client.api.create_container.call_count == 1
+        assert computer.docker_client.api.exec_create.call_count == 2
+
+        computer.close()
+
+        assert computer.docker_client.api.remove_container.call_count == 1
+
+    def test_local_sandbox_driver(self, local_computer, tmp_path):
+        result = local_computer.execute_code({"values": {"code": "print(6 * 7)", "filename": "foo.py"}})
+
+        assert result.value == "42"
+        assert (tmp_path / "foo.py").read_text() == "print(6 * 7)"
+        assert local_computer.execute_command({"values": {"command": "ls"}}).value == "foo.py"
+        assert isinstance(local_computer.execute_command({"values": {"command": "ls missing"}}), ErrorArtifact)
+
+    def test_code_outside_workdir(self, local_computer, tmp_path):
+        result = local_computer.execute_code({"values": {"code": "print(1)", "filename": "../foo.py"}})
+
+        assert isinstance(result, ErrorArtifact)
+        assert not (tmp_path.parent / "foo.py").exists()
+
+    def test_repl_sessions(self, tmp_path):
+        outputs = iter([
+            'Action: {"type": "tool", "name": "Computer", "activity": "execute_code", '
+            '"input": {"values": {"code": "x = 42", "filename": "a.py"}}}',
+            'Action: {"type": "tool", "name": "Computer", "activity": "execute_code", '
+            '"input": {"values": {"code": "print(x)", "filename": "b.py"}}}',
+            "Answer: done"
+        ])
+        computer = Computer(
+            name="Computer",
+            sandbox_driver=LocalSandboxDriver(),
+            local_workdir=str(tmp_path),
+            use_repl_sessions=True,
+            install_dependencies_on_init=False
+        )
+        agent = Agent(
+            prompt_driver=MockPromptDriver(mock_output=lambda _: next(outputs)),
+            tools=[computer],
+            tool_memory=None
+        )
+
+        try:
+            agent.run("test")
+
+            assert agent.task.subtasks[1].output.value == "42"
+            assert computer._repl_sessions == {}
+        finally:
+            computer.close()
+
+    def test_repl_sessions_per_run(self, tmp_path):
+        computer = Computer(
+            name="Computer",
+            sandbox_driver=LocalSandboxDriver(),
+            local_workdir=str(tmp_path),
+            use_repl_sessions=True,
+            install_dependencies_on_init=False
+        )
+        agent = Agent(prompt_driver=MockPromptDriver(), tools=[computer], tool_memory=None)
+        runs = [agent.copy_for_run() for _ in range(2)]
+
+        def execute_code(run: Agent, code: str):
+            subtask = ActionSubtask(action_input={"values": {"code": code, "filename": "a.py"}})
+
+            subtask.attach_to(run.task)
+
+            return computer.execute(computer.execute_code, subtask)
+
+        try:
+            execute_code(runs[0], "x = 42")
+
+            assert execute_code(runs[0], "print(x)").value == "42"
+            assert isinstance(execute_code(runs[1], "print(x)"), ErrorArtifact)
+            assert len(computer._repl_sessions) == 2
+
+            computer.finish_task(runs[0].task)
+
+            assert list(computer._repl_sessions) == [(runs[1].id, runs[1].task.id)]
+        finally:
+            computer.close()
+
+    def test_code_without_repl_session_isolated(self, local_computer):
+        local_computer.execute_code({"values": {"code": "x = 42", "filename": "a.py"}})
+
+        result = local_computer.execute_code({"values": {"code": "print(x)", "filename": "b.py"}})
+
+        assert isinstance(result, ErrorArtifact)
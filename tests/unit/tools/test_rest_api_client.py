@@ -77,3 +77,110 @@ class TestRestApi:
         url = client._build_url('https://foo.bar', path_params=["fizz", "buzz", 1, 2, 3])
 
         assert url == 'https://foo.bar/fizz/buzz/1/2/3'
+
+    def test_default_session(self):
+        from griptape.tools import RestApiClient
+
+        client = RestApiClient(
+            base_url="http://www.griptape.ai", description="Griptape website.", max_retries=5, pool_maxsize=20
+        )
+        adapter = client.session.get_adapter("https://www.griptape.ai")
+
+        assert adapter.max_retries.total == 5
+        assert adapter._pool_maxsize == 20
+
+    def test_get_without_cache(self, client, mocker):
+        mock_get = mocker.patch("requests.Session.get", return_value=mocker.MagicMock(status_code=200, text="foo"))
+
+        client.get({"values": {"query_params": {"limit": 10}}})
+        client.get({"values": {"query_params": {"limit": 10}}})
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs == {"params": {"limit": 10}, "timeout": 30}
+
+    def test_get_cache(self, mocker):
+        from griptape.tools import RestApiClient
+
+        mock_get = mocker.patch(
+            "requests.Session.get", return_value=mocker.MagicMock(status_code=200, text="foo", headers={})
+        )
+        client = RestApiClient(base_url="http://www.griptape.ai", description="Griptape website.", get_cache_ttl=60)
+
+        assert client.get({"values": {"query_params": {"a": 1, "b": 2}}}).value == "foo"
+        assert client.get({"values": {"query_params": {"b": 2, "a": 1}}}).value == "foo"
+        assert mock_get.call_count == 1
+
+        client.get({"values": {"query_params": {"a": 2}}})
+        client.get({"values": {"path_params": ["1"]}})
+
+        assert mock_get.call_count == 3
+
+        client.clear_get_cache()
+        client.get({"values": {"query_params": {"a": 1, "b": 2}}})
+
+        assert mock_get.call_count == 4
+
+    def test_get_cache_revalidation(self, mocker):
+        from griptape.tools import RestApiClient
+
+        mock_get = mocker.patch(
+            "requests.Session.get",
+            return_value=mocker.MagicMock(
+                status_code=200, text="foo", headers={"ETag": '"foo"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+            )
+        )
+        client = RestApiClient(base_url="http://www.griptape.ai", description="Griptape website.", get_cache_ttl=0)
+
+        client.get({"values": {}})
+
+        mock_get.return_value = mocker.MagicMock(status_code=304, text="", headers={})
+
+        assert client.get({"values": {}}).value == "foo"
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"foo"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"
+        }
+
+        mock_get.return_value = mocker.MagicMock(status_code=200, text="bar", headers={})
+
+        assert client.get({"values": {}}).value == "bar"
+        assert client.get({"values": {}}).value == "bar"
+        assert mock_get.call_args.kwargs["headers"] == {}
+
+    def test_get_cache_cleared_by_update(self, mocker):
+        from griptape.tools import RestApiClient
+
+        mock_get = mocker.patch(
+            "requests.Session.get", return_value=mocker.MagicMock(status_code=200, text="foo", headers={})
+        )
+        mocker.patch("requests.Session.put", return_value=mocker.MagicMock(text="bar"))
+        client = RestApiClient(base_url="http://www.griptape.ai", description="Griptape website.", get_cache_ttl=60)
+
+        assert client.get({"values": {}}).value == "foo"
+
+        client.put({"values": {"body": {"foo": "bar"}}})
+        mock_get.return_value = mocker.MagicMock(status_code=200, text="bar", headers={})
+
+        assert client.get({"values": {}}).value == "bar"
+        assert mock_get.call_count == 2
+
+    def test_get_cache_skips_uncacheable_responses(self, mocker):
+        from griptape.tools import RestApiClient
+
+        mock_get = mocker.patch("requests.Session.get")
+        client = RestApiClient(base_url="http://www.griptape.ai", description="Griptape website.", get_cache_ttl=60)
+
+        mock_get.return_value = mocker.MagicMock(status_code=500, text="error", headers={})
+        client.get({"values": {}})
+
+        mock_get.return_value = mocker.MagicMock(status_code=200, text="foo", headers={"Cache-Control": "no-store"})
+        client.get({"values": {}})
+        client.get({"values": {}})
+
+        assert mock_get.call_count == 3
+
+    def test_post_uses_session(self, client, mocker):
+        mock_post = mocker.patch("requests.Session.post", return_value=mocker.MagicMock(text="foo"))
+
+        assert client.post({"values": {"body": {"foo": "bar"}}}).value == "foo"
+        assert mock_post.call_args.kwargs == {"data": {"foo": "bar"}, "timeout": 30}
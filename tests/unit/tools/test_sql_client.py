@@ -1,7 +1,13 @@
 import pytest
-from griptape.drivers import SqlDriver
+from griptape.artifacts import CsvRowArtifact, InfoArtifact
+from griptape.drivers import SqlDriver, LocalVectorStoreDriver
+from griptape.engines import VectorQueryEngine, PromptSummaryEngine
 from griptape.loaders import SqlLoader
+from griptape.memory.tool import TextToolMemory
+from griptape.tasks import ActionSubtask
 from griptape.tools import SqlClient
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
 import sqlite3
 
 
@@ -45,4 +51,74 @@ class TestSqlClient:
 
         assert "Can be used to execute sqlite SQL SELECT queries in table test_table" in description
         assert "test_table schema: [('id', INTEGER()), ('name', TEXT()), ('age', INTEGER()), ('city', TEXT())]" in description
-        assert "test_table description: foobar" in description
\ No newline at end of file
+        assert "test_table description: foobar" in description
+    def test_table_schema_cache(self, driver, mocker):
+        spy = mocker.spy(SqlDriver, "get_table_schema")
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="test_table", table_schema_ttl=60)
+
+        client.activity_description(client.execute_query)
+        client.activity_description(client.execute_query)
+
+        assert spy.call_count == 1
+
+        client.clear_table_schema_cache()
+
+        assert client.table_schema.startswith("[('id', INTEGER())")
+        assert spy.call_count == 2
+
+    def test_table_schema_cache_ttl(self, driver, mocker):
+        spy = mocker.spy(SqlDriver, "get_table_schema")
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="test_table", table_schema_ttl=0)
+
+        assert client.table_schema == client.table_schema
+        assert spy.call_count == 2
+
+    def test_execute_query_max_rows(self, driver, caplog):
+        for i in range(9):
+            driver.execute_query(f"INSERT INTO test_table (name, age, city) VALUES ('Bob {i}', {30 + i}, 'Chicago');")
+
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="test_table", page_size=3, max_rows=5)
+        result = client.execute_query({"values": {"sql_query": "SELECT name FROM test_table ORDER BY id;"}})
+
+        assert [row.value["name"] for row in result.value] == ["Alice", "Bob 0", "Bob 1", "Bob 2", "Bob 3"]
+        assert all(isinstance(row, CsvRowArtifact) for row in result.value)
+        assert "truncated to the first 5 rows" in caplog.text
+        assert "Queries return at most 5 rows." in client.activity_description(client.execute_query)
+
+    def test_execute_query_max_rows_not_reached(self, driver, caplog):
+        for i in range(4):
+            driver.execute_query(f"INSERT INTO test_table (name, age, city) VALUES ('Bob {i}', {30 + i}, 'Chicago');")
+
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="test_table", page_size=3, max_rows=5)
+        result = client.execute_query({"values": {"sql_query": "SELECT name FROM test_table ORDER BY id;"}})
+
+        assert [row.value["name"] for row in result.value] == ["Alice", "Bob 0", "Bob 1", "Bob 2", "Bob 3"]
+        assert "truncated" not in caplog.text
+
+    def test_max_inline_rows(self, driver):
+        driver.execute_query("INSERT INTO test_table (name, age, city) VALUES ('Bob', 30, 'Chicago');")
+
+        memory = TextToolMemory(
+            query_engine=VectorQueryEngine(vector_store_driver=LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver()
+            )),
+            summary_engine=PromptSummaryEngine(prompt_driver=MockPromptDriver())
+        )
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=driver),
+            table_name="test_table",
+            max_inline_rows=1,
+            output_memory={"execute_query": [memory]}
+        )
+
+        def execute(query: str):
+            subtask = ActionSubtask(
+                action_name="SqlClient",
+                action_activity="execute_query",
+                action_input={"values": {"sql_query": query}}
+            )
+
+            return client.execute(client.execute_query, subtask)
+
+        assert isinstance(execute("SELECT * FROM test_table LIMIT 1;").value[0], CsvRowArtifact)
+        assert isinstance(execute("SELECT * FROM test_table;"), InfoArtifact)
@@ -18,3 +18,14 @@ class TestWebScraper:
         assert isinstance(scraper.get_author({
             "values": {"url": "https://github.com/griptape-ai/griptape"}
         }), BaseArtifact)
+
+    def test_shared_page_cache(self, scraper, mocker):
+        mock_get = mocker.patch(
+            "requests.Session.get", return_value=mocker.MagicMock(status_code=200, content=b"foobar", headers={})
+        )
+        mocker.patch("trafilatura.extract", return_value='{"text": "foobar", "author": "foo"}')
+        params = {"values": {"url": "https://github.com/griptape-ai/griptape"}}
+
+        assert scraper.get_content(params).value[0].value == "foobar"
+        assert scraper.get_author(params).value == "foo"
+        assert mock_get.call_count == 1
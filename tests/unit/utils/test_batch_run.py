@@ -0,0 +1,141 @@
+import threading
+import pytest
+from griptape.artifacts import ErrorArtifact, ListArtifact
+from griptape.structures import Agent, Pipeline, Workflow
+from griptape.tasks import PromptTask
+from griptape.utils import BatchRun
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def echo(prompt_stack):
+    value = prompt_stack.inputs[-1].content
+
+    if value == "fail":
+        raise Exception("failed")
+
+    return value
+
+
+class TestBatchRun:
+    def test_run_batch(self):
+        agent = Agent(prompt_driver=MockPromptDriver(mock_output=echo), input_template="{{ args[0] }}")
+        batch_run = agent.run_batch([f"input {i}" for i in range(20)], concurrency=4)
+
+        results = list(batch_run)
+
+        assert sorted(result.index for result in results) == list(range(20))
+        assert all(result.output.value == result.input for result in results)
+        assert batch_run.completed_count == 20
+        assert batch_run.failed_count == 0
+        assert batch_run.elapsed_time > 0
+        assert batch_run.throughput > 0
+        assert agent.task.output is None
+        assert agent.memory.runs == []
+
+    def test_run_batch_with_errors(self):
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(mock_output=echo, max_attempts=1))
+        pipeline.add_task(PromptTask("{{ args[0] }}"))
+
+        results = sorted(pipeline.run_batch(["foo", "fail", "bar"]), key=lambda r: r.index)
+
+        assert [result.is_error() for result in results] == [False, True, False]
+        assert isinstance(results[1].output, ErrorArtifact)
+        assert results[2].output.value == "bar"
+
+    def test_run_batch_with_failing_pipeline_middle_task(self):
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(mock_output=echo, max_attempts=1))
+        pipeline.add_tasks(PromptTask("first"), PromptTask("{{ args[0] }}"), PromptTask("last"))
+
+        batch_run = pipeline.run_batch(["foo", "fail"])
+        results = sorted(batch_run, key=lambda r: r.index)
+
+        assert [result.is_error() for result in results] == [False, True]
+        assert results[1].output.value == "failed"
+        assert results[1].structure.tasks[0].output.value == "first"
+        assert results[1].structure.tasks[2].output is None
+        assert batch_run.failed_count == 1
+
+    def test_run_batch_with_failing_workflow_parent_task(self):
+        workflow = Workflow(prompt_driver=MockPromptDriver(mock_output=echo, max_attempts=1))
+        parent = PromptTask("{{ args[0] }}")
+        child = PromptTask("child")
+
+        workflow + [parent, child]
+        parent >> child
+
+        batch_run = workflow.run_batch(["foo", "fail"])
+        results = sorted(batch_run, key=lambda r: r.index)
+
+        assert [result.is_error() for result in results] == [False, True]
+        assert results[1].structure.find_task(child.id).output is None
+        assert batch_run.failed_count == 1
+
+    def test_run_batch_with_exception(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver())
+
+        workflow + [task1, task2]
+        task1.child_ids.append("task2")
+        task2.child_ids.append("task1")
+
+        batch_run = workflow.run_batch(["foo", "bar"])
+        results = list(batch_run)
+
+        assert all(result.is_error() for result in results)
+        assert all(result.structure is None for result in results)
+        assert batch_run.failed_count == 2
+
+    def test_run_batch_with_several_output_tasks(self):
+        workflow = Workflow(prompt_driver=MockPromptDriver(mock_output=echo))
+        workflow.add_tasks(PromptTask("{{ args[0] }}-1"), PromptTask("{{ args[0] }}-2"))
+
+        result = next(iter(workflow.run_batch(["foo"])))
+
+        assert isinstance(result.output, ListArtifact)
+        assert sorted(o.value for o in result.output.value) == ["foo-1", "foo-2"]
+
+    def test_run_batch_back_pressure(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def output(prompt_stack):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+
+            with lock:
+                running.pop()
+
+            return prompt_stack.inputs[-1].content
+
+        read_inputs = []
+
+        def inputs():
+            for i in range(100):
+                read_inputs.append(i)
+
+                yield str(i)
+
+        agent = Agent(prompt_driver=MockPromptDriver(mock_output=output), input_template="{{ args[0] }}")
+        batch_run = agent.run_batch(inputs(), concurrency=2)
+
+        for _ in zip(range(3), batch_run):
+            pass
+
+        assert max(max_running) <= 2
+        assert len(read_inputs) <= 5
+
+    def test_iterate_twice(self):
+        agent = Agent(prompt_driver=MockPromptDriver())
+        batch_run = agent.run_batch(["foo"])
+
+        list(batch_run)
+
+        with pytest.raises(ValueError):
+            list(batch_run)
+
+    def test_concurrency_validation(self):
+        with pytest.raises(ValueError):
+            BatchRun(structure=Agent(prompt_driver=MockPromptDriver()), inputs=[], concurrency=0)
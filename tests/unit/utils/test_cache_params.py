@@ -0,0 +1,45 @@
+from concurrent import futures
+from enum import Enum
+from typing import Optional
+from attr import define, field
+from griptape.utils import fields_to_cache_params
+
+
+class TestCacheParams:
+    class Mode(Enum):
+        FAST = "fast"
+
+    @define
+    class Nested:
+        top_p: float = field(default=0.9, kw_only=True)
+
+        def cache_params(self) -> dict:
+            return fields_to_cache_params(self)
+
+    @define
+    class Config:
+        model: str = field(kw_only=True)
+        stop: list[str] = field(factory=list, kw_only=True)
+        mode: "TestCacheParams.Mode" = field(kw_only=True)
+        nested: "TestCacheParams.Nested" = field(kw_only=True)
+        api_key: Optional[str] = field(default=None, kw_only=True)
+        executor: futures.Executor = field(factory=futures.ThreadPoolExecutor, kw_only=True)
+        _state: dict = field(factory=dict, init=False)
+
+    def test_fields_to_cache_params(self):
+        config = TestCacheParams.Config(
+            model="test-model",
+            stop=["\n"],
+            mode=TestCacheParams.Mode.FAST,
+            nested=TestCacheParams.Nested(),
+            api_key="key"
+        )
+
+        assert fields_to_cache_params(config) == {
+            "type": "Config",
+            "model": "test-model",
+            "stop": ["\n"],
+            "mode": "fast",
+            "nested": {"type": "Nested", "top_p": 0.9}
+        }
+        assert "model" not in fields_to_cache_params(config, exclude={"model"})
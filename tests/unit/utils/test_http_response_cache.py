@@ -0,0 +1,62 @@
+from griptape.utils import HttpResponseCache
+
+
+class TestHttpResponseCache:
+    def test_put_and_get(self):
+        cache = HttpResponseCache(ttl=60)
+        entry = cache.put("foo", None, 200, "content", {"ETag": '"foo"'})
+
+        assert cache.get("foo") is entry
+        assert entry.content == "content"
+        assert entry.etag == '"foo"'
+        assert entry.last_modified is None
+        assert cache.is_fresh(entry)
+        assert cache.get("bar") is None
+
+    def test_put_not_modified(self):
+        cache = HttpResponseCache(ttl=0)
+        entry = cache.put("foo", None, 200, "content", {})
+
+        assert not cache.is_fresh(entry)
+        assert cache.put("foo", entry, 304, "", {}) is entry
+        assert cache.put("bar", None, 304, "", {}) is None
+
+    def test_put_uncacheable(self):
+        cache = HttpResponseCache(ttl=60)
+
+        assert cache.put("foo", None, 500, "error", {}) is None
+        assert cache.put("foo", None, 200, "content", {"Cache-Control": "no-store"}).content == "content"
+        assert cache.get("foo") is None
+
+    def test_conditional_headers(self):
+        cache = HttpResponseCache(ttl=60)
+        entry = cache.put("foo", None, 200, "content", {"ETag": '"foo"', "Last-Modified": "Wed, 21 Oct 2015"})
+
+        assert cache.conditional_headers(None) == {}
+        assert cache.conditional_headers(entry) == {"If-None-Match": '"foo"', "If-Modified-Since": "Wed, 21 Oct 2015"}
+
+    def test_max_size(self):
+        cache = HttpResponseCache(ttl=60, max_size=2)
+
+        cache.put("foo", None, 200, "foo", {})
+        cache.put("bar", None, 200, "bar", {})
+        cache.get("foo")
+        cache.put("baz", None, 200, "baz", {})
+
+        assert cache.get("bar") is None
+        assert cache.get("foo") is not None
+        assert cache.get("baz") is not None
+
+    def test_disabled(self):
+        cache = HttpResponseCache(ttl=60, max_size=0)
+
+        assert cache.put("foo", None, 200, "content", {}) is not None
+        assert cache.get("foo") is None
+
+    def test_clear(self):
+        cache = HttpResponseCache(ttl=60)
+
+        cache.put("foo", None, 200, "content", {})
+        cache.clear()
+
+        assert cache.get("foo") is None
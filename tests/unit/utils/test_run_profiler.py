@@ -0,0 +1,129 @@
+import json
+import time
+from griptape.events import StartTaskEvent, FinishTaskEvent, StartPromptEvent, FinishPromptEvent
+from griptape.structures import Agent, Workflow
+from griptape.tasks import PromptTask
+from griptape.utils import RunProfiler
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tool.tool import MockTool
+
+
+def sleep_output(prompt_stack):
+    # Prompts are "<task ID>:<seconds>".
+    time.sleep(float(prompt_stack.inputs[-1].content.split(":")[1]))
+
+    return "mock output"
+
+
+class TestRunProfiler:
+    def run_workflow(self) -> RunProfiler:
+        profiler = RunProfiler()
+        workflow = Workflow(prompt_driver=MockPromptDriver(mock_output=sleep_output), event_listeners=[profiler])
+        task1 = PromptTask("task1:0.05", id="task1")
+        task2 = PromptTask("task2:0.2", id="task2")
+        task3 = PromptTask("task3:0.01", id="task3")
+        task4 = PromptTask("task4:0.01", id="task4")
+
+        workflow.add_task(task1)
+        task1 >> task2
+        task1 >> task3
+        task2 >> task4
+        task3 >> task4
+
+        workflow.run()
+
+        return profiler
+
+    def test_task_profiles(self):
+        profiler = self.run_workflow()
+        profiles = profiler.task_profiles
+
+        assert set(profiles) == {"task1", "task2", "task3", "task4"}
+        assert profiles["task2"].execution_time >= 0.2
+        assert profiles["task2"].prompt_time >= 0.2
+        assert profiles["task2"].prompt_token_count > 0
+        assert profiles["task2"].completion_token_count > 0
+        assert profiles["task2"].tool_time == 0
+        assert profiles["task1"].task_type == "PromptTask"
+        assert profiles["task4"].queue_wait_time < 0.1
+        assert profiler.max_concurrency == 2
+        assert profiler.elapsed_time >= 0.26
+
+    def test_critical_path(self):
+        profiler = self.run_workflow()
+
+        assert [p.task_id for p in profiler.critical_path()] == ["task1", "task2", "task4"]
+        assert RunProfiler().critical_path() == []
+
+    def test_idle_worker_time(self):
+        profiler = self.run_workflow()
+        busy_time = sum(p.execution_time for p in profiler.task_profiles.values())
+
+        assert profiler.idle_worker_time() > 0.15
+        assert profiler.idle_worker_time(worker_count=4) == 4 * profiler.elapsed_time - busy_time
+
+    def test_tool_time(self):
+        profiler = RunProfiler()
+        outputs = iter([
+            'Action: {"type": "tool", "name": "Tool1", "activity": "test", "input": {"values": {"test": "value"}}}',
+            "Answer: done"
+        ])
+        agent = Agent(
+            prompt_driver=MockPromptDriver(mock_output=lambda _: next(outputs)),
+            tools=[MockTool(name="Tool1")],
+            tool_memory=None,
+            event_listeners=[profiler]
+        )
+
+        agent.run("test")
+
+        profile = profiler.task_profiles[agent.task.id]
+
+        assert profile.tool_time > 0
+        assert profile.prompt_token_count > 0
+        assert [s.name for s in profiler.spans if s.category == "tool"] == ["Tool1.test"]
+
+    def test_to_chrome_trace(self):
+        profiler = self.run_workflow()
+        trace = json.loads(profiler.to_chrome_trace_json())
+        complete_events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        metadata_events = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+
+        assert len([e for e in complete_events if e["cat"] == "task"]) == 4
+        assert len([e for e in complete_events if e["cat"] == "prompt"]) == 4
+        assert all(e["ts"] >= 0 and e["dur"] >= 0 for e in complete_events)
+        assert {e["tid"] for e in complete_events} == {e["tid"] for e in metadata_events}
+
+        task2_event = next(e for e in complete_events if e["name"] == "PromptTask task2")
+
+        assert task2_event["dur"] >= 200_000
+        assert task2_event["args"]["prompt_token_count"] > 0
+
+    def test_nested_prompts(self):
+        profiler = RunProfiler()
+        task = PromptTask("test", id="task")
+
+        profiler(StartTaskEvent(task=task, timestamp=0))
+        profiler(StartPromptEvent(token_count=1, timestamp=1))
+        profiler(StartPromptEvent(token_count=2, timestamp=2))
+        profiler(FinishPromptEvent(token_count=3, timestamp=3))
+        profiler(FinishPromptEvent(token_count=4, timestamp=5))
+        profiler(FinishTaskEvent(task=task, timestamp=6))
+
+        prompt_spans = [(s.start_time, s.end_time) for s in profiler.spans if s.category == "prompt"]
+        profile = profiler.task_profiles["task"]
+
+        assert prompt_spans == [(2, 3), (1, 5)]
+        assert profile.prompt_time == 4
+        assert profile.prompt_token_count == 3
+        assert profile.completion_token_count == 7
+
+    def test_clear(self):
+        profiler = self.run_workflow()
+
+        profiler.clear()
+
+        assert profiler.task_profiles == {}
+        assert profiler.spans == []
+        assert profiler.max_concurrency == 0
+        assert profiler.elapsed_time == 0